@@ -1,7 +1,6 @@
 import numpy
 import random
 from mathutils import Vector, Color
-from .. utils.timing import measureTime
 
 randomNumberCache = []
 cacheSize = int(2e7)
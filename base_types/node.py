@@ -42,6 +42,18 @@ class AnimationNode:
     # can be "NONE", "ALWAYS" or "HIDDEN_ONLY"
     dynamicLabelType = "NONE"
 
+    # nodes that change something outside of the node tree (objects, text blocks, ...)
+    # everything that does not lead to such a node is not executed
+    hasSideEffects = False
+
+    # the outputs only depend on the inputs and the node properties
+    # so they can be computed once when all inputs are constant
+    isPure = False
+
+    # edit() is called for all these nodes whenever their tree changed,
+    # for other nodes only when they or their linked nodes changed
+    editDependsOnNetwork = False
+
     @classmethod
     def poll(cls, nodeTree):
         return nodeTree.bl_idname == "an_AnimationNodeTree"
@@ -53,6 +65,13 @@ class AnimationNode:
     def create(self):
         pass
 
+    def isBlendDataFree(self, nodeByID):
+        '''
+        Nodes that don't access blend data can be executed in worker processes
+        (see process_pool.executeUnitsInParallel). Pure nodes only use their inputs.
+        '''
+        return self.isPure
+
     def edit(self):
         pass
 
@@ -93,6 +112,11 @@ class AnimationNode:
     def getBakeCode(self):
         return []
 
+    # code that works on arrays with the values of all loop iterations
+    # None means that the node can't be used in batched loops (see execution/batch.py)
+    def getBatchExecutionCode(self):
+        return None
+
     def getUsedModules(self):
         return []
 
@@ -384,6 +408,9 @@ class AnimationNode:
     def getLocalBakeCode(self):
         return toString(self.getBakeCode())
 
+    def getLocalBatchExecutionCode(self):
+        return toString(self.getBatchExecutionCode())
+
 
 @eventHandler("SCENE_UPDATE_POST")
 def createMissingIdentifiers(scene = None):
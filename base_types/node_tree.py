@@ -8,7 +8,12 @@ from .. events import treeChanged, isRendering, propertyChanged
 from .. utils.blender_ui import iterActiveScreens, isViewportRendering
 from .. preferences import getBlenderVersion, getAnimationNodesVersion
 from .. tree_info import getNetworksByNodeTree, getSubprogramNetworksByNodeTree
-from .. execution.units import getMainUnitsByNodeTree, setupExecutionUnits, finishExecutionUnits
+from .. execution.trace import recordEvent
+from .. execution.process_pool import executeUnitsInParallel
+from .. execution.sampling import startSamplingExecution, stopSamplingExecution
+from .. preferences import getExecutionCodeType
+from .. execution.units import (getMainUnitsByNodeTree, setupExecutionUnits,
+                               finishExecutionUnits, resetAnimatedExecutionUnits)
 
 
 class LastTreeExecutionInfo(bpy.types.PropertyGroup):
@@ -48,8 +53,12 @@ class AnimationNodeTree(bpy.types.NodeTree):
 
     editNodeLabels = BoolProperty(name = "Edit Node Labels", default = False)
 
+    parallelExecution = BoolProperty(name = "Parallel Execution", default = False,
+        description = ("Calculate the parts of independent networks that don't access blend data "
+                       "in multiple processes. Networks must not read data that other networks in this tree write"))
+
     def update(self):
-        treeChanged()
+        treeChanged(self)
 
     def canAutoExecute(self, events):
         def isAnimationPlaying():
@@ -86,6 +95,7 @@ class AnimationNodeTree(bpy.types.NodeTree):
         self.autoExecution.lastExecutionTimestamp = time.clock()
 
     def execute(self):
+        resetAnimatedExecutionUnits()
         setupExecutionUnits()
         self._execute()
         finishExecutionUnits()
@@ -99,12 +109,21 @@ class AnimationNodeTree(bpy.types.NodeTree):
         allExecutionsSuccessfull = True
 
         start = time.clock()
-        for unit in units:
-            success = unit.execute()
-            if not success:
-                allExecutionsSuccessfull = False
+        startTime = time.perf_counter()
+        startSamplingExecution()
+        if self.parallelExecution:
+            allExecutionsSuccessfull = executeUnitsInParallel(units)
+        else:
+            for unit in units:
+                success = unit.execute()
+                if not success:
+                    allExecutionsSuccessfull = False
+        stopSamplingExecution()
         end = time.clock()
 
+        if getExecutionCodeType() == "TRACE":
+            recordEvent("Execute " + self.name, "frame", startTime, self.name, self.scene.frame_current_final)
+
         if allExecutionsSuccessfull:
             self.lastExecutionInfo.executionTime = end - start
             self.lastExecutionInfo.updateVersions()
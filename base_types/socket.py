@@ -32,6 +32,7 @@ class SocketLoopProperties(bpy.types.PropertyGroup):
 
 class SocketExecutionProperties(bpy.types.PropertyGroup):
     neededCopies = IntProperty(default = 0, min = 0)
+    avoidedCopies = IntProperty(default = 0, min = 0)
 
 class AnimationNodeSocket:
     storable = True
@@ -0,0 +1,161 @@
+'''
+Every benchmark case is a function that gets the input size and returns
+a function without arguments. Only the returned function is measured,
+so the setup of the input data doesn't influence the results.
+'''
+
+import sys
+from mathutils import Vector
+from animation_nodes.algorithms.perlin_noise import perlinNoise
+from animation_nodes.algorithms.mesh_generation.basic_shapes import gridVertices
+from animation_nodes.algorithms.mesh_generation.from_splines import loftSplines
+from animation_nodes.algorithms.mesh_generation.indices_utils import GridMeshIndices
+from animation_nodes.algorithms.interpolation import getInterpolationPreset, sampleInterpolation
+from animation_nodes.data_structures.splines import BezierSpline, PolySpline
+
+casesByName = {}
+
+def benchmark(*sizes):
+    def decorator(function):
+        casesByName[function.__name__] = (function, sizes)
+        return function
+    return decorator
+
+def createPoints(amount, offset = 0):
+    return [Vector((i, (i * 7 % 5) / 2, offset)) for i in range(amount)]
+
+def createBezierSpline(amount, offset = 0):
+    spline = BezierSpline.fromLocations(createPoints(amount, offset))
+    spline.calculateSmoothHandles()
+    spline.update()
+    return spline
+
+def createPolySpline(amount, offset = 0):
+    spline = PolySpline.fromLocations(createPoints(amount, offset))
+    spline.update()
+    return spline
+
+
+
+# Splines
+##########################################
+
+@benchmark(100, 1000, 10000)
+def polySplineSamples(amount):
+    spline = createPolySpline(20)
+    return lambda: spline.getSamples(amount)
+
+@benchmark(100, 1000, 10000)
+def bezierSplineSamples(amount):
+    spline = createBezierSpline(20)
+    return lambda: spline.getSamples(amount)
+
+@benchmark(100, 1000, 5000)
+def bezierUniformConversion(resolution):
+    spline = createBezierSpline(20)
+    return lambda: spline.newUniformConverter(resolution)
+
+@benchmark(100, 1000, 5000)
+def bezierUniformSamples(amount):
+    spline = createBezierSpline(20)
+    spline.ensureUniformConverter(100)
+    return lambda: spline.getUniformSamples(amount, resolution = 100)
+
+
+
+# Mesh Generation
+##########################################
+
+@benchmark(10, 50, 100)
+def loftBezierSplines(amount):
+    splines = [createBezierSpline(10, offset = i) for i in range(4)]
+    return lambda: loftSplines(splines, amount, amount, type = "BEZIER")
+
+@benchmark(10, 100, 300)
+def gridQuadPolygons(divisions):
+    return lambda: GridMeshIndices.quadPolygons(divisions, divisions, joinHorizontal = True, joinVertical = True)
+
+@benchmark(10, 100, 300)
+def gridQuadEdges(divisions):
+    return lambda: GridMeshIndices.innerQuadEdges(divisions, divisions)
+
+@benchmark(10, 100, 300)
+def gridVertexLocations(divisions):
+    return lambda: gridVertices(divisions, divisions)
+
+
+
+# Noise and Interpolation
+##########################################
+
+@benchmark(1000, 10000, 100000)
+def perlinNoiseSamples(amount):
+    def function():
+        return [perlinNoise(i * 0.1, 0.5, 4) for i in range(amount)]
+    return function
+
+@benchmark(1000, 10000, 100000)
+def interpolationSamples(amount):
+    interpolations = [getInterpolationPreset(name) for name in
+        ("LINEAR", "SINUSOIDAL", "CUBIC", "EXPONENTIAL", "CIRCULAR", "BACK", "BOUNCE", "ELASTIC")]
+    def function():
+        return [sampleInterpolation(interpolation, amount) for interpolation in interpolations]
+    return function
+
+
+
+# Tree Info
+##########################################
+
+def createLargeTree(amount):
+    '''
+    Every node is linked with the node before it and with the node at half its index.
+    The tree info needs the replacements of the Blender modules.
+    '''
+    from fakes import setupFakeModules, setNodeTrees, FakeTree
+    if "bpy" not in sys.modules:
+        setupFakeModules()
+
+    tree = FakeTree("Large Tree")
+    nodes = [tree.newNode("Node {}".format(i), ["A", "B"], ["Result"]) for i in range(amount)]
+    for i in range(1, amount):
+        tree.newLink(nodes[i - 1].outputs[0], nodes[i].inputs[0])
+        tree.newLink(nodes[i // 2].outputs[0], nodes[i].inputs[1])
+    setNodeTrees(tree)
+    return tree, nodes
+
+@benchmark(100, 1000, 10000)
+def treeInfoUpdate(amount):
+    createLargeTree(amount)
+    from animation_nodes import tree_info
+    def function():
+        tree_info.treeChanged()
+        tree_info.update()
+    return function
+
+@benchmark(100, 1000, 10000)
+def linkedSocketLookups(amount):
+    tree, nodes = createLargeTree(amount)
+    from animation_nodes import tree_info
+    from animation_nodes.utils.nodes import createNodeByIdDict
+    nodeByID = createNodeByIdDict()
+    def function():
+        # the lookups of the code generation
+        for node in nodes:
+            for socket in node.inputs:
+                tree_info.isSocketLinked(socket, node)
+            for socket in node.outputs:
+                for target in tree_info.iterLinkedSocketsWithInfo(socket, node, nodeByID):
+                    pass
+    return function
+
+@benchmark(100, 1000, 10000)
+def networkFingerprint(amount):
+    createLargeTree(amount)
+    from animation_nodes import tree_info
+    from animation_nodes.utils.nodes import createNodeByIdDict
+    nodeByID = createNodeByIdDict()
+    network, = tree_info.getNetworks()
+    def function():
+        return network.getStructureFingerprint(nodeByID)
+    return function
@@ -0,0 +1,791 @@
+'''
+Every check is a function without arguments that raises
+an exception when the checked behavior is wrong.
+'''
+
+import io
+import os
+import sys
+import time
+import marshal
+import tempfile
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
+from fakes import executionCodeSettings, FakeTree, FakeSocket, setNodeTrees
+from animation_nodes.execution import compile_scripts, code_generator, units, process_pool
+from animation_nodes.tree_info.forest_data import ForestData
+from animation_nodes.tree_info.tree_data import TreeData, Adjacency
+from animation_nodes.utils.nodes import findSocket, createNodeByIdDict
+from animation_nodes import tree_info
+from animation_nodes.data_structures.vector_list import VectorList, isAcceptedByTargets
+
+checksByName = {}
+
+def check(function):
+    checksByName[function.__name__] = function
+    return function
+
+def expectEqual(value, expected):
+    if value != expected:
+        raise AssertionError("{!r} != {!r}".format(value, expected))
+
+def createMainUnits(*trees):
+    setNodeTrees(*trees)
+    units.createExecutionUnits(createNodeByIdDict())
+    return [units.getMainUnitsByNodeTree(tree) for tree in trees]
+
+def executeMainUnits(*trees):
+    units.ensureExecutionUnitsAreSetup()
+    for tree in trees:
+        for unit in units.getMainUnitsByNodeTree(tree):
+            assert unit.execute()
+
+
+
+# Compile Cache
+##########################################
+
+@contextmanager
+def temporaryCodeCache(diskCacheSize = 100):
+    oldGetCacheDirectory = compile_scripts.getCacheDirectory
+    oldDiskCacheSize = executionCodeSettings.diskCacheSize
+    with tempfile.TemporaryDirectory() as directory:
+        compile_scripts.getCacheDirectory = lambda: directory
+        executionCodeSettings.useDiskCache = True
+        executionCodeSettings.diskCacheSize = diskCacheSize
+        compile_scripts.clearCodeCache()
+        compile_scripts._diskCacheSize = None
+        try:
+            yield directory
+        finally:
+            compile_scripts.clearCodeCache()
+            compile_scripts.getCacheDirectory = oldGetCacheDirectory
+            executionCodeSettings.useDiskCache = False
+            executionCodeSettings.diskCacheSize = oldDiskCacheSize
+
+def getCacheFileNames(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".marshal"))
+
+@check
+def scriptDigestDependsOnScriptNameAndVersion():
+    digest = compile_scripts.getScriptDigest("a = 1", "Tree")
+    expectEqual(compile_scripts.getScriptDigest("a = 1", "Tree"), digest)
+    assert compile_scripts.getScriptDigest("a = 2", "Tree") != digest
+    assert compile_scripts.getScriptDigest("a = 1", "Other Tree") != digest
+    # the name and script must not be combinable in two ways
+    assert compile_scripts.getScriptDigest("b", "a") != compile_scripts.getScriptDigest("", "ab")
+
+    oldVersion = sys.version
+    sys.version = oldVersion + " (other build)"
+    try: assert compile_scripts.getScriptDigest("a = 1", "Tree") != digest
+    finally: sys.version = oldVersion
+
+@check
+def compiledScriptsAreLoadedFromTheCaches():
+    statistics = compile_scripts.statistics
+    with temporaryCodeCache():
+        code = compile_scripts.compileScript("a = 1 + 2", "Tree")
+        expectEqual(statistics.misses, 1)
+        expectEqual(len(getCacheFileNames(compile_scripts.getCacheDirectory())), 1)
+
+        assert compile_scripts.compileScript("a = 1 + 2", "Tree") is code
+        expectEqual(statistics.memoryHits, 1)
+
+        compile_scripts.cache.clear()
+        loadedCode = compile_scripts.compileScript("a = 1 + 2", "Tree")
+        expectEqual(statistics.diskHits, 1)
+        expectEqual(loadedCode, code)
+        namespace = {}
+        exec(loadedCode, namespace)
+        expectEqual(namespace["a"], 3)
+
+@check
+def invalidCacheFilesAreRemoved():
+    with temporaryCodeCache() as directory:
+        digest = compile_scripts.getScriptDigest("a = 1", "Tree")
+        path = compile_scripts.getCacheFilePath(digest)
+
+        for data in (b"\0\0\0\0" + marshal.dumps(compile("a = 1", "Tree", "exec")),
+                     compile_scripts.magicNumber + marshal.dumps(42),
+                     compile_scripts.magicNumber + b"\xff"):
+            with open(path, "wb") as f:
+                f.write(data)
+            expectEqual(compile_scripts.loadFromDiskCache(digest), None)
+            assert not os.path.exists(path)
+
+        expectEqual(compile_scripts.loadFromDiskCache(digest), None)
+
+@check
+def diskCacheEvictsLeastRecentlyUsedFiles():
+    codes = [compile("a = {}".format("x" * 400 * i), "Tree", "exec") for i in range(1, 4)]
+    fileSizes = [len(compile_scripts.magicNumber + marshal.dumps(code)) for code in codes]
+
+    # the two largest files don't fit into the cache together
+    maxSize = fileSizes[1] + fileSizes[2] - 1
+    with temporaryCodeCache(diskCacheSize = maxSize / 1024 / 1024) as directory:
+        now = time.time()
+        digests = ["{:040}".format(i) for i in range(3)]
+        for i, (digest, code) in enumerate(zip(digests, codes)):
+            compile_scripts.storeInDiskCache(digest, code)
+            os.utime(compile_scripts.getCacheFilePath(digest), (now - 100 + i, now - 100 + i))
+            if i == 0:
+                # reading a file makes it the most recently used one
+                compile_scripts.loadFromDiskCache(digest)
+
+        expectEqual(getCacheFileNames(directory), [digests[0] + ".marshal", digests[2] + ".marshal"])
+        expectEqual(compile_scripts._diskCacheSize, fileSizes[0] + fileSizes[2])
+        assert compile_scripts._diskCacheSize <= maxSize
+
+
+
+# Vector List
+##########################################
+
+@check
+def vectorListsAreOnlyPassedToAcceptingNodes():
+    tree = FakeTree("Vector List Targets")
+    source = tree.newNode("Source", [], ["Vectors"])
+    accepting = tree.newNode("Accepting", ["Vectors"], [])
+    other = tree.newNode("Other", ["Vectors"], [])
+    accepting.acceptsVectorList = True
+
+    source.outputs[0].dataTargets = []
+    assert not isAcceptedByTargets(source.outputs[0])
+    source.outputs[0].dataTargets = [accepting.inputs[0]]
+    assert isAcceptedByTargets(source.outputs[0])
+    source.outputs[0].dataTargets = [accepting.inputs[0], other.inputs[0]]
+    assert not isAcceptedByTargets(source.outputs[0])
+
+@check
+def cachedVectorListsAreCopiedForModifyingNodes():
+    tree = FakeTree("Vector List")
+    sourceNode = tree.newNode("Source", [], ["Vectors"],
+        code = "Vectors = animation_nodes.data_structures.vector_list.VectorList.fromVectors([(1, 2, 3), (4, 5, 6)])")
+    timeNode = tree.newNode("Time", [], ["Frame"], isPure = False, code = "Frame = self.frame")
+    transformNode = tree.newNode("Transform", ["Vectors", "Frame"], ["Vectors"], isPure = False,
+        innerLinks = [("Vectors", "Vectors")],
+        code = "Vectors.transform([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, Frame], [0, 0, 0, 1]])")
+    outputNode = tree.newNode("Output", ["Vectors"], [], isPure = False, hasSideEffects = True,
+        code = "self.results.append([tuple(vector) for vector in Vectors])")
+    transformNode.inputs[0].dataIsModified = True
+    tree.newLink(sourceNode.outputs[0], transformNode.inputs[0])
+    tree.newLink(timeNode.outputs[0], transformNode.inputs[1])
+    tree.newLink(transformNode.outputs[0], outputNode.inputs[0])
+    outputNode.results = []
+    (unit, ), = createMainUnits(tree)
+
+    try:
+        for frame in (1, 2):
+            timeNode.frame = frame
+            executeMainUnits(tree)
+    finally:
+        units.finishExecutionUnits()
+
+    expectEqual(outputNode.results, [[(1, 2, 4), (4, 5, 7)], [(1, 2, 5), (4, 5, 8)]])
+    cachedVectors, = unit.cachedConstants.values()
+    assert isinstance(cachedVectors, VectorList)
+    expectEqual([tuple(vector) for vector in cachedVectors], [(1, 2, 3), (4, 5, 6)])
+
+
+
+# Dead Node Elimination
+##########################################
+
+@check
+def onlyNodesThatReachSideEffectsAreLive():
+    tree = FakeTree("Dead Nodes")
+    source = tree.newNode("Source", [], ["Value"])
+    used = tree.newNode("Used", ["Value"], ["Value"])
+    output = tree.newNode("Output", ["Value"], ["Value"], isPure = False, hasSideEffects = True)
+    unused = tree.newNode("Unused", ["Value"], ["Value"])
+    viewer = tree.newNode("Viewer", ["Value"], [])
+    tree.newLink(source.outputs[0], used.inputs[0])
+    tree.newLink(used.outputs[0], output.inputs[0])
+    tree.newLink(source.outputs[0], unused.inputs[0])
+    setNodeTrees(tree)
+
+    nodes = [source, used, output, unused, viewer]
+    expectEqual(code_generator.getLiveNodes(nodes), [source, used, output, viewer])
+
+    # e.g. nodes whose outputs are collected by executeFrameRange
+    code_generator.setRequiredNodeIDs([unused.toID()])
+    try: expectEqual(code_generator.getLiveNodes(nodes), nodes)
+    finally: code_generator.setRequiredNodeIDs([])
+
+
+
+# Constant Folding
+##########################################
+
+@check
+def constantNodesOnlyDependOnConstantNodes():
+    tree = FakeTree("Constants")
+    source = tree.newNode("Source", ["Value"], ["Value"])
+    pure = tree.newNode("Pure", ["A", "B"], ["Value"])
+    impure = tree.newNode("Impure", ["Value"], ["Value"], isPure = False)
+    afterImpure = tree.newNode("After Impure", ["Value"], ["Value"])
+    tree.newLink(source.outputs[0], pure.inputs[0])
+    tree.newLink(source.outputs[0], impure.inputs[0])
+    tree.newLink(impure.outputs[0], afterImpure.inputs[0])
+    setNodeTrees(tree)
+
+    constantNodeIDs = code_generator.getConstantNodeIDs([source, pure, impure, afterImpure])
+    expectEqual(constantNodeIDs, {source.toID(), pure.toID()})
+
+def linkConstantOutput(modifyInput):
+    tree = FakeTree("Constant Copies")
+    constant = tree.newNode("Constant", [], ["Value"])
+    passThrough = tree.newNode("Pass Through", ["Value"], ["Value"],
+                               isPure = False, innerLinks = [("Value", "Value")])
+    target = tree.newNode("Target", ["Value"], [], isPure = False)
+    tree.newLink(constant.outputs[0], passThrough.inputs[0])
+    tree.newLink(passThrough.outputs[0], target.inputs[0])
+    target.inputs[0].dataIsModified = modifyInput
+    setNodeTrees(tree)
+
+    nodeByID = {node.toID() : node for node in tree.nodes}
+    variables = {socket : "{}_{}".format(socket.node.name.replace(" ", ""), index)
+                 for node in tree.nodes for index, socket in enumerate(node.inputs[:] + node.outputs[:])}
+    setupLines, executionLines = code_generator.linkConstantOutputSocketsToTargets(
+        constant, variables, nodeByID, {constant.toID()}, {passThrough.toID(), target.toID()})
+    return setupLines, executionLines, variables, passThrough
+
+@check
+def constantsAreCopiedBehindPassThroughNodes():
+    setupLines, executionLines, variables, passThrough = linkConstantOutput(modifyInput = True)
+    expectEqual(setupLines, [])
+    expectEqual(executionLines, ["PassThrough_0 = Constant_0.copy()"])
+    expectEqual(variables[passThrough.inputs[0]], "PassThrough_0")
+
+    setupLines, executionLines, variables, passThrough = linkConstantOutput(modifyInput = False)
+    expectEqual(setupLines + executionLines, [])
+    expectEqual(variables[passThrough.inputs[0]], "Constant_0")
+
+def createSwitchTree():
+    # the modified list is passed on under another variable name
+    tree = FakeTree("Switch")
+    listNode = tree.newNode("List", [], ["List"], code = "List = list(range(5))")
+    timeNode = tree.newNode("Time", [], ["Frame"], isPure = False, code = "Frame = self.frame")
+    switchNode = tree.newNode("Switch", ["Condition", "IfTrue", "IfFalse"], ["Output"],
+                              code = "Output = IfTrue if Condition % 2 else IfFalse")
+    removeNode = tree.newNode("Remove", ["List"], ["List"], innerLinks = [("List", "List")],
+                              code = "del List[Frame % len(List)]")
+    outputNode = tree.newNode("Output", ["Value"], [], isPure = False, hasSideEffects = True,
+                              code = "self.results.append(list(Value))")
+    removeNode.inputs[0].dataIsModified = True
+    removeNode.inputs.append(FakeSocket(removeNode, False, "Frame"))
+    tree.newLink(listNode.outputs[0], switchNode.inputs[1])
+    tree.newLink(listNode.outputs[0], switchNode.inputs[2])
+    tree.newLink(timeNode.outputs[0], switchNode.inputs[0])
+    tree.newLink(timeNode.outputs[0], removeNode.inputs[1])
+    tree.newLink(switchNode.outputs[0], removeNode.inputs[0])
+    tree.newLink(removeNode.outputs[0], outputNode.inputs[0])
+    return tree, timeNode, outputNode
+
+@check
+def cachedConstantsAreNotModifiedByLaterNodes():
+    tree, timeNode, outputNode = createSwitchTree()
+    outputNode.results = []
+    (unit, ), = createMainUnits(tree)
+    try:
+        for frame in range(4):
+            timeNode.frame = frame
+            executeMainUnits(tree)
+    finally:
+        units.finishExecutionUnits()
+
+    expectEqual(outputNode.results, [[1, 2, 3, 4], [0, 2, 3, 4], [0, 1, 3, 4], [0, 1, 2, 4]])
+    expectEqual(list(unit.cachedConstants.values()), [[0, 1, 2, 3, 4]])
+
+
+
+# Unit Reuse
+##########################################
+
+def createSettingTree(name):
+    tree = FakeTree(name)
+    sourceNode = tree.newNode("Source", [], ["Value"], code = "Value = self.amount", settings = {"amount" : 1})
+    outputNode = tree.newNode("Output", ["Value"], [], isPure = False, hasSideEffects = True,
+                              code = "self.results.append(Value)")
+    tree.newLink(sourceNode.outputs[0], outputNode.inputs[0])
+    outputNode.results = []
+    return tree, sourceNode, outputNode
+
+@check
+def unitsOfUnchangedNetworksAreReused():
+    treeA, sourceA, outputA = createSettingTree("Reuse A")
+    treeB, sourceB, outputB = createSettingTree("Reuse B")
+    (unitA, ), (unitB, ) = createMainUnits(treeA, treeB)
+    try:
+        executeMainUnits(treeA, treeB)
+        units.finishExecutionUnits()
+
+        (newUnitA, ), (newUnitB, ) = createMainUnits(treeA, treeB)
+        assert newUnitA is unitA and newUnitB is unitB
+
+        # a new unit does not use the cached constants of the old one
+        sourceB.amount = 2
+        (newUnitA, ), (newUnitB, ) = createMainUnits(treeA, treeB)
+        assert newUnitA is unitA and newUnitB is not unitB
+        executeMainUnits(treeA, treeB)
+        expectEqual((outputA.results, outputB.results), ([1, 1], [1, 2]))
+
+        outputB.inputs[0].dataIsModified = True
+        (newUnitA, ), (newerUnitB, ) = createMainUnits(treeA, treeB)
+        assert newUnitA is unitA and newerUnitB is not newUnitB
+    finally:
+        units.finishExecutionUnits()
+
+
+
+# Cached Constants
+##########################################
+
+@check
+def constantsAreCachedAcrossExecutionsAndSetups():
+    tree = FakeTree("Cached Constants")
+    constantNode = tree.newNode("Constant", [], ["List"], code = "self.calls += 1\nList = [1, 2, 3]")
+    timeNode = tree.newNode("Time", [], ["Frame"], isPure = False, code = "Frame = self.frame")
+    passNode = tree.newNode("Pass", ["Input"], ["Output"], isPure = False, code = "Output = Input")
+    appendNode = tree.newNode("Append", ["List", "Frame"], ["List"], isPure = False,
+                              innerLinks = [("List", "List")], code = "List.append(Frame)")
+    outputNode = tree.newNode("Output", ["Value"], [], isPure = False, hasSideEffects = True,
+                              code = "self.results.append(list(Value))")
+    appendNode.inputs[0].dataIsModified = True
+    tree.newLink(constantNode.outputs[0], passNode.inputs[0])
+    tree.newLink(passNode.outputs[0], appendNode.inputs[0])
+    tree.newLink(timeNode.outputs[0], appendNode.inputs[1])
+    tree.newLink(appendNode.outputs[0], outputNode.inputs[0])
+    constantNode.calls = 0
+    outputNode.results = []
+    createMainUnits(tree)
+
+    try:
+        # the units are set up again e.g. after an undo
+        for frame in range(3):
+            timeNode.frame = frame
+            executeMainUnits(tree)
+            units.finishExecutionUnits()
+        expectEqual(constantNode.calls, 1)
+        expectEqual(outputNode.results, [[1, 2, 3, 0], [1, 2, 3, 1], [1, 2, 3, 2]])
+
+        units.invalidateConstants()
+        executeMainUnits(tree)
+        expectEqual(constantNode.calls, 2)
+        expectEqual(outputNode.results[-1], [1, 2, 3, 2])
+    finally:
+        units.finishExecutionUnits()
+
+
+
+# Copy Scheduling
+##########################################
+
+@check
+def modifyingNodesThatRunLastGetTheOriginal():
+    tree = FakeTree("Copy Scheduling")
+    sourceNode = tree.newNode("Source", [], ["List"], isPure = False, code = "List = [self.frame]")
+    # the modifying node comes first in the tree
+    appendNode = tree.newNode("Append", ["List"], ["List"], isPure = False,
+                              innerLinks = [("List", "List")], code = "List.append(-1)")
+    readerNode = tree.newNode("Reader", ["List"], [], isPure = False, hasSideEffects = True,
+                              code = "self.results.append(list(List))")
+    outputNode = tree.newNode("Output", ["List"], [], isPure = False, hasSideEffects = True,
+                              code = "self.results.append(List)")
+    appendNode.inputs[0].dataIsModified = True
+    tree.newLink(sourceNode.outputs[0], appendNode.inputs[0])
+    tree.newLink(sourceNode.outputs[0], readerNode.inputs[0])
+    tree.newLink(appendNode.outputs[0], outputNode.inputs[0])
+    readerNode.results = []
+    outputNode.results = []
+
+    executionCodeSettings.scheduleCopies = True
+    try:
+        createMainUnits(tree)
+        expectEqual((sourceNode.outputs[0].execution.neededCopies,
+                     sourceNode.outputs[0].execution.avoidedCopies), (0, 1))
+
+        for frame in range(2):
+            sourceNode.frame = frame
+            executeMainUnits(tree)
+        expectEqual(readerNode.results, [[0], [1]])
+        expectEqual(outputNode.results, [[0, -1], [1, -1]])
+    finally:
+        executionCodeSettings.scheduleCopies = False
+        units.finishExecutionUnits()
+
+
+
+# Parallel Networks
+##########################################
+
+def createProcessNetworks(tree, frameCode, amount):
+    '''
+    Independent networks: Time -> Multiply -> Output
+    The multiply nodes return the id of the process they run in.
+    '''
+    timeNodes, outputNodes = [], []
+    for i in range(amount):
+        timeNode = tree.newNode("Time " + str(i), [], ["Frame"], isPure = False, code = frameCode)
+        multiplyNode = tree.newNode("Multiply " + str(i), ["Frame"], ["Value"],
+                                    code = "Value = (self.factor * Frame[0], __import__('os').getpid())")
+        outputNode = tree.newNode("Output " + str(i), ["Value"], [], isPure = False, hasSideEffects = True,
+                                  code = "self.results.append(Value)")
+        tree.newLink(timeNode.outputs[0], multiplyNode.inputs[0])
+        tree.newLink(multiplyNode.outputs[0], outputNode.inputs[0])
+        multiplyNode.factor = i + 1
+        outputNode.results = []
+        timeNodes.append(timeNode)
+        outputNodes.append(outputNode)
+    return timeNodes, outputNodes
+
+@check
+def blendDataFreePhasesRunInWorkerProcesses():
+    tree = FakeTree("Parallel Networks")
+    timeNodes, outputNodes = createProcessNetworks(tree, "Frame = (self.frame, )", amount = 3)
+    mainUnits, = createMainUnits(tree)
+    expectEqual(len(mainUnits), 3)
+    assert all(unit.hasParallelPhase for unit in mainUnits)
+
+    try:
+        units.ensureExecutionUnitsAreSetup()
+        for frame in range(2):
+            for timeNode in timeNodes:
+                timeNode.frame = frame
+            assert process_pool.executeUnitsInParallel(mainUnits)
+
+        for i, outputNode in enumerate(outputNodes):
+            expectEqual([value for value, processID in outputNode.results], [0, i + 1])
+            assert all(processID != os.getpid() for value, processID in outputNode.results)
+    finally:
+        units.finishExecutionUnits()
+
+@check
+def phasesWithBlendDataRunOnTheMainThread():
+    tree = FakeTree("Unpicklable Networks")
+    # functions can't be sent to other processes, just like blend data
+    timeNodes, outputNodes = createProcessNetworks(tree, "Frame = (self.frame, lambda: None)", amount = 2)
+    mainUnits, = createMainUnits(tree)
+
+    try:
+        units.ensureExecutionUnitsAreSetup()
+        for timeNode in timeNodes:
+            timeNode.frame = 3
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            assert process_pool.executeUnitsInParallel(mainUnits)
+
+        expectEqual([outputNode.results for outputNode in outputNodes], [[(3, os.getpid())], [(6, os.getpid())]])
+        assert not any(unit.canSendPhaseData for unit in mainUnits)
+    finally:
+        units.finishExecutionUnits()
+
+
+
+# Parallel Loops
+##########################################
+
+@contextmanager
+def parallelLoops(cpuCount = 2):
+    # this machine could have only one core
+    oldCpuCount = os.cpu_count
+    os.cpu_count = lambda: cpuCount
+    process_pool.finishParallelExecution()
+    try:
+        yield
+    finally:
+        process_pool.finishParallelExecution()
+        os.cpu_count = oldCpuCount
+
+def doubleValues(values, offset):
+    return [value * 2 + offset(value) for value in values]
+
+@check
+def parallelLoopsReturnTheJoinedResults():
+    with parallelLoops():
+        loop = process_pool.ParallelLoop(doubleValues, 1, [("GENERATOR", None)])
+        values = list(range(300))
+        expectEqual(loop(values, abs), [value * 3 for value in values])
+        assert loop.canPickleArguments
+
+        # lambdas can't be sent to other processes, just like blend data
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            expectEqual(loop(values, lambda value: 0), [value * 2 for value in values])
+        assert not loop.canPickleArguments
+
+@check
+def exceptionsInParallelLoopsAreRaised():
+    with parallelLoops():
+        loop = process_pool.ParallelLoop(doubleValues, 1, [("GENERATOR", None)])
+        # a type error that is not caused by pickling
+        try: loop(list(range(300)), None)
+        except TypeError: pass
+        else: raise AssertionError("the exception of the loop body has not been raised")
+        assert loop.canPickleArguments
+
+
+
+# Incremental Tree Info
+##########################################
+
+def createChainTree(name, length):
+    tree = FakeTree(name)
+    nodes = [tree.newNode("Node {}".format(i), ["Value"], ["Value"]) for i in range(length)]
+    for origin, target in zip(nodes, nodes[1:]):
+        tree.newLink(origin.outputs[0], target.inputs[0])
+    return tree
+
+def getForestSummary(forestData):
+    return (forestData.nodes,
+            {idName : nodeIDs for idName, nodeIDs in forestData.nodesByType.items() if len(nodeIDs) > 0},
+            dict(forestData.typeByNode),
+            dict(forestData.nodeByIdentifier),
+            forestData.animationNodes,
+            {name : getSocketIDs(treeData) for name, treeData in forestData.treeDataByName.items()})
+
+def getSocketIDs(treeData):
+    return [treeData.getSocketID(socket) for socket in range(len(treeData.socketIdentifiers))]
+
+def expectSameAsFullUpdate(forestData):
+    fullForestData = ForestData()
+    fullForestData.update()
+    expectEqual(getForestSummary(forestData), getForestSummary(fullForestData))
+
+@check
+def onlyChangedTreesAreAnalysedAgain():
+    treeA, treeB, treeC = createChainTree("A", 3), createChainTree("B", 3), createChainTree("C", 2)
+    setNodeTrees(treeA, treeB, treeC)
+    forestData = ForestData()
+    expectEqual(forestData.update(), {"A", "B", "C"})
+    treeDataB = forestData.treeDataByName["B"]
+
+    expectEqual(forestData.update(set()), set())
+
+    # explicitly marked trees and trees with a different amount of links
+    treeA.nodes[0].outputs[0].dataType = "Float"
+    treeC.newLink(treeC.nodes[0].outputs[0], treeC.nodes[1].inputs[0])
+    expectEqual(forestData.update({"A"}), {"A", "C"})
+    assert forestData.treeDataByName["B"] is treeDataB
+    expectEqual(forestData.getDataType((("A", "Node 0"), True, "Value")), "Float")
+    expectSameAsFullUpdate(forestData)
+
+    # removed and renamed trees
+    treeA.name = "Renamed"
+    setNodeTrees(treeA, treeC)
+    expectEqual(forestData.update(set()), {"A", "B", "Renamed"})
+    expectEqual(forestData.typeByNode.get(("B", "Node 0")), None)
+    expectEqual(forestData.nodes[:3], [("Renamed", "Node 0"), ("Renamed", "Node 1"), ("Renamed", "Node 2")])
+    expectSameAsFullUpdate(forestData)
+
+@check
+def fullUpdatesForgetRemovedTrees():
+    forestData = ForestData()
+    setNodeTrees(createChainTree("Removed", 2), createChainTree("Kept", 2))
+    forestData.update()
+    setNodeTrees(createChainTree("Kept", 2))
+    expectEqual(forestData.update(), {"Removed", "Kept"})
+    expectEqual({network.treeName for network in tree_info.getNetworks()}, {"Kept"})
+
+
+
+# Tree Data
+##########################################
+
+def createRerouteTree():
+    tree = FakeTree("Reroutes")
+    origin = tree.newNode("Origin", ["A"], ["B", "C"])
+    first = tree.newNode("First", ["Input"], ["Output"], bl_idname = "NodeReroute")
+    second = tree.newNode("Second", ["Input"], ["Output"], bl_idname = "NodeReroute")
+    target = tree.newNode("Target", ["D", "E"], [])
+    tree.newLink(origin.outputs[0], first.inputs[0])
+    tree.newLink(first.outputs[0], second.inputs[0])
+    tree.newLink(second.outputs[0], target.inputs[0])
+    tree.newLink(origin.outputs[1], target.inputs[1])
+    tree.newLink(origin.outputs[0], target.inputs[1])
+    return tree
+
+@check
+def adjacencyStoresLinkedSocketsInRows():
+    adjacency = Adjacency([(2, 1), (), (0,), (0,)])
+    expectEqual(list(adjacency.offsets), [0, 2, 2, 3, 4])
+    expectEqual([list(adjacency[i]) for i in range(4)], [[2, 1], [], [0], [0]])
+    expectEqual([adjacency.getAmount(i) for i in range(4)], [2, 0, 1, 1])
+
+@check
+def treeDataInternsNodesAndSockets():
+    treeData = TreeData(createRerouteTree())
+    expectEqual(treeData.nodeIDs, [("Reroutes", name) for name in ("Origin", "First", "Second", "Target")])
+    expectEqual(treeData.nodeTypes, ["an_FakeNode", "NodeReroute", "NodeReroute", "an_FakeNode"])
+    expectEqual(list(treeData.socketStarts), [0, 3, 5, 7, 9])
+    expectEqual(list(treeData.outputStarts), [1, 4, 6, 9])
+    expectEqual(list(treeData.nodeBySocket), [0, 0, 0, 1, 1, 2, 2, 3, 3])
+    expectEqual(treeData.dataTypes, ["Generic"] * 3 + [None] * 4 + ["Generic"] * 2)
+    expectEqual(set(treeData.identifierByNode), {("Reroutes", "Origin"), ("Reroutes", "Target")})
+
+    for index, (nodeID, isOutput, identifier) in enumerate(getSocketIDs(treeData)):
+        node = treeData.nodeIndexByID[nodeID]
+        expectEqual(treeData.findSocket(node, isOutput, identifier), index)
+        expectEqual(treeData.nodeBySocket[index], node)
+    expectEqual(treeData.findSocket(0, True, "Missing"), None)
+    expectEqual([treeData.getSocketPosition(socket) for socket in range(9)], [0, 0, 1, 0, 0, 0, 0, 0, 1])
+    expectEqual(list(treeData.getInputRange(3)), [7, 8])
+    expectEqual(list(treeData.getOutputRange(3)), [])
+
+@check
+def treeDataSkipsRerouteNodes():
+    treeData = TreeData(createRerouteTree())
+    # sockets: Origin A=0, B=1, C=2, First 3-4, Second 5-6, Target D=7, E=8
+    expectEqual([sorted(treeData.linksWithReroutes[socket]) for socket in range(9)],
+                [[], [3, 8], [8], [1], [5], [4], [7], [6], [1, 2]])
+    expectEqual([sorted(treeData.links[socket]) for socket in range(9)],
+                [[], [7, 8], [8], [], [], [], [], [1], [1, 2]])
+    expectEqual([treeData.getReroutePair(socket) for socket in range(3, 7)], [4, 3, 6, 5])
+
+    socketIDs = getSocketIDs(treeData)
+    expectEqual(sorted(treeData.iterDataLinkIDs()),
+                sorted((socketIDs[origin], socketIDs[target], "Generic", "Generic")
+                       for origin, target in ((1, 7), (1, 8), (2, 8))))
+
+@check
+def linkedSocketsAreFoundWithoutSocketIDs():
+    tree = createRerouteTree()
+    tree.newNode("Unlinked", ["F"], [])
+    setNodeTrees(tree)
+    forestData = ForestData()
+    forestData.update()
+
+    treeData = forestData.treeDataByName["Reroutes"]
+    expectEqual(sorted(map(sorted, treeData.getConnectedNodeGroups())),
+                [[("Reroutes", name) for name in ("First", "Origin", "Second", "Target")],
+                 [("Reroutes", "Unlinked")]])
+
+    targetID = ("Reroutes", "Target")
+    expectEqual(sorted(forestData.getLinkedSockets(targetID, False, "E")),
+                [(("Reroutes", "Origin"), "B", 0), (("Reroutes", "Origin"), "C", 1)])
+    expectEqual(forestData.getLinkedSockets(targetID, False, "D", "linksWithReroutes"),
+                [(("Reroutes", "Second"), "Output", 0)])
+    expectEqual(forestData.getLinkedSockets(targetID, False, "Missing"), [])
+    expectEqual(list(forestData.iterSocketLinkStates(("Reroutes", "Unlinked"), False)), [("F", False)])
+    assert forestData.isNodeSocketLinked(targetID, False, "D")
+
+@check
+def rerouteLoopsAreIgnored():
+    tree = FakeTree("Reroute Loop")
+    origin = tree.newNode("Origin", [], ["Value"])
+    first = tree.newNode("First", ["Input"], ["Output"], bl_idname = "NodeReroute")
+    second = tree.newNode("Second", ["Input"], ["Output"], bl_idname = "NodeReroute")
+    tree.newLink(origin.outputs[0], first.inputs[0])
+    tree.newLink(first.outputs[0], second.inputs[0])
+    tree.newLink(second.outputs[0], first.inputs[0])
+    with redirect_stdout(io.StringIO()) as output:
+        treeData = TreeData(tree)
+    assert "Reroute recursion" in output.getvalue()
+    expectEqual(list(treeData.links[0]), [])
+
+
+
+# Socket Lookup
+##########################################
+
+@check
+def socketsAreFoundByTheirIndex():
+    tree = FakeTree("Sockets")
+    node = tree.newNode("Node", ["A", "B", "C"], ["D", "E"])
+    setNodeTrees(tree)
+
+    for sockets in (node.inputs, node.outputs):
+        for index, socket in enumerate(sockets):
+            expectEqual(tree_info.getSocketIndex(socket.toID()), index)
+            assert findSocket(node, socket.toID()) is socket
+    expectEqual(tree_info.getSocketIndex((node.toID(), False, "D")), None)
+    expectEqual(findSocket(node, (node.toID(), False, "D")), None)
+
+    # the index is outdated until the next update
+    node.inputs.reverse()
+    expectEqual(tree_info.getSocketIndex(node.inputs[0].toID()), 2)
+    for socket in node.inputs:
+        assert findSocket(node, socket.toID()) is socket
+
+
+
+# Changed Nodes
+##########################################
+
+@check
+def changedNodesAndTheirLinkedNodesArePopped():
+    tree = FakeTree("Changes")
+    a, b, c, d, e = (tree.newNode(name, ["Value"], ["Value"]) for name in "ABCDE")
+    tree.newLink(a.outputs[0], b.inputs[0])
+    tree.newLink(c.outputs[0], d.inputs[0])
+    tree_info.popChangedNodeIDs()
+    setNodeTrees(tree)
+
+    def popChangedNodeNames():
+        return [nodeID[1] for nodeID in tree_info.popChangedNodeIDs()]
+
+    expectEqual(popChangedNodeNames(), ["A", "B", "C", "D", "E"])
+    expectEqual(popChangedNodeNames(), [])
+
+    tree_info.treeChanged("Changes")
+    tree_info.update()
+    expectEqual(popChangedNodeNames(), [])
+
+    tree.newLink(a.outputs[0], e.inputs[0])
+    tree_info.update()
+    expectEqual(popChangedNodeNames(), ["A", "B", "E"])
+
+    d.inputs[0].dataType = "Float"
+    tree_info.treeChanged("Changes")
+    tree_info.update()
+    expectEqual(popChangedNodeNames(), ["C", "D"])
+
+    tree.removeNode(b)
+    tree_info.update()
+    expectEqual(popChangedNodeNames(), ["A", "E"])
+
+    tree_info.nodeChanged(e.toID())
+    expectEqual(popChangedNodeNames(), ["E"])
+
+
+
+# Link Validation
+##########################################
+
+@check
+def onlyNewOrChangedLinksAreUnchecked():
+    tree = FakeTree("Links")
+    a, b, c, d = (tree.newNode(name, ["Value"], ["Value"]) for name in "ABCD")
+    tree.newLink(a.outputs[0], b.inputs[0])
+    tree.newLink(a.outputs[0], c.inputs[0])
+    setNodeTrees(tree)
+
+    def getUncheckedLinks():
+        return sorted((originID[0][1], targetID[0][1], targetType)
+                      for originID, targetID, originType, targetType in tree_info.getUncheckedDataLinkIDs())
+
+    def update():
+        tree_info.treeChanged("Links")
+        tree_info.update()
+
+    expectEqual(getUncheckedLinks(), [("A", "B", "Generic"), ("A", "C", "Generic")])
+    # trees that have not been analysed again are skipped
+    expectEqual(getUncheckedLinks(), [])
+    tree_info.markDataLinksAsChecked(tree_info.getAllDataLinkIDs())
+
+    update()
+    expectEqual(getUncheckedLinks(), [])
+
+    b.inputs[0].dataType = "Float"
+    update()
+    expectEqual(getUncheckedLinks(), [("A", "B", "Float")])
+    tree_info.markDataLinksAsChecked(tree_info.getAllDataLinkIDs())
+
+    tree.newLink(c.outputs[0], d.inputs[0])
+    update()
+    expectEqual(getUncheckedLinks(), [("C", "D", "Generic")])
+
+    # links that have not been marked stay unchecked
+    update()
+    expectEqual(getUncheckedLinks(), [("C", "D", "Generic")])
+
+    setNodeTrees(FakeTree("Other Links"))
+    tree_info.getUncheckedDataLinkIDs()
+    expectEqual(tree_info._forestData.checkedDataLinksByTree.get("Links"), None)
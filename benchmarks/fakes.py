@@ -0,0 +1,239 @@
+'''
+Replacements for the modules that need Blender and for node trees.
+Only the names that are used by the checked modules are defined.
+'''
+
+import sys
+import types
+import importlib
+from itertools import count
+
+class FakeProblem(Exception):
+    def report(self):
+        raise self
+
+executionCodeSettings = types.SimpleNamespace(
+    useDiskCache = False,
+    diskCacheSize = 100,
+    eliminateDeadNodes = False,
+    foldConstants = True,
+    useBatchLoops = False,
+    scheduleCopies = False)
+
+def setupFakeModules():
+    addModule("bpy",
+        data = types.SimpleNamespace(node_groups = FakeCollection()),
+        types = types.SimpleNamespace(
+            Node = types.SimpleNamespace(bl_rna = types.SimpleNamespace(properties = [])),
+            ID = FakeID,
+            PropertyGroup = FakePropertyGroup))
+    addModule("animation_nodes.utils.timing", measureTime = lambda function: function)
+    addModule("animation_nodes.utils.handlers", eventHandler = lambda event: (lambda function: function))
+    addModule("animation_nodes.problems",
+        canExecute = lambda: True,
+        NodeFailesToCreateExecutionCode = FakeProblem,
+        NodeLinkRecursion = FakeProblem,
+        InvalidSyntax = FakeProblem,
+        ExecutionUnitNotSetup = FakeProblem,
+        ExceptionDuringExecution = FakeProblem,
+        ExceptionDuringCodeCreation = FakeProblem,
+        CouldNotSetupExecutionUnits = FakeProblem)
+    addModule("animation_nodes.preferences",
+        addonName = "animation_nodes",
+        getExecutionCodeType = lambda: "DEFAULT",
+        getExecutionCodeSettings = lambda: executionCodeSettings)
+    addModule("animation_nodes.utils.operators",
+        makeOperator = lambda *args, **kwargs: (lambda function: function))
+    addModule("animation_nodes.execution.sampling",
+        isSampling = lambda: False,
+        registerScript = lambda script, compiledCode: None,
+        updateSampling = lambda enabled: None,
+        removeUnusedScripts = lambda codeObjects: None)
+    addModule("animation_nodes.execution.measurements",
+        getMeasurementsDict = lambda: {},
+        resetMeasurements = lambda: None,
+        updateMemoryTracing = lambda enabled: None,
+        startMemoryMeasurement = lambda: 0,
+        finishMemoryMeasurement = lambda identifier, index: None)
+    addModule("animation_nodes.execution.trace", recordEvent = lambda *args: None)
+    addModule("animation_nodes.execution.bake", insertKeyframe = lambda *args, **kwargs: None)
+    addModule("animation_nodes.execution.cache", clearExecutionCache = lambda: None)
+
+    # the real module is loaded by the generated setup scripts
+    importlib.import_module("animation_nodes.algorithms.random")
+
+def addModule(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+
+    # the generated scripts access the modules as attributes of the addon
+    parentName, _, childName = name.rpartition(".")
+    if parentName != "":
+        setattr(importlib.import_module(parentName), childName, module)
+    return module
+
+def setNodeTrees(*trees):
+    import bpy
+    from animation_nodes import tree_info
+    bpy.data.node_groups[:] = trees
+    tree_info.treeChanged()
+    tree_info.update()
+
+class FakeID:
+    pass
+
+class FakePropertyGroup:
+    pass
+
+
+
+# Node Trees
+##########################################
+
+class FakeCollection(list):
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for item in self:
+                if item.name == key: return item
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+    def get(self, name, default = None):
+        for item in self:
+            if item.name == name: return item
+        return default
+
+class FakeTree:
+    bl_idname = "an_AnimationNodeTree"
+    library = None
+
+    def __init__(self, name):
+        self.name = name
+        self.nodes = FakeCollection()
+        self.links = []
+
+    def as_pointer(self):
+        return id(self)
+
+    def newNode(self, name, inputs = (), outputs = (), **attributes):
+        node = FakeNode(self, name, inputs, outputs, **attributes)
+        self.nodes.append(node)
+        return node
+
+    def newLink(self, fromSocket, toSocket):
+        link = FakeLink(fromSocket, toSocket)
+        self.links.append(link)
+        return link
+
+    def removeNode(self, node):
+        self.links = [link for link in self.links if node not in (link.from_node, link.to_node)]
+        self.nodes.remove(node)
+
+# the variable names in the generated code use the first characters of the identifier
+nodeCounter = count()
+
+class FakeNode:
+    '''
+    The code is the local execution code of the node.
+    It uses the socket identifiers as variable names.
+    '''
+
+    def __init__(self, tree, name, inputs, outputs, bl_idname = "an_FakeNode",
+                 isPure = True, hasSideEffects = False, innerLinks = (), code = "", settings = {}):
+        self.id_data = tree
+        self.name = name
+        self.bl_idname = bl_idname
+        self.identifier = "_{:03}".format(next(nodeCounter))
+        self.isAnimationNode = bl_idname not in ("NodeReroute", "NodeFrame")
+        self.isPure = isPure
+        self.hasSideEffects = hasSideEffects
+        self.innerLinks = list(innerLinks)
+        self.code = code
+        self.inputs = FakeCollection(FakeSocket(self, False, identifier) for identifier in inputs)
+        self.outputs = FakeCollection(FakeSocket(self, True, identifier) for identifier in outputs)
+
+        self.bl_rna = types.SimpleNamespace(properties = [
+            types.SimpleNamespace(identifier = identifier, type = "INT") for identifier in settings])
+        for identifier, value in settings.items():
+            setattr(self, identifier, value)
+
+    @property
+    def nodeTree(self):
+        return self.id_data
+
+    def toID(self):
+        return (self.id_data.name, self.name)
+
+    def isBlendDataFree(self, nodeByID):
+        return self.isPure
+
+    def iterInnerLinks(self):
+        return iter(self.innerLinks)
+
+    def getUsedModules(self):
+        return []
+
+    def getLocalExecutionCode(self):
+        return self.code
+
+    @property
+    def inputVariables(self):
+        return {socket.identifier : socket.identifier for socket in self.inputs}
+
+    @property
+    def outputVariables(self):
+        return {socket.identifier : socket.identifier for socket in self.outputs}
+
+    @property
+    def inputsByIdentifier(self):
+        return {socket.identifier : socket for socket in self.inputs}
+
+    @property
+    def outputsByIdentifier(self):
+        return {socket.identifier : socket for socket in self.outputs}
+
+    @property
+    def linkedOutputs(self):
+        from animation_nodes.tree_info import iterLinkedOutputSockets
+        return list(iterLinkedOutputSockets(self))
+
+    @property
+    def unlinkedInputs(self):
+        from animation_nodes.tree_info import iterUnlinkedInputSockets
+        return list(iterUnlinkedInputSockets(self))
+
+class FakeSocket:
+    def __init__(self, node, isOutput, identifier):
+        self.node = node
+        self.is_output = isOutput
+        self.isInput = not isOutput
+        self.identifier = identifier
+        self.name = identifier
+        self.bl_idname = "an_GenericSocket"
+        self.dataType = "Generic"
+        self.dataIsModified = False
+        self.isUsed = True
+        self.text = ""
+        self.value = None
+        self.execution = types.SimpleNamespace(neededCopies = 0, avoidedCopies = 0)
+        self.loop = types.SimpleNamespace(useAsInput = False, useAsOutput = False, copyAlways = False)
+
+    def toID(self):
+        return (self.node.toID(), self.is_output, self.identifier)
+
+    def getValue(self):
+        return self.value
+
+    def isCopyable(self):
+        return True
+
+    def getCopyExpression(self):
+        return "value.copy()"
+
+class FakeLink:
+    def __init__(self, fromSocket, toSocket):
+        self.from_socket = fromSocket
+        self.to_socket = toSocket
+        self.from_node = fromSocket.node
+        self.to_node = toSocket.node
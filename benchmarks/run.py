@@ -0,0 +1,141 @@
+'''
+Benchmarks for the algorithms and data structures that don't need Blender.
+
+    python benchmarks/run.py                      # compare with the baselines
+    python benchmarks/run.py --update-baselines   # store new baselines
+    python benchmarks/run.py --filter spline --output results.json
+
+Outside of Blender a small mathutils replacement (benchmarks/shim) is used.
+The script exits with status 1 when a case is slower or allocates more
+memory than its baseline allows. Timings depend on the machine, so the
+baselines should be created on the machine that runs the comparison.
+'''
+
+import os
+import sys
+import gc
+import json
+import time
+import types
+import argparse
+import tracemalloc
+
+benchmarksDirectory = os.path.dirname(os.path.abspath(__file__))
+addonDirectory = os.path.dirname(benchmarksDirectory)
+defaultBaselinesPath = os.path.join(benchmarksDirectory, "baselines.json")
+
+def setupImports():
+    try: import mathutils
+    except ImportError: sys.path.insert(0, os.path.join(benchmarksDirectory, "shim"))
+
+    # import the submodules without running the __init__.py of the addon (needs bpy)
+    if "animation_nodes" not in sys.modules:
+        package = types.ModuleType("animation_nodes")
+        package.__path__ = [addonDirectory]
+        sys.modules["animation_nodes"] = package
+
+def main():
+    arguments = parseArguments()
+    setupImports()
+    from cases import casesByName
+
+    results = {}
+    for name, (createFunction, sizes) in sorted(casesByName.items()):
+        if arguments.filter is not None and arguments.filter.lower() not in name.lower(): continue
+        for size in sizes:
+            key = "{}[{}]".format(name, size)
+            function = createFunction(size)
+            results[key] = measure(function, size, arguments.repeat)
+            printResult(key, results[key])
+
+    if arguments.output is not None:
+        writeJson(arguments.output, results)
+
+    if arguments.update_baselines:
+        baselines = readJson(arguments.baselines) if os.path.exists(arguments.baselines) else {}
+        baselines.update(results)
+        writeJson(arguments.baselines, baselines)
+        print("\nBaselines written to {}".format(arguments.baselines))
+        return 0
+
+    if not os.path.exists(arguments.baselines):
+        print("\nNo baselines found at {}".format(arguments.baselines))
+        return 0
+
+    regressions = list(findRegressions(results, readJson(arguments.baselines),
+                                       arguments.time_tolerance, arguments.memory_tolerance))
+    if len(regressions) > 0:
+        print("\nRegressions:")
+        for regression in regressions:
+            print("  " + regression)
+        return 1
+
+    print("\nNo regressions")
+    return 0
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description = "Benchmark the pure Python parts of Animation Nodes")
+    parser.add_argument("--filter", default = None, help = "only run cases whose name contains this text")
+    parser.add_argument("--repeat", type = int, default = 5, help = "the best of this many runs is used")
+    parser.add_argument("--baselines", default = defaultBaselinesPath)
+    parser.add_argument("--update-baselines", action = "store_true")
+    parser.add_argument("--output", default = None, help = "write the results to this JSON file")
+    parser.add_argument("--time-tolerance", type = float, default = 1.5,
+        help = "fail when a case takes longer than baseline * tolerance")
+    parser.add_argument("--memory-tolerance", type = float, default = 1.2,
+        help = "fail when a case allocates more than baseline * tolerance")
+    return parser.parse_args()
+
+
+
+# Measurement
+##########################################
+
+def measure(function, size, repeat):
+    times = []
+    for i in range(max(repeat, 1)):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    bestTime = min(times)
+
+    # separate run because tracing slows down the execution
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        currentSize, peakSize = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"time" : bestTime,
+            "timePerUnit" : bestTime / size,
+            "peakMemory" : peakSize}
+
+def printResult(key, result):
+    print("{:<40} {:>12.3f} ms {:>12.1f} ns/unit {:>12.1f} KB".format(
+        key, result["time"] * 1000, result["timePerUnit"] * 1e9, result["peakMemory"] / 1024))
+
+def findRegressions(results, baselines, timeTolerance, memoryTolerance):
+    for key, result in sorted(results.items()):
+        if key not in baselines: continue
+        baseline = baselines[key]
+        if result["time"] > baseline["time"] * timeTolerance:
+            yield "{}: {:.3f} ms instead of {:.3f} ms".format(
+                key, result["time"] * 1000, baseline["time"] * 1000)
+        # small allocations fluctuate too much to compare them
+        if result["peakMemory"] > max(baseline["peakMemory"] * memoryTolerance, baseline["peakMemory"] + 4096):
+            yield "{}: {:.1f} KB instead of {:.1f} KB peak memory".format(
+                key, result["peakMemory"] / 1024, baseline["peakMemory"] / 1024)
+
+def readJson(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+def writeJson(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent = 4, sort_keys = True)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+'''
+Checks for the parts of the tree analysis and code generation that don't need Blender.
+
+    python benchmarks/run_checks.py
+    python benchmarks/run_checks.py --filter forest
+
+Like the benchmarks they use the mathutils replacement in benchmarks/shim.
+The modules that need bpy are replaced by the fakes in benchmarks/fakes.py.
+The script exits with status 1 when a check fails.
+'''
+
+import sys
+import argparse
+import traceback
+from run import setupImports
+from fakes import setupFakeModules
+
+def main():
+    arguments = parseArguments()
+    setupImports()
+    setupFakeModules()
+    from checks import checksByName
+
+    failedNames = []
+    for name, function in sorted(checksByName.items()):
+        if arguments.filter is not None and arguments.filter.lower() not in name.lower(): continue
+        try:
+            function()
+        except Exception:
+            failedNames.append(name)
+            print("{:<50} failed".format(name))
+            traceback.print_exc()
+        else:
+            print("{:<50} ok".format(name))
+
+    if len(failedNames) > 0:
+        print("\nFailed checks:")
+        for name in failedNames:
+            print("  " + name)
+        return 1
+
+    print("\nAll checks passed")
+    return 0
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description = "Check the pure Python parts of Animation Nodes")
+    parser.add_argument("--filter", default = None, help = "only run checks whose name contains this text")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+import math
+import colorsys
+
+'''
+Small pure Python replacement for the parts of Blenders mathutils
+module that are used by the algorithms and data structures.
+It is only used by the benchmarks when they run outside of Blender.
+'''
+
+class Vector:
+    __slots__ = ("_values", )
+
+    def __init__(self, values = (0, 0, 0)):
+        self._values = [float(value) for value in values]
+
+    def copy(self):
+        return Vector(self._values)
+
+    @property
+    def x(self): return self._values[0]
+    @property
+    def y(self): return self._values[1]
+    @property
+    def z(self): return self._values[2]
+
+    @property
+    def length(self):
+        return math.sqrt(self.length_squared)
+
+    @property
+    def length_squared(self):
+        return sum(value * value for value in self._values)
+
+    def dot(self, other):
+        return sum(a * b for a, b in zip(self._values, other))
+
+    def cross(self, other):
+        ax, ay, az = self._values
+        bx, by, bz = other
+        return Vector((ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx))
+
+    def normalized(self):
+        vector = self.copy()
+        vector.normalize()
+        return vector
+
+    def normalize(self):
+        length = self.length
+        if length > 0:
+            self._values = [value / length for value in self._values]
+
+    def __add__(self, other):
+        return Vector([a + b for a, b in zip(self._values, other)])
+
+    def __sub__(self, other):
+        return Vector([a - b for a, b in zip(self._values, other)])
+
+    def __mul__(self, other):
+        if isinstance(other, Vector): return self.dot(other)
+        return Vector([value * other for value in self._values])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return Vector([value / other for value in self._values])
+
+    def __neg__(self):
+        return Vector([-value for value in self._values])
+
+    def __eq__(self, other):
+        return isinstance(other, Vector) and self._values == other._values
+
+    def __hash__(self):
+        return hash(tuple(self._values))
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __setitem__(self, index, value):
+        self._values[index] = float(value)
+
+    def __repr__(self):
+        return "Vector(({}))".format(", ".join("{:.4f}".format(value) for value in self._values))
+
+
+class Matrix:
+    __slots__ = ("_rows", )
+
+    def __init__(self, rows = None):
+        if rows is None:
+            rows = [[float(i == j) for j in range(4)] for i in range(4)]
+        self._rows = [[float(value) for value in row] for row in rows]
+
+    @classmethod
+    def Identity(cls, size):
+        return cls([[float(i == j) for j in range(size)] for i in range(size)])
+
+    @classmethod
+    def Translation(cls, vector):
+        matrix = cls()
+        for i in range(3):
+            matrix._rows[i][3] = float(vector[i])
+        return matrix
+
+    def copy(self):
+        return Matrix(self._rows)
+
+    def __mul__(self, other):
+        if isinstance(other, Matrix):
+            columns = list(zip(*other._rows))
+            return Matrix([[sum(a * b for a, b in zip(row, column)) for column in columns] for row in self._rows])
+        values = list(other) + [1.0]
+        result = [sum(a * b for a, b in zip(row, values)) for row in self._rows]
+        return Vector(result[:3])
+
+    def __iter__(self):
+        return (Vector(row) for row in self._rows)
+
+    def __getitem__(self, index):
+        return Vector(self._rows[index])
+
+
+class Color:
+    __slots__ = ("r", "g", "b")
+
+    def __init__(self, values = (0, 0, 0)):
+        self.r, self.g, self.b = (float(value) for value in values)
+
+    @property
+    def hsv(self):
+        return colorsys.rgb_to_hsv(self.r, self.g, self.b)
+
+    @hsv.setter
+    def hsv(self, values):
+        self.r, self.g, self.b = colorsys.hsv_to_rgb(*values)
+
+    def __iter__(self):
+        return iter((self.r, self.g, self.b))
+
+
+class Euler:
+    __slots__ = ("_values", "order")
+
+    def __init__(self, values = (0, 0, 0), order = "XYZ"):
+        self._values = [float(value) for value in values]
+        self.order = order
+
+    def copy(self):
+        return Euler(self._values, self.order)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+
+class Quaternion:
+    __slots__ = ("_values", )
+
+    def __init__(self, values = (1, 0, 0, 0)):
+        self._values = [float(value) for value in values]
+
+    def copy(self):
+        return Quaternion(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
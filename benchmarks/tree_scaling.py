@@ -0,0 +1,266 @@
+'''
+Measures how the update and execution times scale with the size of a node tree.
+It has to run inside of Blender with the addon installed:
+
+    blender --background --python benchmarks/tree_scaling.py -- \\
+        --shapes chain fan loop nesting --sizes 10 100 1000 --frames 50 --output scaling.json
+
+Shapes:
+    chain    -  Time Info -> n Math nodes in a row -> Debug
+    fan      -  Time Info -> n Math nodes -> binary tree of Add nodes -> Debug
+    loop     -  loop with a chain of n Math nodes that iterates over 1000 numbers
+    nesting  -  n groups where every group invokes the previous one
+
+For every tree the script measures tree_info.update, update.updateEverything,
+createExecutionUnits (with and without reusable units) and the execution
+per frame. Both updates are incremental, so they are measured after all
+trees have been marked as changed and again when nothing changed. The trees are created in the current file and removed afterwards.
+Other node trees in the file are included in the update times.
+'''
+
+import sys
+import json
+import time
+import argparse
+import statistics
+
+import bpy
+import addon_utils
+
+treeNamePrefix = "Scaling Benchmark - "
+
+def main():
+    arguments = parseArguments()
+    an = enableAddon(arguments.addon)
+
+    results = {
+        "blenderVersion" : bpy.app.version_string,
+        "frames" : arguments.frames,
+        "repeat" : arguments.repeat,
+        "benchmarks" : []}
+
+    for shape in arguments.shapes:
+        for size in arguments.sizes:
+            tree = createTree(an, shape, size)
+            try:
+                result = measureTree(an, tree, arguments.frames, arguments.repeat)
+            finally:
+                removeBenchmarkTrees(an)
+            result.update(shape = shape, size = size)
+            results["benchmarks"].append(result)
+            printResult(result)
+
+    with open(arguments.output, "w") as f:
+        json.dump(results, f, indent = 4)
+    print("\nResults written to {}".format(arguments.output))
+
+def parseArguments():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description = "Measure how Animation Nodes scales with the tree size")
+    parser.add_argument("--addon", default = "animation_nodes", help = "module name of the addon")
+    parser.add_argument("--shapes", nargs = "+", default = ["chain", "fan", "loop", "nesting"],
+                        choices = ["chain", "fan", "loop", "nesting"])
+    parser.add_argument("--sizes", nargs = "+", type = int, default = [10, 100, 500])
+    parser.add_argument("--frames", type = int, default = 50, help = "amount of executed frames")
+    parser.add_argument("--repeat", type = int, default = 3, help = "the best of this many runs is used")
+    parser.add_argument("--output", default = "an_tree_scaling.json")
+    return parser.parse_args(argv)
+
+def enableAddon(moduleName):
+    addon_utils.enable(moduleName, default_set = True)
+    return sys.modules[moduleName]
+
+
+
+# Measurement
+##########################################
+
+def measureTree(an, tree, frames, repeat):
+    from importlib import import_module
+    tree_info = import_module(an.__name__ + ".tree_info")
+    update = import_module(an.__name__ + ".update")
+    units = import_module(an.__name__ + ".execution.units")
+    nodeUtils = import_module(an.__name__ + ".utils.nodes")
+
+    result = {"nodeAmount" : sum(len(nodeTree.nodes) for nodeTree in nodeUtils.getAnimationNodeTrees())}
+    def invalidateEverything():
+        tree_info.treeChanged()
+        units.reset()
+
+    result["treeInfoUpdate"] = bestTime(tree_info.update, repeat, prepare = tree_info.treeChanged)
+    result["treeInfoUpdateUnchanged"] = bestTime(tree_info.update, repeat)
+    result["updateEverything"] = bestTime(update.updateEverything, repeat, prepare = invalidateEverything)
+    result["updateEverythingUnchanged"] = bestTime(update.updateEverything, repeat)
+
+    def createUnits(reuse):
+        nodeByID = nodeUtils.createNodeByIdDict()
+        if not reuse: units.reset()
+        start = time.perf_counter()
+        units.createExecutionUnits(nodeByID)
+        return time.perf_counter() - start
+
+    result["createExecutionUnits"] = min(createUnits(reuse = False) for i in range(repeat))
+    result["createExecutionUnitsReused"] = min(createUnits(reuse = True) for i in range(repeat))
+    result.update(measureFrames(tree, units, frames))
+    return result
+
+def measureFrames(tree, units, frames):
+    scene = bpy.context.scene
+    start = time.perf_counter()
+    units.setupExecutionUnits()
+    setupTime = time.perf_counter() - start
+
+    times = []
+    try:
+        for frame in range(scene.frame_start, scene.frame_start + frames):
+            scene.frame_set(frame)
+            start = time.perf_counter()
+            tree._execute()
+            times.append(time.perf_counter() - start)
+    finally:
+        units.finishExecutionUnits()
+
+    return {
+        "setupExecutionUnits" : setupTime,
+        "frameMean" : statistics.mean(times),
+        "frameMedian" : statistics.median(times),
+        "frameMax" : max(times)}
+
+def bestTime(function, repeat, prepare = None):
+    times = []
+    for i in range(repeat):
+        if prepare is not None: prepare()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def printResult(result):
+    print("{shape:>8} {size:>6} ({nodeAmount:>6} nodes) - tree info: {treeInfoUpdate:.4f} s "
+          "(unchanged: {treeInfoUpdateUnchanged:.4f} s), update: {updateEverything:.4f} s "
+          "(unchanged: {updateEverythingUnchanged:.4f} s), units: {createExecutionUnits:.4f} s "
+          "(reused: {createExecutionUnitsReused:.4f} s), frame: {frameMean:.5f} s "
+          "(max: {frameMax:.5f} s)".format(**result))
+
+
+
+# Tree Creation
+##########################################
+
+def createTree(an, shape, size):
+    tree = newTree(shape)
+    if shape == "chain": createChain(tree, size)
+    elif shape == "fan": createFan(tree, size)
+    elif shape == "loop": createLoop(an, tree, size)
+    elif shape == "nesting": createNesting(an, tree, size)
+    updateTrees(an)
+    return tree
+
+def newTree(name):
+    tree = bpy.data.node_groups.new(treeNamePrefix + name, "an_AnimationNodeTree")
+    # execution is only triggered by the benchmark
+    tree.autoExecution.enabled = False
+    return tree
+
+def createChain(tree, size):
+    frameSocket = newTimeInfo(tree).outputs["Frame"]
+    outputSocket = newMathChain(tree, frameSocket, size)
+    newDebug(tree, outputSocket)
+
+def createFan(tree, size):
+    frameSocket = newTimeInfo(tree).outputs["Frame"]
+    sockets = [newMathChain(tree, frameSocket, 1) for i in range(size)]
+    while len(sockets) > 1:
+        newSockets = []
+        for a, b in zip(sockets[::2], sockets[1::2]):
+            node = newMathNode(tree)
+            link(tree, a, node.inputs[0])
+            link(tree, b, node.inputs[1])
+            newSockets.append(node.outputs[0])
+        if len(sockets) % 2 == 1:
+            newSockets.append(sockets[-1])
+        sockets = newSockets
+    newDebug(tree, sockets[0])
+
+def createLoop(an, tree, size):
+    loopInput = tree.nodes.new("an_LoopInputNode")
+    iteratorSocket = loopInput.newIterator("Float List", "Value")
+    generator = tree.nodes.new("an_LoopGeneratorOutputNode")
+    generator.loopInputIdentifier = loopInput.identifier
+    generator.listDataType = "Float List"
+    link(tree, newMathChain(tree, iteratorSocket, size), generator.inputs[0])
+    updateTrees(an)
+
+    rangeNode = tree.nodes.new("an_FloatRangeListNode")
+    rangeNode.inputs[0].value = 1000
+    invokeNode = newInvokeNode(an, tree, loopInput.identifier)
+    link(tree, rangeNode.outputs[0], invokeNode.inputs[0])
+    newDebug(tree, invokeNode.outputs[0])
+
+def createNesting(an, tree, size):
+    identifier = None
+    for i in range(size):
+        groupInput = tree.nodes.new("an_GroupInputNode")
+        parameterSocket = groupInput.newParameter("Float", "Value")
+        groupOutput = tree.nodes.new("an_GroupOutputNode")
+        groupOutput.groupInputIdentifier = groupInput.identifier
+        returnSocket = groupOutput.newReturn("Float", "Value")
+
+        if identifier is None:
+            valueSocket = parameterSocket
+        else:
+            invokeNode = newInvokeNode(an, tree, identifier)
+            link(tree, parameterSocket, invokeNode.inputs[0])
+            valueSocket = invokeNode.outputs[0]
+        link(tree, newMathChain(tree, valueSocket, 1), returnSocket)
+        updateTrees(an)
+        identifier = groupInput.identifier
+
+    frameSocket = newTimeInfo(tree).outputs["Frame"]
+    invokeNode = newInvokeNode(an, tree, identifier)
+    link(tree, frameSocket, invokeNode.inputs[0])
+    newDebug(tree, invokeNode.outputs[0])
+
+def newInvokeNode(an, tree, identifier):
+    node = tree.nodes.new("an_InvokeSubprogramNode")
+    node.subprogramIdentifier = identifier
+    # creates the sockets of the invoke node
+    updateTrees(an)
+    return node
+
+def newMathChain(tree, inputSocket, length):
+    socket = inputSocket
+    for i in range(length):
+        node = newMathNode(tree)
+        link(tree, socket, node.inputs[0])
+        socket = node.outputs[0]
+    return socket
+
+def newMathNode(tree):
+    node = tree.nodes.new("an_FloatMathNode")
+    node.operation = "ADD"
+    return node
+
+def newTimeInfo(tree):
+    return tree.nodes.new("an_TimeInfoNode")
+
+def newDebug(tree, socket):
+    node = tree.nodes.new("an_DebugNode")
+    link(tree, socket, node.inputs[0])
+    return node
+
+def link(tree, fromSocket, toSocket):
+    tree.links.new(toSocket, fromSocket)
+
+def updateTrees(an):
+    from importlib import import_module
+    import_module(an.__name__ + ".update").updateEverything()
+
+def removeBenchmarkTrees(an):
+    for tree in list(bpy.data.node_groups):
+        if tree.name.startswith(treeNamePrefix):
+            bpy.data.node_groups.remove(tree, do_unlink = True)
+    updateTrees(an)
+
+if __name__ == "__main__":
+    main()
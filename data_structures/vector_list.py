@@ -0,0 +1,127 @@
+import numpy
+from mathutils import Vector
+
+class VectorList:
+    '''
+    Contiguous list of 3D vectors stored in a (N, 3) float32 array.
+    Copying is a single buffer copy; mathutils.Vector objects are only
+    created when single elements are accessed.
+
+    It is not a full list replacement (elements are returned as copies),
+    so nodes only output it when all targets set acceptsVectorList.
+    '''
+    __slots__ = ("data", )
+
+    def __init__(self, length = 0, data = None):
+        if data is None:
+            data = numpy.zeros((length, 3), dtype = "f")
+        self.data = data
+
+    @staticmethod
+    def fromVectors(vectors):
+        if isinstance(vectors, VectorList): return vectors.copy()
+        data = numpy.array([tuple(vector) for vector in vectors], dtype = "f")
+        return VectorList(data = data.reshape((-1, 3)))
+
+    @staticmethod
+    def fromArray(array):
+        data = numpy.ascontiguousarray(array, dtype = "f").reshape((-1, 3))
+        return VectorList(data = data)
+
+    @staticmethod
+    def fromBlenderCollection(collection, attribute = "co"):
+        vectors = VectorList(length = len(collection))
+        collection.foreach_get(attribute, vectors.data.ravel())
+        return vectors
+
+    def writeToBlenderCollection(self, collection, attribute = "co"):
+        collection.foreach_set(attribute, self.data.ravel())
+
+    def copy(self):
+        return VectorList(data = self.data.copy())
+
+    def transform(self, matrix):
+        '''Applies a 4x4 transformation matrix in place'''
+        matrix = numpy.array(matrix, dtype = "f")
+        self.data[:] = numpy.dot(self.data, matrix[:3, :3].T) + matrix[:3, 3]
+
+    def transformed(self, matrix):
+        vectors = self.copy()
+        vectors.transform(matrix)
+        return vectors
+
+    def asNumpyArray(self):
+        return self.data
+
+    def toList(self):
+        return [Vector(row) for row in self.data]
+
+
+    def append(self, vector):
+        self.data = numpy.append(self.data, numpy.array(vector, dtype = "f").reshape((1, 3)), axis = 0)
+
+    def extend(self, vectors):
+        self.data = numpy.append(self.data, toArray(vectors), axis = 0)
+
+    def insert(self, index, vector):
+        self.data = numpy.insert(self.data, index, numpy.array(vector, dtype = "f"), axis = 0)
+
+    def pop(self, index = -1):
+        vector = self[index]
+        del self[index]
+        return vector
+
+    def reverse(self):
+        self.data = self.data[::-1].copy()
+
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return VectorList(data = self.data[key].copy())
+        return Vector(self.data[key])
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice): self.data[key] = toArray(value)
+        else: self.data[key] = value
+
+    def __delitem__(self, key):
+        self.data = numpy.delete(self.data, key, axis = 0)
+
+    def __iter__(self):
+        for row in self.data:
+            yield Vector(row)
+
+    def __reversed__(self):
+        for row in self.data[::-1]:
+            yield Vector(row)
+
+    def __add__(self, other):
+        return VectorList(data = numpy.append(self.data, toArray(other), axis = 0))
+
+    def __radd__(self, other):
+        return VectorList(data = numpy.append(toArray(other), self.data, axis = 0))
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __mul__(self, amount):
+        return VectorList(data = numpy.tile(self.data, (max(amount, 0), 1)))
+
+    def __bool__(self):
+        return len(self.data) > 0
+
+    def __repr__(self):
+        return "<AN Vector List: {} Vectors>".format(len(self.data))
+
+
+def isAcceptedByTargets(socket):
+    targets = socket.dataTargets
+    return len(targets) > 0 and all(getattr(target.node, "acceptsVectorList", False) for target in targets)
+
+def toArray(vectors):
+    if isinstance(vectors, VectorList): return vectors.data
+    return numpy.array([tuple(vector) for vector in vectors], dtype = "f").reshape((-1, 3))
@@ -2,7 +2,8 @@ import bpy
 from . preferences import getExecutionCodeType
 from . ui.problems_panel import drawWarningOverlay
 from . ui.node_editor_hud import drawNodeEditorHud
-from . execution.measurements import drawMeasurementResults
+from . execution.sampling import drawSamplingResults
+from . execution.measurements import drawMeasurementResults, drawMemoryMeasurementResults
 from . nodes.generic.debug_drawer import drawDebugTextBoxes
 from . nodes.interpolation.debug import drawInterpolationPreviews
 
@@ -11,6 +12,10 @@ def drawNodeEditor():
     drawInterpolationPreviews()
     if getExecutionCodeType() == "MEASURE":
         drawMeasurementResults()
+    elif getExecutionCodeType() == "MEMORY":
+        drawMemoryMeasurementResults()
+    elif getExecutionCodeType() == "SAMPLE":
+        drawSamplingResults()
     drawNodeEditorHud()
     drawWarningOverlay()
 
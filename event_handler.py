@@ -3,13 +3,26 @@ import itertools
 from . import problems
 from . update import updateEverything
 from . utils.recursion import noRecursion
-from . tree_info import iterSocketsThatNeedUpdate
+from . tree_info import iterSocketsThatNeedUpdate, treeChanged
 from . utils.nodes import iterNodesInAnimationNodeTrees, getAnimationNodeTrees
-from . execution.units import setupExecutionUnits, finishExecutionUnits
+from . execution.units import (ensureExecutionUnitsAreSetup, executionUnitsAreSetup,
+                               finishExecutionUnits, invalidateConstants, resetAnimatedExecutionUnits)
 from . execution.auto_execution import iterAutoExecutionNodeTrees, executeNodeTrees, afterExecution
 
 @noRecursion
 def update(events):
+    objectAmountChanged = didObjectAmountChange()
+
+    # most scene updates and frame changes don't change the node trees,
+    # the per node work is only done when the units have to be set up again
+    if events.issubset({"Scene", "Frame"}) and not objectAmountChanged:
+        if problems.canAutoExecute() and hasAutoExecutionWork():
+            if failsToWriteToIDClasses():
+                print("Skip event: cannot write to ID classes")
+                return
+            autoExecute(events)
+        return
+
     if failsToWriteToIDClasses():
         print("Skip event: cannot write to ID classes")
         return
@@ -17,15 +30,38 @@ def update(events):
     if didNameChange() or events.intersection({"File", "Addon", "Tree"}):
         updateEverything()
 
+    # frame independent values and the values of unlinked sockets
+    # can only change with the tree or its properties,
+    # removed objects must not be referenced anymore
+    if objectAmountChanged or events.intersection({"File", "Addon", "Tree", "Property"}):
+        invalidateConstants()
+        finishExecutionUnits()
+
     updateProperties()
+    autoExecute(events)
 
+def autoExecute(events):
     if problems.canAutoExecute():
         nodeTrees = list(iterAutoExecutionNodeTrees(events))
         if len(nodeTrees) > 0:
-            setupExecutionUnits()
+            resetAnimatedExecutionUnits()
+            ensureUnitsAreSetup()
             executeNodeTrees(nodeTrees)
             afterExecution()
-            finishExecutionUnits()
+
+def ensureUnitsAreSetup():
+    # renaming does not trigger a tree update, but the setup scripts find nodes by name
+    if not executionUnitsAreSetup() and didNameChange():
+        updateEverything()
+    ensureExecutionUnitsAreSetup()
+
+def hasAutoExecutionWork():
+    # the custom triggers are always updated, see AnimationNodeTree.canAutoExecute
+    for tree in getAnimationNodeTrees():
+        autoExecution = tree.autoExecution
+        if autoExecution.enabled or len(autoExecution.customTriggers.monitorPropertyTriggers) > 0:
+            return True
+    return False
 
 
 def failsToWriteToIDClasses():
@@ -37,6 +73,18 @@ def failsToWriteToIDClasses():
         return False
     except: return True
 
+oldObjectAmount = 0
+
+def didObjectAmountChange():
+    # is_updated is only set when objects changed since the last scene update
+    global oldObjectAmount
+    if not bpy.data.objects.is_updated: return False
+    newAmount = len(bpy.data.objects)
+    if newAmount != oldObjectAmount:
+        oldObjectAmount = newAmount
+        return True
+    return False
+
 oldNamesHash = 0
 
 def didNameChange():
@@ -44,6 +92,8 @@ def didNameChange():
     newHash = getNamesHash()
     if newHash != oldNamesHash:
         oldNamesHash = newHash
+        # the node identifiers in the tree info contain the names
+        treeChanged()
         return True
     return False
 
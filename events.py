@@ -2,6 +2,7 @@ import bpy
 from . import tree_info
 from . import event_handler
 from . utils.handlers import eventHandler
+from . execution.frame_range import isExecutingFrameRange
 
 class EventState:
     def __init__(self):
@@ -40,6 +41,8 @@ def renderFramePre():
     evaluateRaisedEvents()
 
 def evaluateRaisedEvents():
+    # the events are handled after the frame range has been executed
+    if isExecutingFrameRange(): return
     event_handler.update(event.getActives())
     event.reset()
 
@@ -50,6 +53,7 @@ def frameChanged(scene):
 
 def propertyChanged(self = None, context = None):
     event.propertyChanged = True
+    markNodeAsChanged(self)
 
 @eventHandler("FILE_LOAD_POST")
 def fileLoaded():
@@ -71,7 +75,21 @@ def networkChanged(self = None, context = None):
 
 def treeChanged(self = None, context = None):
     event.treeChanged = True
-    tree_info.treeChanged()
+    tree_info.treeChanged(getAnimationNodeTreeName(self))
+    markNodeAsChanged(self)
+
+def markNodeAsChanged(owner):
+    # the edit function of the node has to be called again
+    node = getattr(owner, "node", owner)
+    if isinstance(node, bpy.types.Node) and getAnimationNodeTreeName(node) is not None:
+        tree_info.nodeChanged((node.id_data.name, node.name))
+
+def getAnimationNodeTreeName(owner):
+    # only the tree of a node, socket or tree has to be analysed again
+    tree = getattr(owner, "id_data", None)
+    if getattr(tree, "bl_idname", "") == "an_AnimationNodeTree":
+        return tree.name
+    return None
 
 
 @eventHandler("RENDER_INIT")
@@ -0,0 +1,193 @@
+import bpy
+import numpy
+from collections import defaultdict
+from .. preferences import getPreferences
+from .. utils.nodes import getAnimationNodeTrees
+from . frame_range import executeFrameRange
+
+'''
+In the BAKE execution code type the keyframe_insert calls of the nodes are
+replaced with insertKeyframe (see code_generator.iterNodeBakeLines).
+Outside of bakeFrameRange it just inserts the keyframe. During a bake
+the values are only collected and every F-Curve is written once at the end.
+'''
+
+_recorder = None
+
+def insertKeyframe(owner, data_path, index = -1, frame = None, group = ""):
+    if _recorder is None:
+        kwargs = {"index" : index, "group" : group}
+        if frame is not None: kwargs["frame"] = frame
+        return owner.keyframe_insert(data_path, **kwargs)
+    _recorder.record(owner, data_path, index, frame)
+    return True
+
+def bakeFrameRange(startFrame, endFrame, nodeTrees = None, scene = None):
+    '''
+    Execute the node trees for every frame in the range and
+    write all keyframes that the nodes insert at once.
+    By default all trees with enabled auto execution are baked.
+    Returns the amount of F-Curves that have been written.
+    '''
+    global _recorder
+
+    if nodeTrees is None:
+        nodeTrees = [tree for tree in getAnimationNodeTrees() if tree.autoExecution.enabled]
+    if scene is None: scene = bpy.context.scene
+
+    executionCode = getPreferences().executionCode
+    oldType = executionCode.type
+    executionCode.type = "BAKE"
+
+    _recorder = KeyframeRecorder(scene)
+    try:
+        executeFrameRange(nodeTrees, startFrame, endFrame, scene = scene)
+        recorder = _recorder
+    finally:
+        _recorder = None
+        executionCode.type = oldType
+
+    return recorder.writeFCurves()
+
+class KeyframeRecorder:
+    def __init__(self, scene):
+        self.scene = scene
+        self.idByPointer = {}
+        # (id pointer, data path, index) -> [(frame, value), ...]
+        self.keyframes = defaultdict(list)
+        # (id pointer, data path) -> (owner, local data path, value type)
+        self.propertyByPath = {}
+
+    def record(self, owner, dataPath, index, frame):
+        if frame is None: frame = self.scene.frame_current
+        value = owner.path_resolve(dataPath)
+        try:
+            if hasattr(value, "__len__"):
+                indices = range(len(value)) if index == -1 else [index]
+                values = [(i, value[i]) for i in indices]
+            else:
+                values = [(max(index, 0), value)]
+            floatValues = [(i, float(value)) for i, value in values]
+        except (TypeError, ValueError):
+            # e.g. enum properties, they are keyframed directly
+            owner.keyframe_insert(dataPath, index = index, frame = frame)
+            return
+
+        idData = owner.id_data
+        pointer = idData.as_pointer()
+        self.idByPointer[pointer] = idData
+        fullPath = owner.path_from_id(dataPath)
+        if (pointer, fullPath) not in self.propertyByPath:
+            self.propertyByPath[(pointer, fullPath)] = (owner, dataPath, getValueType(values[0][1]))
+        for i, value in floatValues:
+            self.keyframes[(pointer, fullPath, i)].append((frame, value))
+
+    def writeFCurves(self):
+        for (pointer, dataPath, index), keyframes in self.keyframes.items():
+            idData = self.idByPointer[pointer]
+            owner, localDataPath, valueType = self.propertyByPath[(pointer, dataPath)]
+            fcurve = findFCurve(idData, dataPath, index)
+            if fcurve is None and valueType != "FLOAT":
+                # the flags for discrete and integer values of F-Curves can't be set
+                # from Python, keyframe_insert sets them based on the property type
+                owner.keyframe_insert(localDataPath, index = index, frame = keyframes[0][0])
+                fcurve = findFCurve(idData, dataPath, index)
+            if fcurve is None:
+                fcurve = getOrCreateFCurve(idData, dataPath, index)
+            writeKeyframes(fcurve, keyframes, valueType)
+        return len(self.keyframes)
+
+def getValueType(value):
+    # the Python types of the values correspond to the RNA property types
+    if isinstance(value, bool): return "BOOLEAN"
+    if isinstance(value, int): return "INT"
+    return "FLOAT"
+
+def findFCurve(idData, dataPath, index):
+    animationData = idData.animation_data
+    if animationData is None or animationData.action is None: return None
+    return animationData.action.fcurves.find(dataPath, index)
+
+def getOrCreateFCurve(idData, dataPath, index):
+    animationData = idData.animation_data
+    if animationData is None:
+        animationData = idData.animation_data_create()
+    if animationData.action is None:
+        animationData.action = bpy.data.actions.new(idData.name + "Action")
+
+    fcurves = animationData.action.fcurves
+    fcurve = fcurves.find(dataPath, index)
+    if fcurve is None:
+        fcurve = fcurves.new(dataPath, index)
+    return fcurve
+
+def writeKeyframes(fcurve, keyframes, valueType = "FLOAT"):
+    '''
+    Existing keyframes in the range of the new keyframes are replaced.
+    Like with keyframe_insert, keyframes on the same frame only get the
+    new value and keep their other settings.
+    '''
+    # the last value of a frame wins, like with keyframe_insert
+    valueByFrame = dict(keyframes)
+    frames = numpy.array(sorted(valueByFrame), dtype = "f")
+    values = numpy.array([valueByFrame[frame] for frame in sorted(valueByFrame)], dtype = "f")
+
+    points = fcurve.keyframe_points
+    oldAmount = len(points)
+    coordinates, leftHandles, rightHandles = getPointVectors(points, ("co", "handle_left", "handle_right"))
+
+    inRange = numpy.flatnonzero((coordinates[:, 0] >= frames[0]) & (coordinates[:, 0] <= frames[-1]))
+    framePositions = numpy.searchsorted(frames, coordinates[inRange, 0])
+    isReplaced = frames[numpy.minimum(framePositions, len(frames) - 1)] == coordinates[inRange, 0]
+    replacedIndices, replacedPositions = inRange[isReplaced], framePositions[isReplaced]
+    removedIndices = inRange[~isReplaced]
+
+    # the handles move with the keyframes they belong to
+    offsets = values[replacedPositions] - coordinates[replacedIndices, 1]
+    for vectors in (coordinates, leftHandles, rightHandles):
+        vectors[replacedIndices, 1] += offsets
+
+    isNewFrame = numpy.ones(len(frames), dtype = bool)
+    isNewFrame[replacedPositions] = False
+    newCoordinates = numpy.stack((frames[isNewFrame], values[isNewFrame]), axis = 1)
+    newAmount = len(newCoordinates)
+
+    # removed keyframes are sorted to the end, only removing the last point is fast
+    if len(removedIndices) > 0:
+        lastFrame = max(coordinates[:, 0].max(), frames[-1])
+        coordinates[removedIndices, 0] = lastFrame + 1 + numpy.arange(len(removedIndices))
+
+    points.add(newAmount)
+    setPointVectors(points, "co", numpy.concatenate((coordinates, newCoordinates)))
+    setPointVectors(points, "handle_left", numpy.concatenate((leftHandles, newCoordinates)))
+    setPointVectors(points, "handle_right", numpy.concatenate((rightHandles, newCoordinates)))
+
+    # keyframe_points.add does not use the preferences and property type like keyframe_insert
+    interpolation = getNewInterpolation(valueType)
+    if interpolation != "BEZIER":
+        for point in points[oldAmount:]:
+            point.interpolation = interpolation
+
+    fcurve.update()
+    for i in range(len(removedIndices)):
+        points.remove(points[-1], fast = True)
+    if len(removedIndices) > 0:
+        fcurve.update()
+
+def getNewInterpolation(valueType):
+    # the same rules as in insert_vert_fcurve of Blender
+    if valueType == "BOOLEAN": return "CONSTANT"
+    interpolation = bpy.context.user_preferences.edit.keyframe_new_interpolation_type
+    if valueType == "INT" and interpolation == "BEZIER": return "LINEAR"
+    return interpolation
+
+def getPointVectors(points, attributes):
+    vectorsList = []
+    for attribute in attributes:
+        vectors = numpy.empty(len(points) * 2, dtype = "f")
+        points.foreach_get(attribute, vectors)
+        vectorsList.append(vectors.reshape(-1, 2))
+    return vectorsList
+
+def setPointVectors(points, attribute, vectors):
+    points.foreach_set(attribute, numpy.ascontiguousarray(vectors, dtype = "f").ravel())
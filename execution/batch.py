@@ -0,0 +1,94 @@
+import numpy
+from mathutils import Matrix
+from .. data_structures.vector_list import VectorList
+
+'''
+In batch execution every socket value is a numpy array that
+contains the values of all loop iterations along the first axis:
+
+    Float, Integer, Boolean  ->  (n, )
+    Vector                   ->  (n, 3)
+    Matrix                   ->  (n, 4, 4)
+
+Nodes that support this mode implement getBatchExecutionCode.
+It must not modify its inputs in place.
+'''
+
+dataTypeInfo = {
+    "Float" :   ("d", ()),
+    "Integer" : ("i8", ()),
+    "Boolean" : ("?", ()),
+    "Vector" :  ("f", (3, )),
+    "Matrix" :  ("f", (4, 4)) }
+
+batchDataTypes = set(dataTypeInfo.keys())
+
+def isBatchDataType(dataType):
+    return dataType in batchDataTypes
+
+
+# Conversion
+##########################################
+
+def toBatchArray(value, dataType, amount):
+    '''Repeat a single value for every iteration'''
+    dtype, shape = dataTypeInfo[dataType]
+    array = numpy.empty((amount, ) + shape, dtype = dtype)
+    array[:] = numpy.array(value, dtype = dtype)
+    return array
+
+def listToBatchArray(values, dataType, amount):
+    dtype, shape = dataTypeInfo[dataType]
+    if isinstance(values, VectorList):
+        return values.data[:amount].astype(dtype)
+    if len(values) == 0:
+        return numpy.empty((0, ) + shape, dtype = dtype)
+    return numpy.array([tuple(value) if shape else value for value in values[:amount]],
+                       dtype = dtype).reshape((-1, ) + shape)
+
+def fromBatchArray(array, listDataType, condition = True):
+    if isinstance(condition, numpy.ndarray):
+        array = array[condition]
+    elif not condition:
+        array = array[:0]
+
+    if listDataType == "Vector List":
+        return VectorList.fromArray(array).toList()
+    if listDataType == "Matrix List":
+        return [Matrix(matrix) for matrix in array]
+    return array.tolist()
+
+
+# Vectorized Operations
+##########################################
+
+def combineVectors(x, y, z):
+    return numpy.stack((x, y, z), axis = -1).astype("f")
+
+def transformVectors(matrices, vectors):
+    return numpy.einsum("nij,nj->ni", matrices[:, :3, :3], vectors) + matrices[:, :3, 3]
+
+def translationMatrices(translations):
+    matrices = identityMatrices(len(translations))
+    matrices[:, :3, 3] = translations
+    return matrices
+
+def scaleMatrices(scales):
+    matrices = identityMatrices(len(scales))
+    matrices[:, 0, 0] = scales[:, 0]
+    matrices[:, 1, 1] = scales[:, 1]
+    matrices[:, 2, 2] = scales[:, 2]
+    return matrices
+
+def identityMatrices(amount):
+    return numpy.tile(numpy.identity(4, dtype = "f"), (amount, 1, 1))
+
+def normalizeVectors(vectors):
+    lengths = numpy.linalg.norm(vectors, axis = 1)
+    lengths[lengths == 0] = 1
+    return vectors / lengths[:, None]
+
+def divide(a, b):
+    result = numpy.zeros(numpy.broadcast(a, b).shape)
+    numpy.divide(a, b, out = result, where = b != 0)
+    return result
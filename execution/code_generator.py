@@ -2,9 +2,201 @@ import re
 import traceback
 from itertools import chain
 from functools import lru_cache
+from collections import defaultdict
 from .. problems import NodeFailesToCreateExecutionCode
 from .. preferences import addonName, getExecutionCodeType
-from .. tree_info import iterLinkedSocketsWithInfo, isSocketLinked
+from .. tree_info import (iterLinkedSocketsWithInfo, iterLinkedSocketsWithNodeIDs,
+                          isSocketLinked, iterOriginNodeIDs, iterTargetNodeIDs)
+
+
+
+# Dead Node Elimination
+##########################################
+
+# nodes whose outputs are read from outside of the generated code (see frame_range)
+requiredNodeIDs = set()
+
+def setRequiredNodeIDs(nodeIDs):
+    requiredNodeIDs.clear()
+    requiredNodeIDs.update(nodeIDs)
+
+def getLiveNodes(nodes):
+    '''
+    Only keep nodes that (indirectly) pass their data to a node with side effects.
+    The order of the nodes is not changed.
+    '''
+    nodeIDs = [node.toID() for node in nodes]
+    liveNodeIDs = set()
+    uncheckedNodeIDs = [nodeID for node, nodeID in zip(nodes, nodeIDs)
+                        if isEffectfulNode(node) or nodeID in requiredNodeIDs]
+    while uncheckedNodeIDs:
+        nodeID = uncheckedNodeIDs.pop()
+        if nodeID in liveNodeIDs: continue
+        liveNodeIDs.add(nodeID)
+        uncheckedNodeIDs.extend(iterOriginNodeIDs(nodeID))
+    return [node for node, nodeID in zip(nodes, nodeIDs) if nodeID in liveNodeIDs]
+
+def isEffectfulNode(node):
+    # a node without outputs can only be useful because of its side effects
+    return node.hasSideEffects or len(node.outputs) == 0
+
+
+
+# Constant Folding
+##########################################
+
+def getConstantNodeIDs(nodes):
+    '''
+    Pure nodes whose inputs are unlinked or only linked to other constant nodes.
+    The nodes have to be sorted topologically.
+    '''
+    constantNodeIDs = set()
+    for node in nodes:
+        if not node.isPure: continue
+        nodeID = node.toID()
+        if all(originID in constantNodeIDs for originID in iterOriginNodeIDs(nodeID)):
+            constantNodeIDs.add(nodeID)
+    return constantNodeIDs
+
+def linkConstantOutputSocketsToTargets(node, variables, nodeByID, constantNodeIDs, otherNodeIDs):
+    '''
+    Returns the lines for the setup script and the lines that
+    have to run at the beginning of every execution.
+    '''
+    nodeIDs = constantNodeIDs | otherNodeIDs
+    setupLines = []
+    executionLines = []
+    for socket in node.linkedOutputs:
+        otherTargets = tuple(iterLinkedSocketsWithInfo(socket, node, nodeByID, otherNodeIDs))
+        if len(otherTargets) == 0:
+            setupLines.extend(linkSocketToTargets(socket, node, variables, nodeByID, constantNodeIDs))
+            continue
+
+        # the value has to stay unchanged for all following executions
+        constantTargets = tuple(iterLinkedSocketsWithInfo(socket, node, nodeByID, constantNodeIDs))
+        copyable = socket.isCopyable()
+        neededCopies = 0
+        for lines, targets in ((setupLines, constantTargets), (executionLines, otherTargets)):
+            for target in targets:
+                if copyable and canBeModifiedByTargets(target, nodeByID, nodeIDs):
+                    lines.append(getCopyLine(socket, variables[target], variables))
+                    neededCopies += 1
+                else:
+                    variables[target] = variables[socket]
+        socket.execution.neededCopies = neededCopies
+
+    return setupLines, executionLines
+
+def canBeModifiedByTargets(socket, nodeByID, nodeIDs):
+    '''
+    True when the input or a linked input of any node that depends on it
+    modifies its data. Nodes can pass an input on under another variable
+    name (e.g. Switch), so every following node has to be checked.
+    '''
+    if socket.dataIsModified: return True
+    checkedNodeIDs = set()
+    uncheckedNodeIDs = list(iterTargetNodeIDs(socket.node.toID()))
+    while uncheckedNodeIDs:
+        nodeID = uncheckedNodeIDs.pop()
+        if nodeID in checkedNodeIDs or nodeID not in nodeIDs: continue
+        checkedNodeIDs.add(nodeID)
+        node = nodeByID[nodeID]
+        for input in node.inputs:
+            if input.dataIsModified and isSocketLinked(input, node): return True
+        uncheckedNodeIDs.extend(iterTargetNodeIDs(nodeID))
+    return False
+
+
+
+# Copy Scheduling
+##########################################
+
+def findOwningTargets(nodes, nodeByID, nodeIDs):
+    '''
+    A value that is read by some nodes and modified by others doesn't have to be
+    copied for one of the modifying nodes if it is executed after all nodes that
+    can see the value. Returns the owning target for each output socket and the
+    dependencies that make sure that the owners are executed last.
+    '''
+    ownerBySocket = {}
+    extraDependencies = defaultdict(set)
+    extraTargets = defaultdict(set)
+
+    def getDescendantIDs(startIDs):
+        foundIDs = set()
+        uncheckedIDs = list(startIDs)
+        while uncheckedIDs:
+            nodeID = uncheckedIDs.pop()
+            if nodeID in foundIDs or nodeID not in nodeIDs: continue
+            foundIDs.add(nodeID)
+            uncheckedIDs.extend(iterTargetNodeIDs(nodeID))
+            uncheckedIDs.extend(extraTargets[nodeID])
+        return foundIDs
+
+    for node in nodes:
+        for socket in node.linkedOutputs:
+            if not socket.isCopyable() or socket.loop.copyAlways: continue
+            targets = tuple(iterLinkedSocketsWithNodeIDs(socket, node, nodeByID, nodeIDs))
+            readerIDs = [nodeID for target, nodeID in targets if not target.dataIsModified]
+            modifiers = [(target, nodeID) for target, nodeID in targets if target.dataIsModified]
+            if len(readerIDs) == 0 or len(modifiers) == 0: continue
+
+            # the value can be seen by the readers and everything that depends on them
+            seeingIDs = getDescendantIDs(readerIDs)
+            for target, ownerID in modifiers:
+                if ownerID in seeingIDs: continue
+                if not getDescendantIDs([ownerID]).isdisjoint(seeingIDs): continue
+                ownerBySocket[socket] = target
+                extraDependencies[ownerID].update(seeingIDs)
+                for nodeID in seeingIDs:
+                    extraTargets[nodeID].add(ownerID)
+                break
+
+    return ownerBySocket, dict(extraDependencies)
+
+
+
+# Execution Phases
+##########################################
+
+# the nodes in these subprograms are generated by the execution units
+subprogramSystemNodes = {"an_GroupInputNode", "an_GroupOutputNode", "an_LoopInputNode",
+                         "an_LoopGeneratorOutputNode", "an_ReassignLoopParameterNode", "an_LoopBreakNode"}
+
+def splitIntoExecutionPhases(nodes, nodeByID, extraDependencies = {}):
+    '''
+    Split the sorted nodes into three lists that are executed after each other:
+        1. nodes that access blend data and don't depend on the second phase
+        2. nodes without blend data access that only depend on the first two phases
+        3. all other nodes
+    The second phases of different networks can run in worker processes at the same time.
+    '''
+    phases = ([], [], [])
+    phaseByNodeID = {}
+    for node in nodes:
+        nodeID = node.toID()
+        originIDs = chain(iterOriginNodeIDs(nodeID), extraDependencies.get(nodeID, ()))
+        originPhase = max((phaseByNodeID.get(originID, 0) for originID in originIDs), default = 0)
+        if node.isBlendDataFree(nodeByID): phase = max(originPhase, 1)
+        else: phase = 0 if originPhase == 0 else 2
+        phaseByNodeID[nodeID] = phase
+        phases[phase].append(node)
+    return phases
+
+def isBlendDataFreeSubprogram(network, nodeByID, invokedIdentifiers = frozenset()):
+    '''
+    Groups and loops can be invoked in a worker process when all their nodes
+    could be executed there. Script nodes can run any code.
+    '''
+    if network.type not in ("Group", "Loop"): return False
+    if network.identifier in invokedIdentifiers: return False
+    invokedIdentifiers = invokedIdentifiers | {network.identifier}
+    for node in network.getAnimationNodes(nodeByID):
+        if node.bl_idname in subprogramSystemNodes: continue
+        if node.bl_idname == "an_InvokeSubprogramNode":
+            if not node.isBlendDataFree(nodeByID, invokedIdentifiers): return False
+        elif not node.isBlendDataFree(nodeByID): return False
+    return True
 
 
 
@@ -26,10 +218,22 @@ def getInitialVariables(nodes):
 # Setup Code
 ##########################################
 
+def getOutputSocketVariables(nodes, variables):
+    socketVariables = {}
+    for node in nodes:
+        nodeID = node.toID()
+        for socket in node.outputs:
+            if socket in variables:
+                socketVariables[(nodeID, True, socket.identifier)] = variables[socket]
+    return socketVariables
+
 def iterSetupCodeLines(nodes, variables):
     yield from iter_Imports(nodes)
     yield get_LoadRandomNumberCache()
     yield get_LoadMeasurementsDict()
+    yield get_LoadMemoryMeasurementFunctions()
+    yield get_LoadTraceFunctions()
+    yield get_LoadBakeFunctions()
     yield from iter_GetNodeReferences(nodes)
     yield from iter_GetSocketValues(nodes, variables)
 
@@ -57,6 +261,16 @@ def get_LoadRandomNumberCache():
 def get_LoadMeasurementsDict():
     return "_node_execution_times = animation_nodes.execution.measurements.getMeasurementsDict()"
 
+def get_LoadBakeFunctions():
+    return "_insert_keyframe = animation_nodes.execution.bake.insertKeyframe"
+
+def get_LoadTraceFunctions():
+    return "_record_trace_event = animation_nodes.execution.trace.recordEvent"
+
+def get_LoadMemoryMeasurementFunctions():
+    return ("_start_memory_measurement = animation_nodes.execution.measurements.startMemoryMeasurement\n"
+            "_finish_memory_measurement = animation_nodes.execution.measurements.finishMemoryMeasurement")
+
 def iter_GetNodeReferences(nodes):
     yield "nodes = bpy.data.node_groups[{}].nodes".format(repr(nodes[0].nodeTree.name))
     for node in nodes:
@@ -98,12 +312,16 @@ def iterUnlinkedSockets(nodes):
 
 def getFunction_IterNodeExecutionLines():
     mode = getExecutionCodeType()
-    if mode == "DEFAULT":
+    if mode in ("DEFAULT", "SAMPLE"):
         return iterNodeExecutionLines_Basic
     elif mode == "MONITOR":
         return iterNodeExecutionLines_Monitored
     elif mode == "MEASURE":
         return iterNodeExecutionLines_MeasureTimes
+    elif mode == "MEMORY":
+        return iterNodeExecutionLines_MeasureMemory
+    elif mode == "TRACE":
+        return iterNodeExecutionLines_Trace
     elif mode == "BAKE":
         return iterNodeExecutionLines_Bake
 
@@ -140,6 +358,26 @@ def iterNodeExecutionLines_MeasureTimes(node, variables):
     except:
         handleExecutionCodeCreationException(node)
 
+def iterNodeExecutionLines_MeasureMemory(node, variables):
+    yield from setupNodeForExecution(node, variables)
+    try:
+        yield "_memory_measurement = _start_memory_measurement()"
+        yield from iterRealNodeExecutionLines(node, variables)
+        yield "_finish_memory_measurement({}, _memory_measurement)".format(repr(node.identifier))
+    except:
+        handleExecutionCodeCreationException(node)
+
+def iterNodeExecutionLines_Trace(node, variables):
+    yield from setupNodeForExecution(node, variables)
+    category = "subprogram" if node.bl_idname == "an_InvokeSubprogramNode" else "node"
+    try:
+        yield "_trace_start_time = getCurrentTime()"
+        yield from iterRealNodeExecutionLines(node, variables)
+        yield "_record_trace_event({}, {}, _trace_start_time, {})".format(
+            repr(node.name), repr(category), repr(node.nodeTree.name))
+    except:
+        handleExecutionCodeCreationException(node)
+
 def iterNodeExecutionLines_Bake(node, variables):
     yield from setupNodeForExecution(node, variables)
     try:
@@ -148,6 +386,17 @@ def iterNodeExecutionLines_Bake(node, variables):
     except:
         handleExecutionCodeCreationException(node)
 
+def iterNodeBatchExecutionLines(node, variables):
+    yield ""
+    yield getNodeCommentLine(node)
+    resolveInnerLinks(node, variables)
+    try:
+        localCode = node.getLocalBatchExecutionCode()
+        globalCode = makeGlobalExecutionCode(localCode, node, variables)
+        yield from globalCode.splitlines()
+    except:
+        handleExecutionCodeCreationException(node)
+
 def setupNodeForExecution(node, variables):
     yield from iterNodePreExecutionLines(node, variables)
     resolveInnerLinks(node, variables)
@@ -177,6 +426,8 @@ def iterRealNodeExecutionLines(node, variables):
 def iterNodeBakeLines(node, variables):
     localCode = node.getLocalBakeCode()
     globalCode = makeGlobalExecutionCode(localCode, node, variables)
+    # allows collecting the keyframes of all frames before they are written (see execution.bake)
+    globalCode = re.sub(r"([\w\.]+)\.keyframe_insert\(", r"_insert_keyframe(\1, ", globalCode)
     yield from globalCode.splitlines()
 
 def makeGlobalExecutionCode(localCode, node, variables):
@@ -211,14 +462,20 @@ def resolveInnerLinks(node, variables):
     for inputName, outputName in node.iterInnerLinks():
         variables[outputs[outputName]] = variables[inputs[inputName]]
 
-def linkOutputSocketsToTargets(node, variables, nodeByID):
+def linkOutputSocketsToTargets(node, variables, nodeByID, nodeIDs = None, ownerBySocket = {}):
     for socket in node.linkedOutputs:
-        yield from linkSocketToTargets(socket, node, variables, nodeByID)
+        yield from linkSocketToTargets(socket, node, variables, nodeByID, nodeIDs, ownerBySocket.get(socket))
 
-def linkSocketToTargets(socket, node, variables, nodeByID):
-    targets = tuple(iterLinkedSocketsWithInfo(socket, node, nodeByID))
+def linkSocketToTargets(socket, node, variables, nodeByID, nodeIDs = None, owner = None):
+    targets = tuple(iterLinkedSocketsWithInfo(socket, node, nodeByID, nodeIDs))
     needACopy = getTargetsThatNeedACopy(socket, targets)
+    # the owner is executed after all other nodes that can see the value (see findOwningTargets)
+    avoidedCopies = 0
+    if owner in needACopy:
+        needACopy = [target for target in needACopy if target != owner]
+        avoidedCopies = 1
     socket.execution.neededCopies = len(needACopy)
+    socket.execution.avoidedCopies = avoidedCopies
 
     for target in targets:
         if target in needACopy:
@@ -1,20 +1,63 @@
+import os
+import bpy
 import sys
+import types
+import marshal
+import hashlib
+import importlib.util
 from .. problems import InvalidSyntax
+from .. utils.operators import makeOperator
+from .. preferences import getExecutionCodeSettings
+from . sampling import isSampling, registerScript
 
 cache = {}
 
+class CacheStatistics:
+    __slots__ = ("memoryHits", "diskHits", "misses")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.memoryHits = 0
+        self.diskHits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "Hits: {} (Disk: {}) - Misses: {}".format(
+            self.memoryHits + self.diskHits, self.diskHits, self.misses)
+
+statistics = CacheStatistics()
+
 def compileScript(script, name = "<string>"):
+    compiledCode = compileScript_Cached(script, name)
+    if compiledCode is not None and isSampling():
+        registerScript(script, compiledCode)
+    return compiledCode
+
+def compileScript_Cached(script, name):
     # clear the cache once in a while
     if len(cache) == 500:
         cache.clear()
 
     try:
-        scriptHash = hash(script)
-        if scriptHash not in cache:
+        scriptDigest = getScriptDigest(script, name)
+        if scriptDigest in cache:
+            statistics.memoryHits += 1
+            return cache[scriptDigest]
+
+        useDiskCache = getExecutionCodeSettings().useDiskCache
+        compiledCode = loadFromDiskCache(scriptDigest) if useDiskCache else None
+
+        if compiledCode is None:
+            statistics.misses += 1
             compiledCode = compile(script, name, "exec")
-            cache[scriptHash] = compiledCode
+            if useDiskCache: storeInDiskCache(scriptDigest, compiledCode)
+        else:
+            statistics.diskHits += 1
 
-        return cache[scriptHash]
+        cache[scriptDigest] = compiledCode
+        return compiledCode
 
     except SyntaxError:
         lines = script.split("\n")
@@ -29,3 +72,99 @@ def compileScript(script, name = "<string>"):
         print("\n"*5)
 
         InvalidSyntax().report()
+
+def getScriptDigest(script, name):
+    # marshalled code objects are only valid for the python version that created them
+    text = "\0".join((sys.version, name, script))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+
+# Disk Cache
+##########################################
+
+# every file starts with the magic number of the python version that wrote it
+magicNumber = importlib.util.MAGIC_NUMBER
+
+# estimated size of the cache directory, None when it has not been scanned yet
+_diskCacheSize = None
+
+def loadFromDiskCache(scriptDigest):
+    path = getCacheFilePath(scriptDigest)
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(magicNumber)) != magicNumber:
+                raise ValueError("cache file of another python version")
+            compiledCode = marshal.load(f)
+        if not isinstance(compiledCode, types.CodeType):
+            raise TypeError("cache file does not contain a code object")
+        # remember the access time for the LRU eviction
+        os.utime(path)
+        return compiledCode
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError):
+        removeCacheFile(path)
+        return None
+
+def storeInDiskCache(scriptDigest, compiledCode):
+    global _diskCacheSize
+    path = getCacheFilePath(scriptDigest)
+    data = magicNumber + marshal.dumps(compiledCode)
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+    except OSError:
+        return
+
+    # the directory is only scanned again when the limit might be exceeded
+    if _diskCacheSize is None: _diskCacheSize = getDiskCacheSize()
+    else: _diskCacheSize += len(data)
+
+    maxSize = getExecutionCodeSettings().diskCacheSize * 1024 * 1024
+    if _diskCacheSize > maxSize:
+        _diskCacheSize = evictLeastRecentlyUsed(maxSize)
+
+def evictLeastRecentlyUsed(maxSize):
+    '''Returns the size of the cache after the eviction'''
+    entries = [(entry.path, entry.stat()) for entry in iterCacheFileEntries()]
+    totalSize = sum(stat.st_size for path, stat in entries)
+    if totalSize <= maxSize: return totalSize
+
+    entries.sort(key = lambda item: item[1].st_mtime)
+    for path, stat in entries:
+        if totalSize <= maxSize: break
+        totalSize -= stat.st_size
+        removeCacheFile(path)
+    return totalSize
+
+def getDiskCacheSize():
+    return sum(entry.stat().st_size for entry in iterCacheFileEntries())
+
+@makeOperator("an.clear_code_cache", "Clear Code Cache", redraw = True)
+def clearCodeCache():
+    global _diskCacheSize
+    cache.clear()
+    statistics.reset()
+    for entry in list(iterCacheFileEntries()):
+        removeCacheFile(entry.path)
+    _diskCacheSize = 0
+
+def iterCacheFileEntries():
+    directory = getCacheDirectory()
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.endswith(".marshal"):
+            yield entry
+
+def removeCacheFile(path):
+    try: os.remove(path)
+    except OSError: pass
+
+def getCacheFilePath(scriptDigest):
+    return os.path.join(getCacheDirectory(), scriptDigest + ".marshal")
+
+def getCacheDirectory():
+    return bpy.utils.user_resource("DATAFILES", path = "animation_nodes_code_cache", create = True)
+
+def getCacheStatistics():
+    return statistics
@@ -0,0 +1,101 @@
+import bpy
+import numpy
+from .. import problems
+from .. sockets.info import getCopyFunction
+from . code_generator import setRequiredNodeIDs
+from . units import (ensureExecutionUnitsAreSetup, finishExecutionUnits,
+                     resetAnimatedExecutionUnits, getMainUnitsByNodeTree)
+
+'''
+Executes node trees for many frames in one call. The execution units are
+only set up once (unless the trees are animated) and there is no scene
+update and redraw after every frame.
+
+    from animation_nodes.execution.frame_range import executeFrameRange
+    frames, (locations, ) = executeFrameRange(tree, 1, 1000, sockets = [node.outputs[0]])
+
+Only the values of output sockets in main networks can be collected.
+Their nodes are kept even when they don't pass data to a node with side effects.
+'''
+
+arrayDataTypes = {"Float", "Integer", "Boolean", "Vector", "Matrix"}
+
+_isExecutingFrameRange = False
+
+def isExecutingFrameRange():
+    return _isExecutingFrameRange
+
+def executeFrameRange(nodeTrees, startFrame, endFrame, step = 1, sockets = [], setFrames = True, scene = None):
+    '''
+    Execute the node trees for every frame in the range (end included).
+    With setFrames = False only the current frame is changed, so that other
+    animations in the scene are not evaluated.
+    Returns the list of executed frames and a list with the values of
+    every socket in these frames (a numpy array for numbers, vectors and matrices).
+    '''
+    if isinstance(nodeTrees, bpy.types.NodeTree): nodeTrees = [nodeTrees]
+    if scene is None: scene = bpy.context.scene
+    frames = list(range(startFrame, endFrame + 1, max(step, 1)))
+
+    # the nodes of the collected sockets must not be removed by the dead node elimination
+    setRequiredNodeIDs(socket.node.toID() for socket in sockets)
+    try: return executeFrames(nodeTrees, frames, sockets, setFrames, scene)
+    finally: setRequiredNodeIDs(())
+
+def executeFrames(nodeTrees, frames, sockets, setFrames, scene):
+    global _isExecutingFrameRange
+
+    from .. update import updateEverything
+    updateEverything()
+    if not problems.canExecute():
+        return frames, [None] * len(sockets)
+
+    collectors = [SocketValueCollector(socket) for socket in sockets]
+
+    oldFrame = scene.frame_current
+    _isExecutingFrameRange = True
+    try:
+        for frame in frames:
+            if setFrames: scene.frame_set(frame)
+            else: scene.frame_current = frame
+
+            resetAnimatedExecutionUnits()
+            ensureExecutionUnitsAreSetup()
+            for nodeTree in nodeTrees:
+                nodeTree._execute()
+            for collector in collectors:
+                collector.collect()
+    finally:
+        finishExecutionUnits()
+        _isExecutingFrameRange = False
+        if setFrames: scene.frame_set(oldFrame)
+        else: scene.frame_current = oldFrame
+
+    return frames, [collector.getValues() for collector in collectors]
+
+class SocketValueCollector:
+    def __init__(self, socket):
+        node = socket.node
+        self.socketID = ((node.id_data.name, node.name), socket.is_output, socket.identifier)
+        self.dataType = socket.dataType
+        self.copy = getCopyFunction(socket.dataType)
+        self.units = getMainUnitsByNodeTree(node.id_data)
+        self.values = []
+
+        if not any(self.socketID in unit.socketVariables for unit in self.units):
+            raise ValueError("The values of {} in {} cannot be collected, only output sockets "
+                             "in main networks are supported".format(repr(socket.name), repr(node.name)))
+
+    def collect(self):
+        value = None
+        for unit in self.units:
+            name = unit.socketVariables.get(self.socketID)
+            if name in unit.executionData:
+                value = self.copy(unit.executionData[name])
+                break
+        self.values.append(value)
+
+    def getValues(self):
+        if self.dataType in arrayDataTypes and None not in self.values:
+            return numpy.array([numpy.array(value) for value in self.values])
+        return self.values
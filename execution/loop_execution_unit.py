@@ -1,14 +1,20 @@
 from .. tree_info import getNodesByType
+from . batch import isBatchDataType
 from . compile_scripts import compileScript
+from .. sockets.info import toBaseDataType
 from .. problems import ExecutionUnitNotSetup
+from .. preferences import getExecutionCodeType, getExecutionCodeSettings
 from . code_generator import (getInitialVariables,
                               iterSetupCodeLines,
                               getCopyExpression,
                               getGlobalizeStatement,
                               getLoadSocketValueLine,
                               linkOutputSocketsToTargets,
+                              iterNodeBatchExecutionLines,
                               getFunction_IterNodeExecutionLines)
 
+loopSystemNodes = {"an_LoopInputNode", "an_LoopGeneratorOutputNode", "an_ReassignLoopParameterNode", "an_LoopBreakNode"}
+
 class LoopExecutionUnit:
     def __init__(self, network, nodeByID):
         self.network = network
@@ -44,16 +50,22 @@ class LoopExecutionUnit:
         except: return
 
         variables = getInitialVariables(nodes)
-        self.setupScript = "\n".join(self.iterSetupScriptLines(nodes, variables, nodeByID))
-
-    def iterSetupScriptLines(self, nodes, variables, nodeByID):
         inputNode = self.network.getLoopInputNode(nodeByID)
+        if self.canExecuteInBatch(inputNode, nodes, nodeByID):
+            lines = self.iterBatchSetupScriptLines(inputNode, nodes, variables, nodeByID)
+        else:
+            lines = self.iterSetupScriptLines(inputNode, nodes, variables, nodeByID)
+        self.setupScript = "\n".join(lines)
 
+    def iterSetupScriptLines(self, inputNode, nodes, variables, nodeByID):
         yield from iterSetupCodeLines(nodes, variables)
         yield "\n\n"
 
         if inputNode.iterateThroughLists:
-            yield from self.iter_IteratorLength(inputNode, nodes, variables, nodeByID)
+            if self.canExecuteInParallel(inputNode, nodes, nodeByID):
+                yield from self.iter_ParallelIteratorLength(inputNode, nodes, variables, nodeByID)
+            else:
+                yield from self.iter_IteratorLength(inputNode, nodes, variables, nodeByID)
         else:
             yield from self.iter_IterationsAmount(inputNode, nodes, variables, nodeByID)
 
@@ -85,8 +97,8 @@ class LoopExecutionUnit:
         yield "for current_loop_index in range(loop_iterations):"
 
 
-    def iter_IteratorLength(self, inputNode, nodes, variables, nodeByID):
-        yield self.get_IteratorLength_Header(inputNode, variables)
+    def iter_IteratorLength(self, inputNode, nodes, variables, nodeByID, functionName = "main"):
+        yield self.get_IteratorLength_Header(inputNode, variables, functionName)
         yield "    " + getGlobalizeStatement(nodes, variables)
         yield from iterIndented(self.iter_InitializeGeneratorsLines(inputNode, variables, nodeByID))
         yield from iterIndented(self.iter_InitializeParametersLines(inputNode, variables))
@@ -95,7 +107,7 @@ class LoopExecutionUnit:
         yield from iterIndented(self.iter_UpdateDebugLoopNodes(nodeByID))
         yield "    " + self.get_ReturnStatement(inputNode, variables, nodeByID)
 
-    def get_IteratorLength_Header(self, inputNode, variables):
+    def get_IteratorLength_Header(self, inputNode, variables, functionName = "main"):
         parameterNames = []
         for i, socket in enumerate(inputNode.getIteratorSockets()):
             name = "loop_iterator_" + str(i)
@@ -106,7 +118,7 @@ class LoopExecutionUnit:
                 variables[socket] = name
                 parameterNames.append(name)
 
-        header = "def main({}):".format(", ".join(parameterNames))
+        header = "def {}({}):".format(functionName, ", ".join(parameterNames))
         return header
 
     def iter_IteratorLength_PrepareLoopLines(self, inputNode, variables):
@@ -152,18 +164,24 @@ class LoopExecutionUnit:
 
 
     def iter_LoopBody(self, inputNode, nodes, variables, nodeByID):
+        # iterations that end with a break are not recorded
+        traceIterations = getExecutionCodeType() == "TRACE"
+        if traceIterations:
+            yield "_trace_iteration_start_time = getCurrentTime()"
+
         yield from linkOutputSocketsToTargets(inputNode, variables, nodeByID)
 
         iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
-        ignoreNodes = {"an_LoopInputNode", "an_LoopGeneratorOutputNode", "an_ReassignLoopParameterNode", "an_LoopBreakNode"}
-        for node in nodes:
-            if node.bl_idname in ignoreNodes: continue
+        for node in iterLoopBodyNodes(nodes):
             yield from iterNodeExecutionLines(node, variables)
             yield from linkOutputSocketsToTargets(node, variables, nodeByID)
 
         yield from self.iter_LoopBreak(inputNode, variables, nodeByID)
         yield from self.iter_AddToGenerators(inputNode, variables, nodeByID)
         yield from self.iter_ReassignParameters(inputNode, variables, nodeByID)
+        if traceIterations:
+            yield "_record_trace_event({}, 'loop iteration', _trace_iteration_start_time, {})".format(
+                repr(inputNode.subprogramName), repr(inputNode.nodeTree.name))
         yield "pass"
 
     def iter_LoopBreak(self, inputNode, variables, nodeByID):
@@ -201,6 +219,128 @@ class LoopExecutionUnit:
 
 
 
+    # Parallel Execution
+    ##########################################
+
+    def canExecuteInParallel(self, inputNode, nodes, nodeByID):
+        '''
+        Iterations of pure loops without break and reassign nodes are independent.
+        '''
+        if not inputNode.parallel: return False
+        if getExecutionCodeType() != "DEFAULT": return False
+        if len(inputNode.getBreakNodes(nodeByID)) > 0: return False
+        if len(inputNode.getReassignParameterNodes(nodeByID)) > 0: return False
+        return all(node.isPure for node in iterLoopBodyNodes(nodes))
+
+    def iter_ParallelIteratorLength(self, inputNode, nodes, variables, nodeByID):
+        yield from self.iter_IteratorLength(inputNode, nodes, variables, nodeByID, functionName = "main_chunk")
+        yield "main = animation_nodes.execution.process_pool.ParallelLoop(main_chunk, {}, {})".format(
+            len(inputNode.getIteratorSockets()), repr(list(self.iterOutputTypes(inputNode, nodeByID))))
+
+    def iterOutputTypes(self, inputNode, nodeByID):
+        # same order as in the return statement
+        for i, socket in enumerate(inputNode.getIteratorSockets()):
+            if socket.loop.useAsOutput: yield ("ITERATOR", i)
+        for node in inputNode.getSortedGeneratorNodes(nodeByID):
+            yield ("GENERATOR", None)
+        for socket in inputNode.getParameterSockets():
+            if socket.loop.useAsOutput: yield ("PARAMETER", None)
+
+
+    # Batch Execution
+    ##########################################
+
+    def canExecuteInBatch(self, inputNode, nodes, nodeByID):
+        '''
+        Execute every node only once for all iterations when
+        all nodes in the loop body have a vectorized implementation.
+        '''
+        if getExecutionCodeType() not in ("DEFAULT", "SAMPLE"): return False
+        if not getExecutionCodeSettings().useBatchLoops: return False
+        if len(inputNode.getBreakNodes(nodeByID)) > 0: return False
+        if len(inputNode.getReassignParameterNodes(nodeByID)) > 0: return False
+
+        for node in inputNode.getSortedGeneratorNodes(nodeByID):
+            if node.addType != "APPEND": return False
+            if not isBatchDataType(toBaseDataType(node.listDataType)): return False
+
+        sockets = list(inputNode.getIteratorSockets()) + list(inputNode.getParameterSockets())
+        for node in iterLoopBodyNodes(nodes):
+            if node.getBatchExecutionCode() is None: return False
+            sockets.extend(node.inputs)
+            sockets.extend(node.outputs)
+        return all(isBatchDataType(socket.dataType) for socket in sockets)
+
+    def iterBatchSetupScriptLines(self, inputNode, nodes, variables, nodeByID):
+        yield from iterSetupCodeLines(nodes, variables)
+        yield "import numpy"
+        yield "batch = animation_nodes.execution.batch"
+        yield "\n\n"
+
+        if inputNode.iterateThroughLists:
+            yield self.get_IteratorLength_Header(inputNode, variables)
+        else:
+            yield self.get_IterationsAmount_Header(inputNode, variables)
+        yield "    " + getGlobalizeStatement(nodes, variables)
+        yield from iterIndented(self.iter_InitializeParametersLines(inputNode, variables))
+
+        for i, node in enumerate(inputNode.getSortedGeneratorNodes(nodeByID)):
+            variables[node] = "loop_generator_output_" + str(i)
+        # the returned parameters are not affected by the conversion to arrays
+        returnStatement = self.get_ReturnStatement(inputNode, variables, nodeByID)
+
+        yield from iterIndented(self.iter_Batch_PrepareArrays(inputNode, variables))
+        yield from iterIndented(self.iter_Batch_Body(inputNode, nodes, variables, nodeByID))
+        yield from iterIndented(self.iter_Batch_CreateGenerators(inputNode, variables, nodeByID))
+        yield "    " + returnStatement
+
+    def iter_Batch_PrepareArrays(self, inputNode, variables):
+        iterators = inputNode.getIteratorSockets()
+        if len(iterators) > 0:
+            lengths = ", ".join("len(loop_iterator_{})".format(i) for i in range(len(iterators)))
+            yield "loop_iterations = min([{}])".format(lengths)
+        else:
+            yield "loop_iterations = max(loop_iterations, 0)"
+
+        for i, socket in enumerate(iterators):
+            name = "loop_iterator_element_" + str(i)
+            yield "{} = batch.listToBatchArray(loop_iterator_{}, {}, loop_iterations)".format(
+                name, i, repr(socket.dataType))
+            variables[socket] = name
+
+        yield "current_loop_index = numpy.arange(loop_iterations)"
+        yield "loop_iterations_array = batch.toBatchArray(loop_iterations, 'Integer', loop_iterations)"
+        variables[inputNode.indexSocket] = "current_loop_index"
+        variables[inputNode.iterationsSocket] = "loop_iterations_array"
+
+        for i, socket in enumerate(inputNode.getParameterSockets()):
+            name = "loop_parameter_array_" + str(i)
+            yield getToBatchArrayLine(socket, name, variables)
+            variables[socket] = name
+
+    def iter_Batch_Body(self, inputNode, nodes, variables, nodeByID):
+        yield from linkOutputSocketsToTargets(inputNode, variables, nodeByID)
+
+        for node in iterLoopBodyNodes(nodes):
+            for socket in node.unlinkedInputs:
+                name = variables[socket] + "_array"
+                yield getToBatchArrayLine(socket, name, variables)
+                variables[socket] = name
+            yield from iterNodeBatchExecutionLines(node, variables)
+            yield from linkOutputSocketsToTargets(node, variables, nodeByID)
+
+    def iter_Batch_CreateGenerators(self, inputNode, variables, nodeByID):
+        for node in inputNode.getSortedGeneratorNodes(nodeByID):
+            socket = node.addSocket
+            if socket.isUnlinked:
+                name = variables[socket] + "_array"
+                yield getToBatchArrayLine(socket, name, variables)
+                variables[socket] = name
+
+            yield "{} = batch.fromBatchArray({}, {}, {})".format(variables[node],
+                variables[socket], repr(node.listDataType), variables[node.conditionSocket])
+
+
     def compileScript(self):
         self.setupCodeObject = compileScript(self.setupScript, name = "group: {}".format(repr(self.network.name)))
 
@@ -208,6 +348,15 @@ class LoopExecutionUnit:
     def raiseNotSetupException(self):
         raise ExecutionUnitNotSetup()
 
+def iterLoopBodyNodes(nodes):
+    for node in nodes:
+        if node.bl_idname not in loopSystemNodes:
+            yield node
+
+def getToBatchArrayLine(socket, name, variables):
+    return "{} = batch.toBatchArray({}, {}, loop_iterations)".format(
+        name, variables[socket], repr(socket.dataType))
+
 def joinLines(lines):
     return "\n".join(lines)
 
@@ -1,8 +1,16 @@
-import sys, traceback
+import sys, dis, traceback
 from .. import problems
 from . compile_scripts import compileScript
+from . process_pool import registerParallelUnit
+from .. preferences import getExecutionCodeType, getExecutionCodeSettings
 from .. problems import ExecutionUnitNotSetup, ExceptionDuringExecution
-from . code_generator import (getInitialVariables,
+from . code_generator import (getLiveNodes,
+                              getConstantNodeIDs,
+                              linkConstantOutputSocketsToTargets,
+                              findOwningTargets,
+                              splitIntoExecutionPhases,
+                              getInitialVariables,
+                              getOutputSocketVariables,
                               iterSetupCodeLines,
                               linkOutputSocketsToTargets,
                               getFunction_IterNodeExecutionLines)
@@ -11,20 +19,52 @@ class MainExecutionUnit:
     def __init__(self, network, nodeByID):
         self.network = network
         self.setupScript = ""
+        self.constantsScript = ""
         self.executeScript = ""
+        self.phaseScripts = ["", "", ""]
         self.setupCodeObject = None
+        self.constantsCodeObject = None
         self.executeCodeObject = None
+        self.phaseCodeObjects = []
+        self.phaseInputNames = set()
+        self.phaseOutputNames = set()
         self.executionData = {}
+        self.cachedConstants = None
+        self.socketVariables = {}
+        self.parallelIndex = None
+        self.canSendPhaseData = True
 
         self.generateScripts(nodeByID)
         self.compileScripts()
         self.execute = self.raiseNotSetupException
+        self.executePhase = self.raiseNotSetupException
 
 
     def setup(self):
         self.executionData = {}
         exec(self.setupCodeObject, self.executionData, self.executionData)
+        self.insertConstants()
         self.execute = self.executeUnit
+        self.executePhase = self.executePhaseScript
+        if self.hasParallelPhase:
+            self.parallelIndex = registerParallelUnit(self)
+            self.canSendPhaseData = True
+
+    def insertConstants(self):
+        '''
+        Frame independent values are only calculated again
+        after the constants have been invalidated.
+        '''
+        if self.cachedConstants is None:
+            oldData = self.executionData.copy()
+            exec(self.constantsCodeObject, self.executionData, self.executionData)
+            self.cachedConstants = {name : value for name, value in self.executionData.items()
+                                    if name not in oldData or oldData[name] is not value}
+        else:
+            self.executionData.update(self.cachedConstants)
+
+    def invalidateConstants(self):
+        self.cachedConstants = None
 
     def insertSubprogramFunctions(self, data):
         self.executionData.update(data)
@@ -32,10 +72,21 @@ class MainExecutionUnit:
     def finish(self):
         self.executionData.clear()
         self.execute = self.raiseNotSetupException
+        self.executePhase = self.raiseNotSetupException
 
     def executeUnit(self):
+        return self.executeCodeObject_Safe(self.executeCodeObject)
+
+    def executePhaseScript(self, index):
+        '''
+        The phases together do the same as executeUnit (see splitIntoExecutionPhases).
+        Only the second phase can be executed in another process.
+        '''
+        return self.executeCodeObject_Safe(self.phaseCodeObjects[index])
+
+    def executeCodeObject_Safe(self, codeObject):
         try:
-            exec(self.executeCodeObject, self.executionData, self.executionData)
+            exec(codeObject, self.executionData, self.executionData)
             return True
         except:
             print("\n"*5)
@@ -45,7 +96,32 @@ class MainExecutionUnit:
 
 
     def getCodes(self):
-        return [self.setupScript, self.executeScript]
+        return [self.setupScript, self.constantsScript, self.executeScript]
+
+
+    # Parallel Phase
+    ##########################################
+
+    @property
+    def hasParallelPhase(self):
+        return self.phaseScripts[1] != ""
+
+    def getParallelPhaseInputs(self):
+        data = self.executionData
+        return {name : data[name] for name in self.phaseInputNames if name in data}
+
+    def executeParallelPhase(self, inputs):
+        '''
+        Runs in a worker process that has been forked after the setup.
+        Returns the values that the last phase uses.
+        '''
+        data = self.executionData
+        data.update(inputs)
+        exec(self.phaseCodeObjects[1], data, data)
+        return {name : data[name] for name in self.phaseOutputNames if name in data}
+
+    def insertParallelPhaseOutputs(self, outputs):
+        self.executionData.update(outputs)
 
 
 
@@ -53,21 +129,103 @@ class MainExecutionUnit:
         try: nodes = self.network.getSortedAnimationNodes(nodeByID)
         except: return
 
+        settings = getExecutionCodeSettings()
+        if settings.eliminateDeadNodes:
+            nodes = getLiveNodes(nodes)
+            if len(nodes) == 0:
+                self.setupScript = "pass"
+                self.executeScript = "pass"
+                return
+
+        nodeIDs = {node.toID() for node in nodes}
+        constantNodeIDs = getConstantNodeIDs(nodes) if settings.foldConstants else set()
+        otherNodeIDs = nodeIDs - constantNodeIDs
+        constantNodes = [node for node in nodes if node.toID() in constantNodeIDs]
+        otherNodes = [node for node in nodes if node.toID() in otherNodeIDs]
+
+        ownerBySocket, extraDependencies = {}, {}
+        if settings.scheduleCopies:
+            ownerBySocket, extraDependencies = findOwningTargets(otherNodes, nodeByID, otherNodeIDs)
+            if len(extraDependencies) > 0:
+                sortedNodes = self.network.getSortedAnimationNodes(nodeByID, extraDependencies)
+                otherNodes = [node for node in sortedNodes if node.toID() in otherNodeIDs]
+
         variables = getInitialVariables(nodes)
+        self.socketVariables = getOutputSocketVariables(nodes, variables)
         self.setupScript = "\n".join(iterSetupCodeLines(nodes, variables))
-        self.executeScript = "\n".join(self.iterExecutionScriptLines(nodes, variables, nodeByID))
+        constantLines = []
+        constantCopyLines = []
+        self.insertConstantNodeLines(constantNodes, variables, nodeByID,
+            constantNodeIDs, otherNodeIDs, constantLines, constantCopyLines)
+
+        self.constantsScript = "\n".join(constantLines)
+
+        # other code types measure or trace the whole script
+        if getExecutionCodeType() == "DEFAULT":
+            phases = splitIntoExecutionPhases(otherNodes, nodeByID, extraDependencies)
+        else:
+            phases = (otherNodes, [], [])
+
+        phaseLines = [constantCopyLines, [], []]
+        for lines, phaseNodes in zip(phaseLines, phases):
+            lines.extend(self.iterExecutionScriptLines(phaseNodes, variables, nodeByID, otherNodeIDs, ownerBySocket))
+        self.phaseScripts = ["\n".join(lines) for lines in phaseLines]
+        self.executeScript = "\n".join(script for script in self.phaseScripts if script != "")
+
+    def insertConstantNodeLines(self, nodes, variables, nodeByID, constantNodeIDs, otherNodeIDs,
+                                constantLines, executionLines):
+        '''
+        Constant nodes don't depend on the frame. They are only executed when
+        the cached constants are invalid (see insertConstants).
+        '''
+        iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
 
-    def iterExecutionScriptLines(self, nodes, variables, nodeByID):
+        for node in nodes:
+            constantLines.extend(iterNodeExecutionLines(node, variables))
+            newConstantLines, newExecutionLines = linkConstantOutputSocketsToTargets(
+                node, variables, nodeByID, constantNodeIDs, otherNodeIDs)
+            constantLines.extend(newConstantLines)
+            executionLines.extend(newExecutionLines)
+
+    def iterExecutionScriptLines(self, nodes, variables, nodeByID, nodeIDs, ownerBySocket):
         iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
 
         for node in nodes:
             yield from iterNodeExecutionLines(node, variables)
-            yield from linkOutputSocketsToTargets(node, variables, nodeByID)
+            yield from linkOutputSocketsToTargets(node, variables, nodeByID, nodeIDs, ownerBySocket)
 
     def compileScripts(self):
         self.setupCodeObject = compileScript(self.setupScript, name = "setup: {}".format(repr(self.network.treeName)))
+        self.constantsCodeObject = compileScript(self.constantsScript, name = "constants: {}".format(repr(self.network.treeName)))
         self.executeCodeObject = compileScript(self.executeScript, name = "execution: {}".format(repr(self.network.treeName)))
+        if self.hasParallelPhase:
+            self.phaseCodeObjects = [compileScript(script, name = "execution phase {}: {}".format(i + 1, repr(self.network.treeName)))
+                                     for i, script in enumerate(self.phaseScripts)]
+            self.findPhaseVariables()
+
+    def findPhaseVariables(self):
+        '''
+        The second phase needs the variables that the first phase assigns.
+        The last phase needs the variables the second phase assigns or can modify.
+        Everything else is already in the execution data of the workers.
+        '''
+        firstNames, secondNames, lastNames = [getUsedNames(codeObject) for codeObject in self.phaseCodeObjects]
+        firstAssigned, secondAssigned = [getAssignedNames(codeObject) for codeObject in self.phaseCodeObjects[:2]]
+        self.phaseInputNames = firstAssigned & secondNames
+        self.phaseOutputNames = (firstAssigned | secondAssigned) & secondNames & lastNames
 
 
     def raiseNotSetupException(self, *args, **kwargs):
         raise ExecutionUnitNotSetup()
+
+def getUsedNames(codeObject):
+    names = set(codeObject.co_names)
+    for constant in codeObject.co_consts:
+        # e.g. comprehensions
+        if hasattr(constant, "co_names"):
+            names.update(getUsedNames(constant))
+    return names
+
+def getAssignedNames(codeObject):
+    return {instruction.argval for instruction in dis.get_instructions(codeObject)
+            if instruction.opname in ("STORE_NAME", "STORE_GLOBAL")}
@@ -1,10 +1,12 @@
 import bpy
 import textwrap
+import tracemalloc
 from collections import defaultdict
 from .. utils.timing import prettyTime
 from .. graphics.text_box import TextBox
 from .. utils.operators import makeOperator
 from .. utils.blender_ui import iterNodeCornerLocations
+from . sampling import resetSamples
 
 class NodeMeasurements:
     __slots__ = ("totalTime", "calls")
@@ -26,11 +28,41 @@ class NodeMeasurements:
                        prettyTime(self.totalTime),
                        self.calls))
 
+class NodeMemoryMeasurements:
+    __slots__ = ("peakSize", "totalNetSize", "calls")
+
+    def __init__(self):
+        self.peakSize = 0
+        self.totalNetSize = 0
+        self.calls = 0
+
+    def add(self, peakSize, netSize):
+        self.peakSize = max(self.peakSize, peakSize)
+        self.totalNetSize += netSize
+        self.calls += 1
+
+    @property
+    def averageNetSize(self):
+        return self.totalNetSize / max(self.calls, 1)
+
+    def __repr__(self):
+        return textwrap.dedent("""\
+            Peak: {}
+            Net: {}
+            Calls: {:,d}\
+            """.format(prettyBytes(self.peakSize),
+                       prettyBytes(self.averageNetSize),
+                       self.calls))
+
 measurementsByNodeIdentifier = defaultdict(NodeMeasurements)
+memoryMeasurementsByNodeIdentifier = defaultdict(NodeMemoryMeasurements)
 
 @makeOperator("an.reset_measurements", "Reset Measurements", redraw = True)
 def resetMeasurements():
     measurementsByNodeIdentifier.clear()
+    memoryMeasurementsByNodeIdentifier.clear()
+    _memoryMeasurementStack.clear()
+    resetSamples()
 
 def getMeasurementsDict():
     return measurementsByNodeIdentifier
@@ -38,6 +70,59 @@ def getMeasurementsDict():
 def getAverageExecutionTime(node):
     return measurementsByNodeIdentifier[node.identifier].averageTime
 
+def getMemoryMeasurementsDict():
+    return memoryMeasurementsByNodeIdentifier
+
+def updateMemoryTracing(enabled):
+    # tracing makes every allocation slower, so it only runs in the MEMORY mode
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+# [start size, highest peak since the start] of every running measurement,
+# nested measurements come from Invoke Subprogram nodes
+_memoryMeasurementStack = []
+
+# reset_peak is new in Python 3.9
+canResetPeak = hasattr(tracemalloc, "reset_peak")
+
+def startMemoryMeasurement():
+    '''Returns the index of the measurement for finishMemoryMeasurement'''
+    currentSize, peakSize = tracemalloc.get_traced_memory()
+    if canResetPeak:
+        # the peak of the outer measurement must not get lost
+        if len(_memoryMeasurementStack) > 0:
+            outer = _memoryMeasurementStack[-1]
+            outer[1] = max(outer[1], peakSize)
+        tracemalloc.reset_peak()
+        peakSize = currentSize
+    _memoryMeasurementStack.append([currentSize, peakSize])
+    return len(_memoryMeasurementStack) - 1
+
+def finishMemoryMeasurement(identifier, index):
+    startSize, startPeakSize = _memoryMeasurementStack[index]
+    # measurements of nodes that raised an exception are dropped
+    del _memoryMeasurementStack[index:]
+
+    currentSize, peakSize = tracemalloc.get_traced_memory()
+    if canResetPeak:
+        peakSize = max(startPeakSize, peakSize)
+        if len(_memoryMeasurementStack) > 0:
+            outer = _memoryMeasurementStack[-1]
+            outer[1] = max(outer[1], peakSize)
+    elif peakSize <= startPeakSize:
+        # the global peak was reached before, only a lower bound is known
+        peakSize = max(startSize, currentSize)
+
+    memoryMeasurementsByNodeIdentifier[identifier].add(peakSize - startSize, currentSize - startSize)
+
+def prettyBytes(size):
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024: return "{:.1f} {}".format(size, unit)
+        size /= 1024
+    return "{:.2f} GB".format(size)
+
 def drawMeasurementResults():
     tree = bpy.context.space_data.edit_tree
     if tree is None: return
@@ -50,10 +135,24 @@ def drawMeasurementResults():
 
     for node, leftBottom, rightBottom in zip(nodes, leftCorners, rightCorners):
         if node.isAnimationNode and not node.hide:
-            drawMeasurementResultForNode(node, leftBottom, rightBottom)
+            drawMeasurementResultForNode(node, leftBottom, rightBottom, measurementsByNodeIdentifier)
+
+def drawMemoryMeasurementResults():
+    tree = bpy.context.space_data.edit_tree
+    if tree is None: return
+    if tree.bl_idname != "an_AnimationNodeTree": return
+
+    nodes = tree.nodes
+    region = bpy.context.region
+    leftCorners = iterNodeCornerLocations(nodes, region, horizontal = "LEFT")
+    rightCorners = iterNodeCornerLocations(nodes, region, horizontal = "RIGHT")
+
+    for node, leftBottom, rightBottom in zip(nodes, leftCorners, rightCorners):
+        if node.isAnimationNode and not node.hide:
+            drawMeasurementResultForNode(node, leftBottom, rightBottom, memoryMeasurementsByNodeIdentifier)
 
-def drawMeasurementResultForNode(node, leftBottom, rightBottom):
-    result = measurementsByNodeIdentifier[node.identifier]
+def drawMeasurementResultForNode(node, leftBottom, rightBottom, measurements):
+    result = measurements[node.identifier]
     if result.calls == 0: text = "Not Measured"
     else: text = str(result)
 
@@ -63,3 +162,10 @@ def drawMeasurementResultForNode(node, leftBottom, rightBottom):
                       fontSize = width / node.dimensions.x * 11)
     textBox.padding = 3
     textBox.draw()
+
+
+# Register
+##################################
+
+def unregister():
+    updateMemoryTracing(False)
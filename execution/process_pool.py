@@ -0,0 +1,245 @@
+import os
+import pickle
+import copyreg
+import traceback
+import multiprocessing
+from mathutils import Vector, Matrix, Euler, Quaternion
+from .. problems import ExceptionDuringExecution
+
+'''
+Loops with the 'Parallel' option split their iterators into chunks that
+are processed by worker processes. The workers are forked once after the
+execution units have been set up, so they already contain the generated
+loop functions. Only the arguments and the results have to be pickled.
+The pool is terminated when the execution units are finished.
+
+Main networks of trees with the 'Parallel Execution' option use the same
+workers for the parts that don't access blend data.
+'''
+
+# smaller loops are not worth the overhead of sending the data to the workers
+minChunkSize = 100
+
+_pool = None
+_parallelLoops = []
+_parallelUnits = []
+_isWorkerProcess = False
+
+class ParallelLoop:
+    def __init__(self, function, iteratorAmount, outputTypes):
+        self.function = function
+        self.iteratorAmount = iteratorAmount
+        # can contain "ITERATOR", "GENERATOR" and "PARAMETER" (order of the return statement)
+        self.outputTypes = [outputType for outputType, _ in outputTypes]
+        # index of the iterator for every "ITERATOR" output
+        self.iteratorIndices = [index for outputType, index in outputTypes if outputType == "ITERATOR"]
+        self.canPickleArguments = True
+
+        # the pool is terminated before every setup (see finishParallelExecution),
+        # so the workers are always forked after all loops have been created
+        self.index = len(_parallelLoops)
+        _parallelLoops.append(self)
+
+    def __call__(self, *args):
+        iterators = args[:self.iteratorAmount]
+        amount = min(len(iterator) for iterator in iterators)
+        chunkAmount = min(os.cpu_count() or 1, amount // minChunkSize)
+
+        if chunkAmount > 1 and self.canPickleArguments and not _isWorkerProcess and canForkProcesses():
+            tasks = self.dumpTasks(args, amount, chunkAmount)
+            if tasks is not None:
+                # exceptions of the loop body are raised again here
+                results = getPool().map(executeChunk, tasks)
+                if all(result is not None for result in results):
+                    return self.joinResults(args, [pickle.loads(result) for result in results])
+                self.canPickleArguments = False
+                print("\nCould not send the loop outputs back from other processes")
+        return self.function(*args)
+
+    def dumpTasks(self, args, amount, chunkAmount):
+        # every worker only gets its part of the iterators
+        otherArgs = list(args[self.iteratorAmount:])
+        try:
+            return [(self.index, pickle.dumps([iterator[start:end] for iterator in args[:self.iteratorAmount]] + otherArgs))
+                    for start, end in iterChunks(amount, chunkAmount)]
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # e.g. blend data in the arguments, try again after the next setup
+            self.canPickleArguments = False
+            print("\nCould not send the loop arguments to other processes:")
+            traceback.print_exc()
+            return None
+
+    def executeChunk(self, args):
+        outputs = self.toTuple(self.function(*args))
+        # the iterators are returned unchanged, no need to send them back
+        outputs = [output for output, outputType in zip(outputs, self.outputTypes)
+                   if outputType != "ITERATOR"]
+        try: return pickle.dumps(outputs)
+        except (pickle.PicklingError, TypeError, AttributeError): return None
+
+    def joinResults(self, args, results):
+        outputs = []
+        iteratorIndices = iter(self.iteratorIndices)
+        resultIndex = 0
+        for outputType in self.outputTypes:
+            if outputType == "ITERATOR":
+                outputs.append(args[next(iteratorIndices)])
+                continue
+            if outputType == "GENERATOR":
+                joined = results[0][resultIndex]
+                for result in results[1:]:
+                    joined += result[resultIndex]
+                outputs.append(joined)
+            elif outputType == "PARAMETER":
+                outputs.append(results[0][resultIndex])
+            resultIndex += 1
+        return self.fromTuple(outputs)
+
+    def toTuple(self, outputs):
+        if len(self.outputTypes) == 0: return ()
+        if len(self.outputTypes) == 1: return (outputs, )
+        return outputs
+
+    def fromTuple(self, outputs):
+        if len(outputs) == 0: return None
+        if len(outputs) == 1: return outputs[0]
+        return tuple(outputs)
+
+def executeChunk(task):
+    index, argsData = task
+    return _parallelLoops[index].executeChunk(pickle.loads(argsData))
+
+def iterChunks(amount, chunkAmount):
+    chunkSize, rest = divmod(amount, chunkAmount)
+    start = 0
+    for i in range(chunkAmount):
+        end = start + chunkSize + (1 if i < rest else 0)
+        yield (start, end)
+        start = end
+
+def canForkProcesses():
+    return "fork" in multiprocessing.get_all_start_methods()
+
+def getPool():
+    global _pool
+    if _pool is None:
+        context = multiprocessing.get_context("fork")
+        _pool = context.Pool(os.cpu_count() or 1, initializer = markAsWorkerProcess)
+    return _pool
+
+def markAsWorkerProcess():
+    # nested parallel loops run serially in the workers
+    global _isWorkerProcess
+    _isWorkerProcess = True
+
+def terminatePool():
+    global _pool
+    if _pool is not None:
+        _pool.terminate()
+        _pool = None
+
+def finishParallelExecution():
+    terminatePool()
+    _parallelLoops.clear()
+    _parallelUnits.clear()
+
+
+
+# Main Networks
+##########################################
+
+def registerParallelUnit(unit):
+    # the index is sent to the workers instead of the unit
+    _parallelUnits.append(unit)
+    return len(_parallelUnits) - 1
+
+def executeUnitsInParallel(units):
+    '''
+    All units execute their first phase on the main thread. Then the second
+    phases, which don't access blend data, run in the workers at the same time.
+    The last phases run on the main thread again (see splitIntoExecutionPhases).
+    '''
+    parallelUnits = [unit for unit in units if unit.hasParallelPhase]
+    if len(parallelUnits) < 2 or _isWorkerProcess or not canForkProcesses():
+        return all([unit.execute() for unit in units])
+
+    failedUnits = set()
+    for unit in units:
+        if unit.hasParallelPhase: success = unit.executePhase(0)
+        else: success = unit.execute()
+        if not success: failedUnits.add(unit)
+
+    sentUnits, tasks, localUnits = [], [], []
+    for unit in parallelUnits:
+        if unit in failedUnits: continue
+        inputData = dumpPhaseInputs(unit)
+        if inputData is None:
+            localUnits.append(unit)
+        else:
+            sentUnits.append(unit)
+            tasks.append((unit.parallelIndex, inputData))
+
+    # the main thread executes the phases that could not be sent in the meantime
+    pendingResults = getPool().map_async(executePhaseInWorker, tasks) if len(tasks) > 0 else None
+    for unit in localUnits:
+        if not unit.executePhase(1): failedUnits.add(unit)
+    results = pendingResults.get() if pendingResults is not None else []
+
+    for unit, (state, data) in zip(sentUnits, results):
+        if state == "SUCCESS":
+            unit.insertParallelPhaseOutputs(pickle.loads(data))
+        elif state == "EXCEPTION":
+            print("\n"*5)
+            print(data)
+            ExceptionDuringExecution().report()
+            failedUnits.add(unit)
+        else:
+            # the outputs could not be sent back
+            unit.canSendPhaseData = False
+            if not unit.executePhase(1): failedUnits.add(unit)
+
+    for unit in parallelUnits:
+        if unit not in failedUnits:
+            if not unit.executePhase(2): failedUnits.add(unit)
+
+    return len(failedUnits) == 0
+
+def dumpPhaseInputs(unit):
+    if not unit.canSendPhaseData: return None
+    try: return pickle.dumps(unit.getParallelPhaseInputs())
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # e.g. blend data in the inputs, try again after the next setup
+        unit.canSendPhaseData = False
+        print("\nCould not send the network data to other processes:")
+        traceback.print_exc()
+        return None
+
+def executePhaseInWorker(task):
+    index, inputData = task
+    try: outputs = _parallelUnits[index].executeParallelPhase(pickle.loads(inputData))
+    except: return "EXCEPTION", traceback.format_exc()
+    try: return "SUCCESS", pickle.dumps(outputs)
+    except (pickle.PicklingError, TypeError, AttributeError): return "NOT_PICKLABLE", None
+
+
+# Pickle Support
+##########################################
+
+def reduceVector(vector):
+    return Vector, (tuple(vector), )
+
+def reduceMatrix(matrix):
+    return Matrix, ([tuple(row) for row in matrix], )
+
+def reduceEuler(euler):
+    return Euler, (tuple(euler), euler.order)
+
+def reduceQuaternion(quaternion):
+    return Quaternion, (tuple(quaternion), )
+
+# MeshData, splines and other data structures only need their
+# mathutils values to be picklable because they use __slots__
+copyreg.pickle(Vector, reduceVector)
+copyreg.pickle(Matrix, reduceMatrix)
+copyreg.pickle(Euler, reduceEuler)
+copyreg.pickle(Quaternion, reduceQuaternion)
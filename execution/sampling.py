@@ -0,0 +1,181 @@
+import sys
+import bpy
+import threading
+from ast import literal_eval
+from collections import defaultdict
+from .. graphics.text_box import TextBox
+from .. utils.blender_ui import iterNodeCornerLocations
+
+'''
+The SAMPLE execution code type does not change the generated code.
+Instead a background thread looks at the frame the main thread is
+executing every few milliseconds while a node tree is executed. The line number in a generated script
+is mapped back to a node with the '# Node:' comment lines in that script.
+'''
+
+sampleInterval = 0.001
+
+nodeByLineByCode = {}
+samplesByNode = defaultdict(int)
+_sampler = None
+
+class SamplingResults:
+    __slots__ = ("totalSamples", )
+
+    def __init__(self):
+        self.totalSamples = 0
+
+results = SamplingResults()
+
+def resetSamples():
+    samplesByNode.clear()
+    results.totalSamples = 0
+
+def getSamplePercentage(treeName, nodeName):
+    return samplesByNode.get((treeName, nodeName), 0) / max(results.totalSamples, 1) * 100
+
+
+
+# Line Mapping
+##########################################
+
+def registerScript(script, codeObject):
+    nodeByLine = list(iterNodeByLine(script))
+    for code in iterCodeObjects(codeObject):
+        nodeByLineByCode[code] = nodeByLine
+
+def iterNodeByLine(script):
+    # the line numbers of code objects start at 1
+    yield None
+    node = None
+    for line in script.splitlines():
+        strippedLine = line.strip()
+        if strippedLine.startswith("# Node: "):
+            node = parseNodeCommentLine(strippedLine)
+        yield node
+
+def parseNodeCommentLine(line):
+    # '# Node: {treeName} - {nodeName}' (see code_generator.getNodeCommentLine)
+    text = line[len("# Node: "):]
+    index = text.find(" - ")
+    while index != -1:
+        try: return literal_eval(text[:index]), literal_eval(text[index + 3:])
+        except (ValueError, SyntaxError): index = text.find(" - ", index + 1)
+    return None
+
+def removeUnusedScripts(codeObjects):
+    # code objects of units that don't exist anymore
+    usedCodes = set()
+    for codeObject in codeObjects:
+        if codeObject is not None:
+            usedCodes.update(iterCodeObjects(codeObject))
+    for code in list(nodeByLineByCode.keys()):
+        if code not in usedCodes:
+            del nodeByLineByCode[code]
+
+def iterCodeObjects(codeObject):
+    yield codeObject
+    for constant in codeObject.co_consts:
+        if hasattr(constant, "co_code"):
+            yield from iterCodeObjects(constant)
+
+
+
+# Sampling
+##########################################
+
+def updateSampling(enabled):
+    global _sampler
+    if enabled and _sampler is None:
+        _sampler = Sampler(threading.main_thread().ident)
+        _sampler.start()
+    elif not enabled and _sampler is not None:
+        _sampler.stop()
+        _sampler = None
+        nodeByLineByCode.clear()
+
+def isSampling():
+    return _sampler is not None
+
+def startSamplingExecution():
+    if _sampler is not None:
+        _sampler.activeEvent.set()
+
+def stopSamplingExecution():
+    if _sampler is not None:
+        _sampler.activeEvent.clear()
+
+class Sampler(threading.Thread):
+    '''
+    Only takes samples between startSamplingExecution and
+    stopSamplingExecution, otherwise the thread is blocked.
+    '''
+    def __init__(self, threadID):
+        super().__init__(daemon = True)
+        self.threadID = threadID
+        self.activeEvent = threading.Event()
+        self.stopEvent = threading.Event()
+
+    def run(self):
+        while True:
+            self.activeEvent.wait()
+            if self.stopEvent.is_set(): return
+            while self.activeEvent.is_set() and not self.stopEvent.wait(sampleInterval):
+                frame = sys._current_frames().get(self.threadID)
+                node = getExecutedNode(frame)
+                if node is not None:
+                    samplesByNode[node] += 1
+                    results.totalSamples += 1
+
+    def stop(self):
+        self.stopEvent.set()
+        self.activeEvent.set()
+        self.join()
+
+def getExecutedNode(frame):
+    # use the innermost generated frame to get the nodes inside of loops and groups
+    while frame is not None:
+        nodeByLine = nodeByLineByCode.get(frame.f_code)
+        if nodeByLine is not None and frame.f_lineno < len(nodeByLine):
+            return nodeByLine[frame.f_lineno]
+        frame = frame.f_back
+    return None
+
+
+
+# Drawing
+##########################################
+
+def drawSamplingResults():
+    tree = bpy.context.space_data.edit_tree
+    if tree is None: return
+    if tree.bl_idname != "an_AnimationNodeTree": return
+
+    nodes = tree.nodes
+    region = bpy.context.region
+    leftCorners = iterNodeCornerLocations(nodes, region, horizontal = "LEFT")
+    rightCorners = iterNodeCornerLocations(nodes, region, horizontal = "RIGHT")
+
+    for node, leftBottom, rightBottom in zip(nodes, leftCorners, rightCorners):
+        if node.isAnimationNode and not node.hide:
+            drawSamplingResultForNode(node, leftBottom, rightBottom)
+
+def drawSamplingResultForNode(node, leftBottom, rightBottom):
+    samples = samplesByNode.get((node.id_data.name, node.name), 0)
+    if samples == 0: text = "Not Sampled"
+    else: text = "{:.1f} % ({:,d} Samples)".format(getSamplePercentage(node.id_data.name, node.name), samples)
+
+    width = rightBottom.x - leftBottom.x
+
+    textBox = TextBox(text, leftBottom, width,
+                      fontSize = width / node.dimensions.x * 11)
+    textBox.padding = 3
+    textBox.draw()
+
+
+
+# Register
+##################################
+
+def unregister():
+    updateSampling(False)
@@ -0,0 +1,73 @@
+import bpy
+import json
+import threading
+from bpy.props import *
+from time import perf_counter
+from .. utils.operators import makeOperator
+
+'''
+The TRACE execution code type records when every node, loop iteration and
+subprogram invocation starts and ends. The events can be exported in the
+Chrome Trace Event format which can be opened in about:tracing or Perfetto.
+'''
+
+maxEventAmount = 2000000
+
+events = []
+
+def recordEvent(name, category, startTime, treeName, frame = None):
+    if len(events) >= maxEventAmount: return
+    events.append((name, category, startTime, perf_counter() - startTime,
+                   threading.get_ident(), treeName, frame))
+
+def getEventAmount():
+    return len(events)
+
+@makeOperator("an.clear_execution_trace", "Clear Execution Trace", redraw = True)
+def clearExecutionTrace():
+    events.clear()
+
+
+
+# Export
+##########################################
+
+def writeChromeTrace(path):
+    with open(path, "w") as f:
+        json.dump(getChromeTraceData(), f)
+
+def getChromeTraceData():
+    traceEvents = []
+    for name, category, startTime, duration, threadID, treeName, frame in events:
+        args = {"tree" : treeName}
+        if frame is not None: args["frame"] = frame
+        traceEvents.append({
+            "name" : name,
+            "cat" : category,
+            "ph" : "X",
+            "ts" : startTime * 1000000,
+            "dur" : duration * 1000000,
+            "pid" : 0,
+            "tid" : threadID,
+            "args" : args})
+    return {"traceEvents" : traceEvents, "displayTimeUnit" : "ms"}
+
+class ExportExecutionTrace(bpy.types.Operator):
+    bl_idname = "an.export_execution_trace"
+    bl_label = "Export Execution Trace"
+    bl_description = "Save the recorded execution trace as Chrome Trace Event JSON"
+
+    filepath = StringProperty(subtype = "FILE_PATH")
+    filter_glob = StringProperty(default = "*.json", options = {"HIDDEN"})
+
+    def invoke(self, context, event):
+        if self.filepath == "":
+            self.filepath = "animation_nodes_trace.json"
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        path = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".json")
+        writeChromeTrace(path)
+        self.report({"INFO"}, "{:,d} events written to {}".format(len(events), path))
+        return {"FINISHED"}
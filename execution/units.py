@@ -2,58 +2,110 @@ import traceback
 from .. import problems
 from collections import defaultdict
 from . cache import clearExecutionCache
-from . measurements import resetMeasurements
+from . process_pool import finishParallelExecution
+from . code_generator import requiredNodeIDs, isBlendDataFreeSubprogram
+from . measurements import resetMeasurements, updateMemoryTracing
+from . sampling import updateSampling, removeUnusedScripts
 from . main_execution_unit import MainExecutionUnit
 from . loop_execution_unit import LoopExecutionUnit
 from . group_execution_unit import GroupExecutionUnit
 from . script_execution_unit import ScriptExecutionUnit
+from .. preferences import getExecutionCodeType, getExecutionCodeSettings
 from .. tree_info import getNetworksByType, getSubprogramNetworks
-from .. utils.nodes import getAnimationNodeTrees, iterAnimationNodes
+from .. utils.handlers import eventHandler
+from .. utils.nodes import getAnimationNodeTrees
 from .. problems import ExceptionDuringCodeCreation, CouldNotSetupExecutionUnits
 
 _mainUnitsByNodeTree = defaultdict(list)
 _subprogramUnitsByIdentifier = {}
+_unitByFingerprint = {}
+_unitsAreSetup = False
 
 def createExecutionUnits(nodeByID):
+    reusableUnits = _unitByFingerprint.copy()
     reset()
     try:
-        createMainUnits(nodeByID)
-        createSubprogramUnits(nodeByID)
+        settings = getCodeSettingsFingerprint(nodeByID)
+        createMainUnits(nodeByID, reusableUnits, settings)
+        createSubprogramUnits(nodeByID, reusableUnits, settings)
+        removeUnusedScripts(iterUnitCodeObjects())
     except:
         print("\n"*5)
         traceback.print_exc()
         ExceptionDuringCodeCreation().report()
 
 def reset():
+    # units that are still set up reference data of the old trees
+    finishExecutionUnits()
     resetMeasurements()
+    updateMemoryTracing(getExecutionCodeType() == "MEMORY")
+    updateSampling(getExecutionCodeType() == "SAMPLE")
     _mainUnitsByNodeTree.clear()
     _subprogramUnitsByIdentifier.clear()
+    _unitByFingerprint.clear()
 
-    for node in iterAnimationNodes():
-        for socket in node.outputs:
-            socket.execution.neededCopies = 0
-
-def createMainUnits(nodeByID):
+def createMainUnits(nodeByID, reusableUnits, settings):
     for network in getNetworksByType("Main"):
-        unit = MainExecutionUnit(network, nodeByID)
+        unit = getUnit(MainExecutionUnit, network, nodeByID, reusableUnits, settings)
         _mainUnitsByNodeTree[network.treeName].append(unit)
 
-def createSubprogramUnits(nodeByID):
+def createSubprogramUnits(nodeByID, reusableUnits, settings):
     for network in getSubprogramNetworks():
         if network.type == "Group":
-            unit = GroupExecutionUnit(network, nodeByID)
+            unitClass = GroupExecutionUnit
         if network.type == "Loop":
-            unit = LoopExecutionUnit(network, nodeByID)
+            unitClass = LoopExecutionUnit
         if network.type == "Script":
-            unit = ScriptExecutionUnit(network, nodeByID)
+            unitClass = ScriptExecutionUnit
+        unit = getUnit(unitClass, network, nodeByID, reusableUnits, settings)
         _subprogramUnitsByIdentifier[network.identifier] = unit
 
+def getUnit(unitClass, network, nodeByID, reusableUnits, settings):
+    '''
+    Reuse the generated code of the last update when the
+    network did not change since then.
+    '''
+    fingerprint = (unitClass, settings, network.getStructureFingerprint(nodeByID))
+    unit = reusableUnits.pop(fingerprint, None)
+
+    if unit is None:
+        resetNeededCopies(network, nodeByID)
+        unit = unitClass(network, nodeByID)
+    else:
+        unit.network = network
+
+    # networks that failed to generate code have to report their problems again
+    if unit.setupScript != "":
+        _unitByFingerprint[fingerprint] = unit
+    return unit
+
+def getCodeSettingsFingerprint(nodeByID):
+    # invoke subprogram nodes generate different code when the subprogram does not exist
+    subprogramIdentifiers = tuple(sorted(network.identifier for network in getSubprogramNetworks()))
+    # and they are executed in another phase when the subprogram does not access blend data
+    blendDataFreeIdentifiers = tuple(sorted(network.identifier for network in getSubprogramNetworks()
+                                            if isBlendDataFreeSubprogram(network, nodeByID)))
+    settings = getExecutionCodeSettings()
+    optimizations = (settings.eliminateDeadNodes, settings.foldConstants,
+                     settings.useBatchLoops, settings.scheduleCopies)
+    return (getExecutionCodeType(), optimizations, subprogramIdentifiers,
+            blendDataFreeIdentifiers, tuple(sorted(requiredNodeIDs)))
+
+def resetNeededCopies(network, nodeByID):
+    for node in network.getAnimationNodes(nodeByID):
+        for socket in node.outputs:
+            socket.execution.neededCopies = 0
+            socket.execution.avoidedCopies = 0
+
 
 def setupExecutionUnits():
+    global _unitsAreSetup
     try:
         if len(getAnimationNodeTrees()) == 0: return
         if not problems.canExecute(): return
 
+        # the workers have to be forked again to know the new execution data
+        finishParallelExecution()
         for unit in getExecutionUnits():
             unit.setup()
 
@@ -63,16 +115,59 @@ def setupExecutionUnits():
 
         for unit in getExecutionUnits():
             unit.insertSubprogramFunctions(subprograms)
+        _unitsAreSetup = True
     except:
         print("\n"*5)
         traceback.print_exc()
         CouldNotSetupExecutionUnits().report()
 
+def invalidateConstants():
+    for units in _mainUnitsByNodeTree.values():
+        for unit in units:
+            unit.invalidateConstants()
+
+def resetAnimatedExecutionUnits():
+    '''
+    Keyframes and drivers change socket values without a property event.
+    The setup script reads the unlinked socket values and the constants
+    depend on them, so both are updated before every animated execution.
+    '''
+    if hasAnimatedNodeTrees():
+        invalidateConstants()
+        finishExecutionUnits()
+
+def hasAnimatedNodeTrees():
+    for nodeTree in getAnimationNodeTrees():
+        animationData = nodeTree.animation_data
+        if animationData is None: continue
+        if len(animationData.drivers) > 0 or len(animationData.nla_tracks) > 0: return True
+        if animationData.action is not None and len(animationData.action.fcurves) > 0: return True
+    return False
+
+def ensureExecutionUnitsAreSetup():
+    '''
+    The units stay set up between auto executions until
+    finishExecutionUnits is called (see event_handler.update).
+    '''
+    if not _unitsAreSetup:
+        setupExecutionUnits()
+
+def executionUnitsAreSetup():
+    return _unitsAreSetup
+
 def finishExecutionUnits():
+    global _unitsAreSetup
+    _unitsAreSetup = False
     for unit in getExecutionUnits():
         unit.finish()
 
     clearExecutionCache()
+    finishParallelExecution()
+
+@eventHandler("UNDO_POST")
+def undoPerformed():
+    # all references to blender data are invalid after an undo
+    finishExecutionUnits()
 
 
 def getMainUnitsByNodeTree(nodeTree):
@@ -92,6 +187,11 @@ def getExecutionUnitByNetwork(network):
     for unit in getExecutionUnits():
         if unit.network == network: return unit
 
+def iterUnitCodeObjects():
+    for unit in getExecutionUnits():
+        for name in ("setupCodeObject", "constantsCodeObject", "executeCodeObject"):
+            yield getattr(unit, name, None)
+
 def getExecutionUnits():
     units = []
     for mainUnits in _mainUnitsByNodeTree.values():
@@ -1,22 +1,32 @@
+import os
 import bpy
+import json
 from . import tree_info
 from mathutils import Vector
 from . utils.nodes import idToSocket
 from . sockets.info import toBaseIdName, isList
-from . tree_info import getAllDataLinkIDs, getDirectlyLinkedSocket
+from . preferences import getAnimationNodesVersion
+from . tree_info import getUncheckedDataLinkIDs, markDataLinksAsChecked, getDirectlyLinkedSocket
 
 def correctForbiddenNodeLinks():
+    '''
+    Only links that are new or whose data types changed are validated.
+    '''
     for dataOrigin, target in iterLinksThatNeedToBeCorrectedOrRemoved():
         directOrigin = getDirectlyLinkedSocket(target)
         if not tryToCorrectLink(dataOrigin, directOrigin, target):
             removeLink(directOrigin, target)
     tree_info.updateIfNecessary()
 
-approvedLinkTypes = set()
-
 def iterLinksThatNeedToBeCorrectedOrRemoved():
-    for originID, targetID, originType, targetType in getAllDataLinkIDs():
+    loadApprovedLinkTypes()
+    approvedAmount = len(approvedLinkTypes)
+
+    validLinkIDs = []
+    for linkID in getUncheckedDataLinkIDs():
+        originID, targetID, originType, targetType = linkID
         if (originType, targetType) in approvedLinkTypes:
+            validLinkIDs.append(linkID)
             continue
 
         origin = idToSocket(originID)
@@ -24,12 +34,59 @@ def iterLinksThatNeedToBeCorrectedOrRemoved():
 
         if isConnectionValid(origin, target):
             approvedLinkTypes.add((originType, targetType))
+            validLinkIDs.append(linkID)
         else:
             yield (origin, target)
 
+    # invalid links are checked again after they have been corrected
+    markDataLinksAsChecked(validLinkIDs)
+    if len(approvedLinkTypes) > approvedAmount:
+        saveApprovedLinkTypes()
+
 def isConnectionValid(origin, target):
     return origin.dataType in target.allowedInputTypes or target.allowedInputTypes[0] == "all"
 
+
+
+# Approved Link Types
+##########################################
+
+'''
+The approved data type pairs are stored in the user data files, so that
+they don't have to be found again in every session. The stored types are
+ignored when they have been approved by another version of the addon.
+'''
+
+approvedLinkTypes = set()
+_approvedLinkTypesLoaded = False
+
+def loadApprovedLinkTypes():
+    global _approvedLinkTypesLoaded
+    if _approvedLinkTypesLoaded: return
+    _approvedLinkTypesLoaded = True
+
+    try:
+        with open(getApprovedLinkTypesPath(), "r") as f:
+            data = json.load(f)
+        if tuple(data["version"]) == tuple(getAnimationNodesVersion()):
+            approvedLinkTypes.update(tuple(linkType) for linkType in data["linkTypes"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+def saveApprovedLinkTypes():
+    data = {
+        "version" : list(getAnimationNodesVersion()),
+        "linkTypes" : sorted(list(linkType) for linkType in approvedLinkTypes)}
+    try:
+        with open(getApprovedLinkTypesPath(), "w") as f:
+            json.dump(data, f)
+    except OSError:
+        pass
+
+def getApprovedLinkTypesPath():
+    directory = bpy.utils.user_resource("DATAFILES", path = "animation_nodes", create = True)
+    return os.path.join(directory, "approved_link_types.json")
+
 def tryToCorrectLink(dataOrigin, directOrigin, target):
     for corrector in linkCorrectors:
         if corrector.check(dataOrigin, target):
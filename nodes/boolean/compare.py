@@ -14,6 +14,7 @@ class CompareNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CompareNode"
     bl_label = "Compare"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     def assignedTypeChanged(self, context):
         self.generateSockets()
@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class InvertNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_InvertNode"
     bl_label = "Invert Boolean"
+    isPure = True
 
     def create(self):
         self.newInput("Boolean", "Input", "input")
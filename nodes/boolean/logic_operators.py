@@ -16,6 +16,7 @@ class LogicOperatorsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_LogicOperatorsNode"
     bl_label = "Logic Operators"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     operation = EnumProperty(name = "Operation", default = "AND",
         items = operationItems, update = executionCodeChanged)
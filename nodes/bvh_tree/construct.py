@@ -14,6 +14,7 @@ class ConstructBVHTreeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConstructBVHTreeNode"
     bl_label = "Construct BVHTree"
     bl_width_default = 160
+    isPure = True
 
     def sourceTypeChanged(self, context):
         self.recreateInputs()
@@ -18,6 +18,7 @@ class CombineColorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CombineColorNode"
     bl_label = "Combine Color"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     def sourceTypeChanged(self, context):
         self.recreateInputs()
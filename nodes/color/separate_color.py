@@ -18,6 +18,7 @@ class SeparateColorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparateColorNode"
     bl_label = "Separate Color"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     def targetTypeChanged(self, context):
         self.recreateOutputs()
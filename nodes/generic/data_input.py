@@ -8,6 +8,7 @@ class DataInputNode(bpy.types.Node, AnimationNode):
     bl_label = "Data Input"
     dynamicLabelType = "ALWAYS"
     onlySearchTags = True
+    isPure = True
 
     @classmethod
     def getSearchTags(cls):
@@ -13,6 +13,7 @@ dataDirectionItems = {
 class DataInterfaceNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DataInterfaceNode"
     bl_label = "Data Interface"
+    hasSideEffects = True
 
     def dataDirectionChanged(self, context):
         self.recreateSocket()
@@ -14,6 +14,7 @@ class DebugDrawerNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DebugDrawerNode"
     bl_label = "Debug Drawer"
     bl_width_default = 270
+    hasSideEffects = True
 
     maxRows = IntProperty(name = "Max Rows", default = 150, min = 0)
     fontSize = IntProperty(name = "Font Size", default = 12, min = 1, max = 1000)
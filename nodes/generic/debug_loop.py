@@ -9,6 +9,7 @@ class DebugLoopNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DebugLoopNode"
     bl_label = "Debug Loop"
     bl_width_default = 160
+    hasSideEffects = True
 
     textBlockName = StringProperty(name = "Text")
 
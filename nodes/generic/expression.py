@@ -14,6 +14,7 @@ class ExpressionNode(bpy.types.Node, AnimationNode):
     bl_label = "Expression"
     bl_width_default = 210
     dynamicLabelType = "HIDDEN_ONLY"
+    hasSideEffects = True
 
     def settingChanged(self, context = None):
         self.errorMessage = ""
@@ -12,6 +12,7 @@ class DebugInterpolationNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_DebugInterpolationNode"
     bl_label = "Debug Interpolation"
     bl_width_default = 160
+    hasSideEffects = True
 
     resolution = IntProperty(name = "Resolution", min = 5, default = 40)
 
@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class ConstructKDTreeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ConstructKDTreeNode"
     bl_label = "Construct KDTree"
+    isPure = True
 
     def create(self):
         self.newInput("Vector List", "Vector List", "vectorList")
@@ -8,6 +8,7 @@ class CombineListsNode(bpy.types.Node, AnimationNode):
     bl_label = "Combine Lists"
     dynamicLabelType = "ALWAYS"
     onlySearchTags = True
+    isPure = True
 
     @classmethod
     def getSearchTags(cls):
@@ -9,6 +9,7 @@ class CreateListNode(bpy.types.Node, AnimationNode):
     bl_label = "Create List"
     dynamicLabelType = "ALWAYS"
     onlySearchTags = True
+    isPure = True
 
     @classmethod
     def getSearchTags(cls):
@@ -9,6 +9,7 @@ class GetListElementNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GetListElementNode"
     bl_label = "Get List Element"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     def assignedTypeChanged(self, context):
         self.generateSockets()
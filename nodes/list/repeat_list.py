@@ -19,6 +19,7 @@ amountTypeItems = [
 class RepeatListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_RepeatListNode"
     bl_label = "Repeat List"
+    isPure = True
 
     def assignedTypeChanged(self, context):
         self.generateSockets()
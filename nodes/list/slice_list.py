@@ -12,6 +12,7 @@ class SliceListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SliceListNode"
     bl_label = "Slice List"
     bl_width_default = 170
+    isPure = True
 
     def settingChanged(self, context):
         self.generateSockets()
@@ -14,6 +14,7 @@ pivotTypeItems = [
 class ChangeMatrixPivotNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ChangeMatrixPivotNode"
     bl_label = "Change Matrix Pivot"
+    isPure = True
 
     def pivotTypeChanged(self, context):
         self.generateSockets()
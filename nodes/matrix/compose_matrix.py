@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class ComposeMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ComposeMatrixNode"
     bl_label = "Compose Matrix"
+    isPure = True
 
     def create(self):
         self.newInput("Vector", "Translation", "translation")
@@ -8,6 +8,7 @@ operationItems = [("MULTIPLY", "Multiply", "")]
 class MatrixMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MatrixMathNode"
     bl_label = "Matrix Math"
+    isPure = True
 
     operation = EnumProperty(name = "Operation", items = operationItems,
         update = executionCodeChanged)
@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class ScaleMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ScaleMatrixNode"
     bl_label = "Scale Matrix"
+    isPure = True
 
     def create(self):
         self.newInput("Vector", "Scale", "scale", value = [1, 1, 1])
@@ -11,3 +12,6 @@ class ScaleMatrixNode(bpy.types.Node, AnimationNode):
 
     def getExecutionCode(self):
         return ("matrix = animation_nodes.utils.math.scaleMatrix(scale)")
+
+    def getBatchExecutionCode(self):
+        return "matrix = batch.scaleMatrices(scale)"
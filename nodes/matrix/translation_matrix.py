@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class TranslationMatrixNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TranslationMatrixNode"
     bl_label = "Translation Matrix"
+    isPure = True
 
     def create(self):
         self.newInput("Vector", "Translation", "translation")
@@ -11,3 +12,6 @@ class TranslationMatrixNode(bpy.types.Node, AnimationNode):
 
     def getExecutionCode(self):
         return "matrix = Matrix.Translation(translation)"
+
+    def getBatchExecutionCode(self):
+        return "matrix = batch.translationMatrices(translation)"
@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class CreateEdgeIndicesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CreateEdgeIndicesNode"
     bl_label = "Create Edge Indices"
+    isPure = True
 
     def create(self):
         self.newInput("Integer", "Index 1", "index1").value = 0
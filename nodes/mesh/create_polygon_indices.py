@@ -5,6 +5,7 @@ from ... base_types.node import AnimationNode
 class CreatePolygonIndicesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CreatePolygonIndicesNode"
     bl_label = "Create Polygon Indices"
+    isPure = True
 
     errorMessage = StringProperty()
 
@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class an_EdgesOfPolygonsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EdgesOfPolygonsNode"
     bl_label = "Edges of Polygons"
+    isPure = True
 
     def create(self):
         self.newInput("Polygon Indices List", "Polygons", "polygons")
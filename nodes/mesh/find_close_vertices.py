@@ -5,6 +5,7 @@ from ... base_types.node import AnimationNode
 class FindCloseVerticesNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FindCloseVerticesNode"
     bl_label = "Find Close Vertices"
+    isPure = True
 
     def create(self):
         self.newInput("Vector List", "Vertices", "vertices")
@@ -10,6 +10,7 @@ class GridMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GridMeshNode"
     bl_label = "Grid Mesh"
     bl_width_default = 160
+    isPure = True
 
     centerGrid = BoolProperty(name = "Center", default = True, update = executionCodeChanged)
 
@@ -4,6 +4,7 @@ from .... base_types.node import AnimationNode
 class LineMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_LineMeshNode"
     bl_label = "Line Mesh"
+    isPure = True
 
     def create(self):
         self.newInput("Vector", "Start", "start")
@@ -5,6 +5,7 @@ from ... data_structures.mesh import MeshData
 class MeshDataFromPolygonsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MeshDataFromPolygonsNode"
     bl_label = "Mesh Data from Polygons"
+    isPure = True
 
     def create(self):
         self.newInput("Polygon List", "Polygons", "polygons", dataIsModified = True)
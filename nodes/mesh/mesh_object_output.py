@@ -5,6 +5,7 @@ from bpy.props import *
 from ... utils.layout import writeText
 from ... tree_info import keepNodeState
 from ... base_types.node import AnimationNode
+from ... data_structures.vector_list import VectorList
 
 meshDataTypeItems = [
     ("MESH_DATA", "Mesh Data", "Mesh Data object that contains only vertex locations, edge indices and polygon indices", "", 0),
@@ -18,6 +19,8 @@ class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
     searchTags = [("Set Mesh Data on Object (old)", {"meshDataType" : repr("MESH_DATA")}),
                   ("Set BMesh on Object (old)", {"meshDataType" : repr("BMESH")}),
                   ("Set Vertices on Object (old)", {"meshDataType" : repr("VERTICES")}) ]
+    hasSideEffects = True
+    acceptsVectorList = True
 
     def meshDataTypeChanged(self, context):
         self.recreateInputs()
@@ -119,8 +122,11 @@ class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
             self.errorMessage = "The vertex amounts are not equal"
             return object
 
-        flatVertices = list(itertools.chain.from_iterable(vertices))
-        mesh.vertices.foreach_set("co", flatVertices)
+        if isinstance(vertices, VectorList):
+            vertices.writeToBlenderCollection(mesh.vertices, "co")
+        else:
+            flatVertices = list(itertools.chain.from_iterable(vertices))
+            mesh.vertices.foreach_set("co", flatVertices)
         mesh.update()
 
     def setMaterialIndices(self, mesh, materialIndices):
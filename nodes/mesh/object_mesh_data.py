@@ -4,6 +4,7 @@ from ... events import isRendering
 from ... utils.math import extractRotation
 from ... base_types.node import AnimationNode
 from ... data_structures.mesh import Polygon, Vertex
+from ... data_structures.vector_list import VectorList, isAcceptedByTargets
 
 class ObjectMeshDataNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectMeshDataNode"
@@ -32,7 +33,8 @@ class ObjectMeshDataNode(bpy.types.Node, AnimationNode):
         yield "    meshName = mesh.name"
 
         if isLinked["vertexLocations"] or isLinked["polygons"]:
-            yield "    vertexLocations = self.getVertexLocations(mesh, object, useWorldSpace, {})".format(repr(isLinked["vertexLocations"]))
+            asVectorList = not isLinked["polygons"] and isAcceptedByTargets(self.outputs["Vertex Locations"])
+            yield "    vertexLocations = self.getVertexLocations(mesh, object, useWorldSpace, {})".format(asVectorList)
         if isLinked["edgeIndices"]:
             yield "    edgeIndices = self.getEdgeIndices(mesh)"
         if isLinked["polygonIndices"]:
@@ -56,13 +58,11 @@ class ObjectMeshDataNode(bpy.types.Node, AnimationNode):
         if useModifiers and scene is not None: bpy.data.meshes.remove(mesh)
 
 
-    def getVertexLocations(self, mesh, object, useWorldSpace, copyVertices):
+    def getVertexLocations(self, mesh, object, useWorldSpace, asVectorList = False):
+        vertexLocations = VectorList.fromBlenderCollection(mesh.vertices, "co")
         if useWorldSpace:
-            matrix = object.matrix_world
-            return [matrix * v.co for v in mesh.vertices]
-        else:
-            if copyVertices: return [v.co.copy() for v in mesh.vertices]
-            else: return [v.co for v in mesh.vertices]
+            vertexLocations.transform(object.matrix_world)
+        return vertexLocations if asVectorList else vertexLocations.toList()
 
     def getEdgeIndices(self, mesh):
         return [tuple(edge.vertices) for edge in mesh.edges]
@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class SeparateMeshDataNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparateMeshDataNode"
     bl_label = "Separate Mesh Data"
+    isPure = True
 
     def create(self):
         self.newInput("Mesh Data", "Mesh Data", "meshData").dataIsModified = True
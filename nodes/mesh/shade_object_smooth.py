@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class ShadeObjectSmooth(bpy.types.Node, AnimationNode):
     bl_idname = "an_ShadeObjectSmoothNode"
     bl_label = "Shade Object Smooth"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Object", "Object", "object").defaultDrawType = "PROPERTY_ONLY"
@@ -7,6 +7,7 @@ class FloatClampNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FloatClampNode"
     bl_label = "Clamp"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     def create(self):
         self.newInput("Float", "Value", "value")
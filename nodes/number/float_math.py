@@ -39,6 +39,22 @@ stepSizeInputOperations = ("SNAP", )
 
 operationLabels = {item[0] : item[2] for item in operationItems}
 
+batchOperations = {
+    "ADD" : "a + b",
+    "SUBTRACT" : "a - b",
+    "MULTIPLY" : "a * b",
+    "DIVIDE" : "batch.divide(a, b)",
+    "SINE" : "numpy.sin(a)",
+    "COSINE" : "numpy.cos(a)",
+    "TANGENT" : "numpy.tan(a)",
+    "ARCTANGENT" : "numpy.arctan(a)",
+    "MINIMUM" : "numpy.minimum(a, b)",
+    "MAXIMUM" : "numpy.maximum(a, b)",
+    "ABSOLUTE" : "numpy.abs(a)",
+    "FLOOR" : "numpy.floor(a)",
+    "CEILING" : "numpy.ceil(a)",
+    "INVERT" : "- a" }
+
 searchItems = {
     "Add Numbers" : "ADD",
     "Subtract Numbers" : "SUBTRACT",
@@ -52,6 +68,7 @@ class FloatMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FloatMathNode"
     bl_label = "Math"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     @classmethod
     def getSearchTags(cls):
@@ -137,6 +154,14 @@ class FloatMathNode(bpy.types.Node, AnimationNode):
         if self.outputs[0].dataType == "Integer":
             yield "result = int(result)"
 
+    def getBatchExecutionCode(self):
+        op = self.operation
+        if op not in batchOperations: return None
+        lines = ["result = " + batchOperations[op]]
+        if self.outputs[0].dataType == "Integer":
+            lines.append("result = result.astype(int)")
+        return lines
+
     def getUsedModules(self):
         return ["math"]
 
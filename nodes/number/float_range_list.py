@@ -7,6 +7,7 @@ class FloatRangeListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FloatRangeListNode"
     bl_label = "Number Range"
     dynamicLabelType = "ALWAYS"
+    isPure = True
 
     onlySearchTags = True
     searchTags = [ ("Float Range", {"dataType" : repr("Float")}),
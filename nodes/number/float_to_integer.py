@@ -11,6 +11,7 @@ class FloatToIntegerNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FloatToIntegerNode"
     bl_label = "Float to Integer"
     dynamicLabelType = "ALWAYS"
+    isPure = True
 
     type = EnumProperty(name = "Conversion Type", items = items, default = "FLOOR", update = executionCodeChanged)
 
@@ -7,6 +7,7 @@ class MapRangeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MapRangeNode"
     bl_label = "Map Range"
     bl_width_default = 170
+    isPure = True
 
     def settingChanged(self, context):
         self.recreateInputs()
@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class CopyObjectDataNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CopyObjectDataNode"
     bl_label = "Copy Object Data"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Object", "From", "fromObject")
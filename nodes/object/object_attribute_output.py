@@ -8,6 +8,7 @@ class ObjectAttributeOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectAttributeOutputNode"
     bl_label = "Object Attribute Output"
     bl_width_default = 160
+    hasSideEffects = True
 
     attribute = StringProperty(name = "Attribute", default = "",
         update = executionCodeChanged)
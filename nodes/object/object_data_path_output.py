@@ -5,6 +5,7 @@ from ... base_types.node import AnimationNode
 class ObjectDataPathOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectDataPathOutputNode"
     bl_label = "Object Data Path Output"
+    hasSideEffects = True
 
     errorMessage = StringProperty()
 
@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class ObjectGroupOperationsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectGroupOperationsNode"
     bl_label = "Object Group Operations"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Object Group", "Group", "group", defaultDrawType = "PROPERTY_ONLY")
@@ -38,6 +38,7 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
     bl_label = "Object Instancer"
     options = {"No Subprogram"}
     searchTags = ["Object Replicator (old)"]
+    hasSideEffects = True
 
     def copyFromSourceChanged(self, context):
         self.updateInputSockets()
@@ -10,6 +10,7 @@ layerChoosingTypeItems = [
 class ObjectLayerVisibilityOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectLayerVisibilityOutputNode"
     bl_label = "Object Layer Visibility Output"
+    hasSideEffects = True
 
     def layerChoosingTypeChanged(self, context):
         self.recreateLayerInputSockets()
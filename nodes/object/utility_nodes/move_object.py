@@ -4,6 +4,7 @@ from .... base_types.node import AnimationNode
 class MoveObjectNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MoveObjectNode"
     bl_label = "Move Object"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Object", "Object", "object").defaultDrawType = "PROPERTY_ONLY"
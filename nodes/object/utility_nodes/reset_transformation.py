@@ -4,6 +4,7 @@ from .... base_types.node import AnimationNode
 class ResetObjectTransformsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ResetObjectTransformsNode"
     bl_label = "Reset Object Transforms"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Object", "Object", "object").defaultDrawType = "PROPERTY_ONLY"
@@ -7,6 +7,7 @@ from .... base_types.node import AnimationNode
 class TransformObjectNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TransformObjectNode"
     bl_label = "Transform Object"
+    hasSideEffects = True
 
     useCenter = BoolProperty(name = "Use Center", default = True,
         description = "Use the object location as origin", update = propertyChanged)
@@ -19,6 +19,7 @@ class ConvertRotationsNode(bpy.types.Node, AnimationNode):
     bl_label = "Convert Rotations"
     bl_width_default = 160
     dynamicLabelType = "ALWAYS"
+    isPure = True
 
     onlySearchTags = True
     searchTags = [(name, {"conversionType" : repr(type)}) for type, name, _,_,_ in conversionTypeItems]
@@ -30,6 +30,7 @@ class EulerMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EulerMathNode"
     bl_label = "Euler Math"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     def operationChanged(self, context):
         self.createInputs()
@@ -42,6 +42,7 @@ class QuaternionMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_QuaternionMathNode"
     bl_label = "Quaternion Math"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     def operationChanged(self, context):
         self.createInputs()
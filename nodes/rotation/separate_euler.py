@@ -6,6 +6,7 @@ from ... base_types.node import AnimationNode
 class SeparateEulerNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparateEulerNode"
     bl_label = "Separate Euler"
+    isPure = True
 
     useDegree = BoolProperty(name = "Use Degree", default = False,
         update = executionCodeChanged)
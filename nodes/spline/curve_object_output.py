@@ -8,6 +8,7 @@ class CurveObjectOutputNode(bpy.types.Node, AnimationNode):
     bl_label = "Curve Object Output"
     bl_width_default = 175
     searchTags = ["Set Splines on Object (old)"]
+    hasSideEffects = True
 
     errorMessage = StringProperty()
 
@@ -10,6 +10,7 @@ class GroupOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GroupOutputNode"
     bl_label = "Group Output"
     bl_width_default = 180
+    editDependsOnNetwork = True
 
     def inputNodeIdentifierChanged(self, context):
         subprogramInterfaceChanged()
@@ -5,6 +5,7 @@ from ... events import executionCodeChanged
 from ... base_types.node import AnimationNode
 from ... utils.blender_ui import getDpiFactor
 from ... utils.enum_items import enumItemsFromDicts
+from ... execution.code_generator import isBlendDataFreeSubprogram
 from ... utils.nodes import newNodeAtCursor, invokeTranslation
 from ... tree_info import getSubprogramNetworks, getNodeByIdentifier, getNetworkByIdentifier
 
@@ -22,6 +23,7 @@ class InvokeSubprogramNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_InvokeSubprogramNode"
     bl_label = "Invoke Subprogram"
     bl_width_default = 170
+    hasSideEffects = True
 
     def subprogramIdentifierChanged(self, context):
         self.updateSockets()
@@ -71,6 +73,13 @@ class InvokeSubprogramNode(bpy.types.Node, AnimationNode):
             if outputString != "": lines.append("{} = groupOutputData".format(outputString))
             return lines
 
+    def isBlendDataFree(self, nodeByID, invokedIdentifiers = frozenset()):
+        # the caches are not shared with other processes
+        if self.cacheType != "DISABLED" and self.canCache: return False
+        network = self.subprogramNetwork
+        if network is None: return False
+        return isBlendDataFreeSubprogram(network, nodeByID, invokedIdentifiers)
+
     def getCachedData(self, *args):
         if self.cacheType == "ONE_TIME":
             try: return True, oneTimeCache[self.identifier]
@@ -2,7 +2,7 @@ import re
 import bpy
 from bpy.props import *
 from operator import attrgetter
-from ... events import networkChanged
+from ... events import networkChanged, executionCodeChanged
 from ... utils.names import getRandomString
 from ... utils.layout import splitAlignment
 from ... tree_info import getNodeByIdentifier
@@ -17,6 +17,10 @@ class LoopInputNode(bpy.types.Node, AnimationNode, SubprogramBaseNode):
     bl_label = "Loop Input"
     bl_width_default = 180
 
+    parallel = BoolProperty(name = "Parallel", default = False, update = executionCodeChanged,
+        description = ("Split the iterators into chunks and process them in multiple processes. "
+                       "Only used when all nodes in the loop are pure"))
+
     def create(self):
         self.randomizeNetworkColor()
         self.subprogramName = "My Loop"
@@ -37,6 +41,8 @@ class LoopInputNode(bpy.types.Node, AnimationNode, SubprogramBaseNode):
         col.label("Description:")
         col.prop(self, "subprogramDescription", text = "")
 
+        layout.prop(self, "parallel")
+
         layout.separator()
 
         col = layout.column()
@@ -25,6 +25,7 @@ class SeparateTextObjectNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparateTextObjectNode"
     bl_label = "Separate Text Object"
     bl_width_default = 200
+    hasSideEffects = True
 
     sourceObjectName = StringProperty(name = "Source Object")
     currentID = IntProperty(default = 0)
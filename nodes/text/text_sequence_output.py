@@ -7,6 +7,7 @@ class TextSequenceOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TextSequenceOutputNode"
     bl_label = "Text Sequence Output"
     bl_width_default = 160
+    hasSideEffects = True
 
     errorMessage = StringProperty()
 
@@ -5,6 +5,7 @@ class CombineVectorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_CombineVectorNode"
     bl_label = "Combine Vector"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     def create(self):
         self.newInput("Float", "X", "x")
@@ -21,3 +22,6 @@ class CombineVectorNode(bpy.types.Node, AnimationNode):
 
     def getExecutionCode(self):
         return "vector = Vector((x, y, z))"
+
+    def getBatchExecutionCode(self):
+        return "vector = batch.combineVectors(x, y, z)"
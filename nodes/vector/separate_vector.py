@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class SeparateVectorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SeparateVectorNode"
     bl_label = "Separate Vector"
+    isPure = True
 
     def create(self):
         self.newInput("Vector", "Vector", "vector")
@@ -16,3 +17,9 @@ class SeparateVectorNode(bpy.types.Node, AnimationNode):
         if isLinked["x"]: yield "x = vector[0]"
         if isLinked["y"]: yield "y = vector[1]"
         if isLinked["z"]: yield "z = vector[2]"
+
+    def getBatchExecutionCode(self):
+        isLinked = self.getLinkedOutputsDict()
+        if isLinked["x"]: yield "x = vector[:, 0].astype(float)"
+        if isLinked["y"]: yield "y = vector[:, 1].astype(float)"
+        if isLinked["z"]: yield "z = vector[:, 2].astype(float)"
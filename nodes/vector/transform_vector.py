@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class TransformVectorNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TransformVectorNode"
     bl_label = "Transform Vector"
+    isPure = True
 
     def create(self):
         self.newInput("Vector", "Vector", "vector")
@@ -12,3 +13,6 @@ class TransformVectorNode(bpy.types.Node, AnimationNode):
 
     def getExecutionCode(self):
         return "transformedVector = matrix * vector"
+
+    def getBatchExecutionCode(self):
+        return "transformedVector = batch.transformVectors(matrix, vector)"
@@ -1,9 +1,12 @@
 import bpy
 from ... base_types.node import AnimationNode
+from ... data_structures.vector_list import VectorList, isAcceptedByTargets
 
 class TransformVectorListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TransformVectorListNode"
     bl_label = "Transform Vector List"
+    isPure = True
+    acceptsVectorList = True
 
     def create(self):
         self.newInput("Vector List", "Vector List", "vectors")
@@ -11,4 +14,11 @@ class TransformVectorListNode(bpy.types.Node, AnimationNode):
         self.newOutput("Vector List", "Vectors List", "transformedVectors")
 
     def getExecutionCode(self):
-        return "transformedVectors = [matrix * vector for vector in vectors]"
+        keepVectorList = isAcceptedByTargets(self.outputs[0])
+        return "transformedVectors = self.transformVectors(vectors, matrix, {})".format(keepVectorList)
+
+    def transformVectors(self, vectors, matrix, keepVectorList = False):
+        if isinstance(vectors, VectorList):
+            vectors = vectors.transformed(matrix)
+            return vectors if keepVectorList else vectors.toList()
+        return [matrix * vector for vector in vectors]
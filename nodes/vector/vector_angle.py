@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class VectorAngleNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorAngleNode"
     bl_label = "Vector Angle"
+    isPure = True
 
     def create(self):
         self.newInput("Vector", "A", "a", value = [1, 0, 0])
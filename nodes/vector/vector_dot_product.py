@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class VectorDotProductNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorDotProductNode"
     bl_label = "Vector Dot Product"
+    isPure = True
 
     def create(self):
         self.newInput("Vector", "A", "a")
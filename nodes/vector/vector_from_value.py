@@ -4,6 +4,7 @@ from ... base_types.node import AnimationNode
 class VectorFromValueNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorFromValueNode"
     bl_label = "Vector from Value"
+    isPure = True
 
     def create(self):
         self.newInput("Float", "Value", "value")
@@ -44,6 +44,7 @@ class VectorMathNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_VectorMathNode"
     bl_label = "Vector Math"
     dynamicLabelType = "HIDDEN_ONLY"
+    isPure = True
 
     @classmethod
     def getSearchTags(cls):
@@ -99,6 +100,17 @@ class VectorMathNode(bpy.types.Node, AnimationNode):
             yield "if stepSize.y != 0: result.y = round(a.y / stepSize.y) * stepSize.y"
             yield "if stepSize.z != 0: result.z = round(a.z / stepSize.z) * stepSize.z"
 
+    def getBatchExecutionCode(self):
+        op = self.operation
+        if op == "ADD": return "result = a + b"
+        elif op == "SUBTRACT": return "result = a - b"
+        elif op == "MULTIPLY": return "result = a * b"
+        elif op == "CROSS": return "result = numpy.cross(a, b)"
+        elif op == "NORMALIZE": return "result = batch.normalizeVectors(a) * scale[:, None]"
+        elif op == "SCALE": return "result = a * scale[:, None]"
+        elif op == "ABSOLUTE": return "result = numpy.abs(a)"
+        return None
+
 
     def getUsedModules(self):
         return ["mathutils"]
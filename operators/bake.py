@@ -1,37 +1,26 @@
 import bpy
+import time
 from bpy.props import *
-from .. preferences import getPreferences
+from .. problems import canExecute
+from .. utils.blender_ui import redrawAll
+from .. execution.bake import bakeFrameRange
 
 class BakeAnimation(bpy.types.Operator):
     bl_idname = "an.bake_to_keyframes"
     bl_label = "Bake to Keyframes"
-    bl_description = "Playback animation and make keyframes (only supported nodes)"
+    bl_description = "Execute all frames and make keyframes (only supported nodes)"
 
     startFrame = IntProperty(default = 1)
     endFrame = IntProperty(default = 250)
 
-    def invoke(self, context, event):
-        context.window_manager.modal_handler_add(self)
-        self.timer = context.window_manager.event_timer_add(0.001, context.window)
+    @classmethod
+    def poll(cls, context):
+        return canExecute()
 
-        getPreferences().executionCode.type = "BAKE"
-
-        self.scene = context.scene
-        self.scene.frame_set(self.startFrame)
-        return {"RUNNING_MODAL"}
-
-    def modal(self, context, event):
-        currentFrame = self.scene.frame_current
-
-        if event.type == "TIMER":
-            self.scene.frame_set(currentFrame + 1)
-
-        if event.type in {"RIGHTMOUSE", "ESC"} or self.scene.frame_current == self.endFrame:
-            return self.finish()
-
-        return {"RUNNING_MODAL"}
-
-    def finish(self):
-        getPreferences().executionCode.type = "DEFAULT"
-        bpy.context.window_manager.event_timer_remove(self.timer)
+    def execute(self, context):
+        start = time.perf_counter()
+        fcurveAmount = bakeFrameRange(self.startFrame, self.endFrame, scene = context.scene)
+        duration = time.perf_counter() - start
+        redrawAll()
+        self.report({"INFO"}, "Baked {} F-Curves in {:.2f} s".format(fcurveAmount, duration))
         return {"FINISHED"}
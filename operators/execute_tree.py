@@ -1,7 +1,9 @@
 import bpy
+import time
 from bpy.props import *
 from .. problems import canExecute
 from .. utils.blender_ui import redrawAll
+from .. execution.frame_range import executeFrameRange
 
 class ExecuteNodeTree(bpy.types.Operator):
     bl_idname = "an.execute_tree"
@@ -23,3 +25,38 @@ class ExecuteNodeTree(bpy.types.Operator):
                 return {"FINISHED"}
         self.report({"ERROR"}, "{} is no animation nodes tree".format(repr(self.name)))
         return {"CANCELLED"}
+
+class ExecuteNodeTreeFrameRange(bpy.types.Operator):
+    bl_idname = "an.execute_tree_frame_range"
+    bl_label = "Execute Frame Range"
+    bl_description = "Execute all main networks in the tree for every frame in the range without redrawing in between"
+
+    name = StringProperty(name = "Node Tree Name")
+    startFrame = IntProperty(name = "Start Frame", default = 1)
+    endFrame = IntProperty(name = "End Frame", default = 250)
+    step = IntProperty(name = "Step", default = 1, min = 1)
+    setFrames = BoolProperty(name = "Set Frames", default = True,
+        description = "Evaluate the scene for every frame (otherwise only the current frame changes)")
+
+    @classmethod
+    def poll(cls, context):
+        return canExecute()
+
+    def invoke(self, context, event):
+        self.startFrame = context.scene.frame_start
+        self.endFrame = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        nodeTree = bpy.data.node_groups.get(self.name)
+        if nodeTree is None or nodeTree.bl_idname != "an_AnimationNodeTree":
+            self.report({"ERROR"}, "{} is no animation nodes tree".format(repr(self.name)))
+            return {"CANCELLED"}
+
+        start = time.perf_counter()
+        frames, _ = executeFrameRange(nodeTree, self.startFrame, self.endFrame,
+                                      step = self.step, setFrames = self.setFrames, scene = context.scene)
+        duration = time.perf_counter() - start
+        redrawAll()
+        self.report({"INFO"}, "Executed {} frames in {:.2f} s".format(len(frames), duration))
+        return {"FINISHED"}
@@ -65,5 +65,7 @@ def execute_ScriptGeneration():
     from .. execution import units
     from .. utils.nodes import createNodeByIdDict
     nodeByID = createNodeByIdDict()
+    # make sure that no previously generated code is reused
+    units.reset()
     units.createExecutionUnits(nodeByID)
     nodeByID.clear()
@@ -93,12 +93,37 @@ class ExecutionCodeProperties(bpy.types.PropertyGroup):
         ("DEFAULT", "Default", "", "NONE", 0),
         ("MONITOR", "Monitor Execution", "", "NONE", 1),
         ("MEASURE", "Measure Execution Times", "", "NONE", 2),
-        ("BAKE", "Bake", "", "NONE", 3)]
+        ("BAKE", "Bake", "", "NONE", 3),
+        ("MEMORY", "Measure Memory Usage", "", "NONE", 4),
+        ("SAMPLE", "Sample Execution Times", "", "NONE", 5),
+        ("TRACE", "Record Execution Trace", "", "NONE", 6)]
 
     type = EnumProperty(name = "Execution Code Type", default = "DEFAULT",
         description = "Different execution codes can be useful in different contexts",
         update = settingChanged, items = executionCodeTypeItems)
 
+    eliminateDeadNodes = BoolProperty(name = "Eliminate Dead Nodes", default = True,
+        description = "Don't execute nodes whose results are not used by a node with side effects",
+        update = settingChanged)
+
+    foldConstants = BoolProperty(name = "Fold Constants", default = True,
+        description = "Compute nodes that only depend on constant values once when the execution is set up",
+        update = settingChanged)
+
+    useBatchLoops = BoolProperty(name = "Batch Loops", default = True,
+        description = "Execute loops only once for all iterations when all nodes in them support it",
+        update = settingChanged)
+
+    scheduleCopies = BoolProperty(name = "Schedule Copies", default = True,
+        description = "Execute a node that modifies a value after all nodes that only read it to avoid a copy",
+        update = settingChanged)
+
+    useDiskCache = BoolProperty(name = "Use Disk Cache", default = False,
+        description = "Store compiled execution code on disk so that it can be reused after a restart")
+
+    diskCacheSize = IntProperty(name = "Disk Cache Size", default = 50, min = 1,
+        description = "Maximum size of the compiled code cache on disk in MB")
+
 class AddonPreferences(bpy.types.AddonPreferences):
     bl_idname = addonName
 
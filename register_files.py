@@ -6,6 +6,9 @@ from . import id_keys
 from . import draw_handler
 from . ui import node_panel
 from . ui import node_colors
+from . execution import sampling
+from . execution import process_pool
+from . execution import measurements
 from . import extend_bpy_types
 from . operators import dynamic_operators
 from . base_types import node as node_base
@@ -41,6 +44,9 @@ def unregisterFiles():
     dynamic_operators.unregister()
     node_panel.unregister()
     utils.handlers.unregisterHandlers()
+    process_pool.finishParallelExecution()
+    measurements.unregister()
+    sampling.unregister()
 
     unregisterMenu()
     keymap.unregister()
@@ -3,6 +3,7 @@ from bpy.props import *
 from mathutils import Vector
 from .. events import propertyChanged
 from .. base_types.socket import AnimationNodeSocket
+from .. data_structures.vector_list import VectorList
 
 class VectorSocket(bpy.types.NodeSocket, AnimationNodeSocket):
     bl_idname = "an_VectorSocket"
@@ -68,10 +69,13 @@ class VectorListSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def getCopyExpression(cls):
-        return "[element.copy() for element in value]"
+        # array backed vector lists are copied with one buffer copy
+        return "[element.copy() for element in value] if isinstance(value, list) else value.copy()"
 
     @classmethod
     def correctValue(cls, value):
+        if isinstance(value, VectorList):
+            return value, 0
         if isinstance(value, list):
             if all(isinstance(element, Vector) for element in value):
                 return value, 0
@@ -1,15 +1,17 @@
 from .. utils.timing import measureTime
 from .. utils.handlers import eventHandler
-from .. utils.nodes import idToNode, idToSocket, createNodeByIdDict
+from .. utils.nodes import idToNode, idToSocket, findSocketWithIndex
 
 
 def __setup():
     from . forest_data import ForestData
     from . networks import NodeNetworks
 
-    global _needsUpdate, _forestData, _networks
+    global _needsUpdate, _needsFullUpdate, _changedTreeNames, _forestData, _networks
 
     _needsUpdate = True
+    _needsFullUpdate = True
+    _changedTreeNames = set()
     _forestData = ForestData()
     _networks = NodeNetworks()
 
@@ -28,27 +30,61 @@ def updateAndRetryOnException(function):
 # Public API
 ##################################
 
-@eventHandler("FILE_LOAD_POST")
 @measureTime
 def update():
-    _forestData.update()
-
-    nodeByID = createNodeByIdDict()
-    _networks.update(_forestData, nodeByID)
-    nodeByID.clear()
-
-    global _needsUpdate
+    '''
+    Only the trees that changed since the last update are analysed again.
+    '''
+    global _needsUpdate, _needsFullUpdate
+
+    try:
+        changedTreeNames = None if _needsFullUpdate else _changedTreeNames
+        changedTreeNames = _forestData.update(changedTreeNames)
+        _networks.update(_forestData, changedTreeNames)
+    except:
+        _needsFullUpdate = True
+        raise
+
+    _changedTreeNames.clear()
     _needsUpdate = False
+    _needsFullUpdate = False
 
 def updateIfNecessary():
     if _needsUpdate:
         update()
 
-def treeChanged():
-    global _needsUpdate
+def treeChanged(treeName = None):
+    '''
+    All trees are analysed again in the next update when no name is given.
+    '''
+    global _needsUpdate, _needsFullUpdate
     _needsUpdate = True
+    if treeName is None: _needsFullUpdate = True
+    else: _changedTreeNames.add(treeName)
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_POST")
+def dataReloaded():
+    treeChanged()
+    update()
+
+
+
+def nodeChanged(nodeID):
+    _forestData.changedNodeIDs.add(nodeID)
 
+def popChangedNodeIDs():
+    '''
+    Nodes whose sockets, links or properties changed since the last call
+    and their linked nodes in the order of the trees.
+    '''
+    changedNodeIDs = _forestData.changedNodeIDs
+    nodeIDs = [nodeID for nodeID in _forestData.nodes if nodeID in changedNodeIDs]
+    changedNodeIDs.clear()
+    return nodeIDs
 
+def getNodeIDsByType(idName):
+    return list(_forestData.nodesByType[idName])
 
 def getNodeByIdentifier(identifier):
     return idToNode(_forestData.nodeByIdentifier[identifier])
@@ -65,87 +101,99 @@ def getNodesByType(idName, nodeByID = None):
 
 
 def isSocketLinked(socket, node):
-    socketID = ((node.id_data.name, node.name), socket.is_output, socket.identifier)
-    return len(_forestData.linkedSockets[socketID]) > 0
+    nodeID = (node.id_data.name, node.name)
+    return _forestData.isNodeSocketLinked(nodeID, socket.is_output, socket.identifier)
+
+def getSocketIndex(socketID):
+    '''
+    Position of the socket in the inputs or outputs of its node.
+    It can be outdated when the node changed since the last update.
+    '''
+    return _forestData.getSocketPosition(socketID)
 
 def getDirectlyLinkedSockets(socket):
-    socketID = socket.toID()
-    linkedIDs = _forestData.linkedSocketsWithReroutes[socketID]
-    return [idToSocket(linkedID) for linkedID in linkedIDs]
+    return list(iterLinkedSocketsOfSocket(socket, "linksWithReroutes"))
 
 def getDirectlyLinkedSocket(socket):
-    socketID = socket.toID()
-    linkedSocketIDs = _forestData.linkedSocketsWithReroutes[socketID]
-    if len(linkedSocketIDs) > 0:
-        return idToSocket(linkedSocketIDs[0])
+    for linkedSocket in iterLinkedSocketsOfSocket(socket, "linksWithReroutes"):
+        return linkedSocket
 
 def getLinkedSockets(socket):
-    socketID = socket.toID()
-    linkedIDs = _forestData.linkedSockets[socketID]
-    return [idToSocket(linkedID) for linkedID in linkedIDs]
+    return list(iterLinkedSocketsOfSocket(socket, "links"))
+
+def iterLinkedSocketsOfSocket(socket, adjacencyName):
+    node = socket.node
+    isOutput = socket.is_output
+    nodeID = (node.id_data.name, node.name)
+    linkedSockets = _forestData.getLinkedSockets(nodeID, isOutput, socket.identifier, adjacencyName)
+    for linkedNodeID, identifier, index in linkedSockets:
+        yield findSocketWithIndex(idToNode(linkedNodeID), not isOutput, identifier, index)
 
 def iterSocketsThatNeedUpdate():
-    for socketID in _forestData.socketsThatNeedUpdate:
+    for socketID in _forestData.iterSocketsThatNeedUpdate():
         yield idToSocket(socketID)
 
 def getUndefinedNodes(nodeByID):
     return [nodeByID[nodeID] for nodeID in _forestData.nodesByType["NodeUndefined"]]
 
-def iterLinkedSocketsWithInfo(socket, node, nodeByID):
-    socketID = ((node.id_data.name, node.name), socket.is_output, socket.identifier)
-    linkedIDs = _forestData.linkedSockets[socketID]
-    for linkedID in linkedIDs:
-        linkedIdentifier = linkedID[2]
-        linkedNode = nodeByID[linkedID[0]]
-        sockets = linkedNode.outputs if linkedID[1] else linkedNode.inputs
-        for socket in sockets:
-            if socket.identifier == linkedIdentifier:
-                yield socket
+def iterLinkedSocketsWithInfo(socket, node, nodeByID, nodeIDs = None):
+    for linkedSocket, linkedNodeID in iterLinkedSocketsWithNodeIDs(socket, node, nodeByID, nodeIDs):
+        yield linkedSocket
+
+def iterLinkedSocketsWithNodeIDs(socket, node, nodeByID, nodeIDs = None):
+    isOutput = socket.is_output
+    nodeID = (node.id_data.name, node.name)
+    linkedSockets = _forestData.getLinkedSockets(nodeID, isOutput, socket.identifier)
+    for linkedNodeID, identifier, index in linkedSockets:
+        if nodeIDs is not None and linkedNodeID not in nodeIDs: continue
+        linkedSocket = findSocketWithIndex(nodeByID[linkedNodeID], not isOutput, identifier, index)
+        if linkedSocket is not None:
+            yield linkedSocket, linkedNodeID
 
 
 # improve performance of higher level functions
 
 def getOriginNodes(node):
-    nodeID = node.toID()
-    linkedNodeIDs = set()
-    for socketID in _forestData.socketsByNode[nodeID][0]:
-        for linkedSocketID in _forestData.linkedSockets[socketID]:
-            linkedNodeIDs.add(linkedSocketID[0])
+    linkedNodeIDs = set(_forestData.iterOriginNodeIDs(node.toID()))
     return [idToNode(nodeID) for nodeID in linkedNodeIDs]
 
+def iterOriginNodeIDs(nodeID):
+    return _forestData.iterOriginNodeIDs(nodeID)
+
+def iterTargetNodeIDs(nodeID):
+    return _forestData.iterTargetNodeIDs(nodeID)
+
 def getAllDataLinkIDs():
-    linkDataIDs = set()
-    dataType = _forestData.dataTypeBySocket
-    for socketID, linkedIDs in _forestData.linkedSockets.items():
-        for linkedID in linkedIDs:
-            if socketID[1]: # check which one is origin/target
-                linkDataIDs.add((socketID, linkedID, dataType[socketID], dataType[linkedID]))
-            else:
-                linkDataIDs.add((linkedID, socketID, dataType[linkedID], dataType[socketID]))
-    return linkDataIDs
+    return set(_forestData.iterDataLinkIDs())
+
+def getUncheckedDataLinkIDs():
+    '''
+    Like getAllDataLinkIDs, but only links that have been created or
+    whose data types changed since they were marked as checked.
+    '''
+    return _forestData.getUncheckedDataLinkIDs()
+
+def markDataLinksAsChecked(linkIDs):
+    _forestData.markDataLinksAsChecked(linkIDs)
 
 def getLinkedInputsDict(node):
-    linkedSockets = _forestData.linkedSockets
-    socketIDs = _forestData.socketsByNode[node.toID()][0]
-    return {socketID[2] : len(linkedSockets[socketID]) > 0 for socketID in socketIDs}
+    linkStates = _forestData.iterSocketLinkStates(node.toID(), isOutput = False)
+    return {identifier : isLinked for identifier, isLinked in linkStates}
 
 def getLinkedOutputsDict(node):
-    linkedSockets = _forestData.linkedSockets
-    socketIDs = _forestData.socketsByNode[node.toID()][1]
-    return {socketID[2] : len(linkedSockets[socketID]) > 0 for socketID in socketIDs}
+    linkStates = _forestData.iterSocketLinkStates(node.toID(), isOutput = True)
+    return {identifier : isLinked for identifier, isLinked in linkStates}
 
 def iterLinkedOutputSockets(node):
-    linkedSockets = _forestData.linkedSockets
-    socketIDs = _forestData.socketsByNode[node.toID()][1]
-    for socket, socketID in zip(node.outputs, socketIDs):
-        if len(linkedSockets[socketID]) > 0:
+    linkStates = _forestData.iterSocketLinkStates(node.toID(), isOutput = True)
+    for socket, (identifier, isLinked) in zip(node.outputs, linkStates):
+        if isLinked:
             yield socket
 
 def iterUnlinkedInputSockets(node):
-    linkedSockets = _forestData.linkedSockets
-    socketIDs = _forestData.socketsByNode[node.toID()][0]
-    for socket, socketID in zip(node.inputs, socketIDs):
-        if len(linkedSockets[socketID]) == 0:
+    linkStates = _forestData.iterSocketLinkStates(node.toID(), isOutput = False)
+    for socket, (identifier, isLinked) in zip(node.inputs, linkStates):
+        if not isLinked:
             yield socket
 
 
@@ -168,10 +216,10 @@ def keepNodeLinks(function):
 
 def getNodeConnections(node):
     nodeID = node.toID()
-    inputIDs, outputIDs = _forestData.socketsByNode[nodeID]
+    inputIDs, outputIDs = _forestData.getSocketIDs(nodeID)
     connections = []
     for socketID in inputIDs + outputIDs:
-        for linkedID in _forestData.linkedSocketsWithReroutes[socketID]:
+        for linkedID in _forestData.getDirectlyLinkedSocketIDs(socketID):
             connections.append((socketID, linkedID))
     return connections
 
@@ -1,113 +1,233 @@
 from itertools import chain
 from collections import defaultdict
-from .. utils.nodes import getAnimationNodeTrees, iterAnimationNodesSockets
+from . tree_data import TreeData, getTreeState, findChangedNodeIDs
+from .. utils.nodes import getAnimationNodeTrees
+
+'''
+The sockets and links are stored per tree in TreeData objects.
+The methods below map the public socket and node ids to them:
+    nodeID = (treeName, nodeName)
+    socketID = (nodeID, isOutput, identifier)
+'''
 
 class ForestData:
     def __init__(self):
         self._reset()
+        # nodes whose edit function has to be called (see update.callNodeEditFunctions)
+        self.changedNodeIDs = set()
+        # valid links by tree (see node_link_conversion)
+        self.checkedDataLinksByTree = {}
 
     def _reset(self):
-        self.nodes = []
+        self.treeDataByName = {}
+        self.nodesByTree = {}
+
         self.nodesByType = defaultdict(set)
         self.typeByNode = defaultdict(None)
         self.nodeByIdentifier = defaultdict(None)
         self.animationNodes = set()
 
-        self.socketsByNode = defaultdict(lambda: ([], []))
-
-        self.linkedSockets = defaultdict(list)
-        self.linkedSocketsWithReroutes = defaultdict(list)
-        self.reroutePairs = defaultdict(list)
-
-        self.dataTypeBySocket = dict()
-        self.socketsThatNeedUpdate = set()
-
-    def update(self):
-        self._reset()
-        self.insertNodeTrees()
-        self.rerouteNodes = self.nodesByType["NodeReroute"]
-        self.findLinksSkippingReroutes()
-
-    def insertNodeTrees(self):
-        for tree in getAnimationNodeTrees():
-            self.insertNodes(tree.nodes, tree.name)
-            self.insertLinks(tree.links, tree.name)
-
-    def insertNodes(self, nodes, treeName):
-        appendNode = self.nodes.append
-        nodesByType = self.nodesByType
-        typeByNode = self.typeByNode
-        nodeByIdentifier = self.nodeByIdentifier
-        socketsByNode = self.socketsByNode
-        reroutePairs = self.reroutePairs
-        dataTypeBySocket = self.dataTypeBySocket
-        animationNodes = self.animationNodes
-        socketsThatNeedUpdate = self.socketsThatNeedUpdate
-
-        for node in nodes:
-            nodeID = (treeName, node.name)
-
-            inputIDs = [(nodeID, False, socket.identifier) for socket in node.inputs]
-            outputIDs = [(nodeID, True, socket.identifier) for socket in node.outputs]
-
-            appendNode(nodeID)
-            typeByNode[nodeID] = node.bl_idname
-            nodesByType[node.bl_idname].add(nodeID)
-
-            socketsByNode[nodeID] = (inputIDs, outputIDs)
-
-            if node.bl_idname == "NodeReroute":
-                reroutePairs[inputIDs[0]] = outputIDs[0]
-                reroutePairs[outputIDs[0]] = inputIDs[0]
-            elif node.bl_idname == "NodeFrame":
-                pass
-            else:
-                if node.bl_idname != "NodeUndefined":
-                    animationNodes.add(nodeID)
-                    nodeByIdentifier[node.identifier] = nodeID
-
-                chainedSockets = chain(node.inputs, node.outputs)
-                chainedSocketIDs = chain(inputIDs, outputIDs)
-                for socket, socketID in zip(chainedSockets, chainedSocketIDs):
-                        dataTypeBySocket[socketID] = socket.dataType
-                        if hasattr(socket, "updateProperty"):
-                            socketsThatNeedUpdate.add(socketID)
-
-
-    def insertLinks(self, links, treeName):
-        linkedSocketsWithReroutes = self.linkedSocketsWithReroutes
-
-        for link in links:
-            originSocket = link.from_socket
-            targetSocket = link.to_socket
-            originID = ((treeName, link.from_node.name), originSocket.is_output, originSocket.identifier)
-            targetID = ((treeName, link.to_node.name), targetSocket.is_output, targetSocket.identifier)
-
-            linkedSocketsWithReroutes[originID].append(targetID)
-            linkedSocketsWithReroutes[targetID].append(originID)
-
-    def findLinksSkippingReroutes(self):
-        rerouteNodes = self.rerouteNodes
-        nonRerouteNodes = filter(lambda n: n not in rerouteNodes, self.nodes)
-
-        socketsByNode = self.socketsByNode
-        linkedSockets = self.linkedSockets
-        iterLinkedSockets = self.iterLinkedSockets
-        chainIterable = chain.from_iterable
-
-        for node in nonRerouteNodes:
-            for socket in chainIterable(socketsByNode[node]):
-                linkedSockets[socket] = tuple(iterLinkedSockets(socket, set()))
-
-    def iterLinkedSockets(self, socket, visitedReroutes):
-        """If the socket is linked to a reroute node the function
-        tries to find the next socket that is linked to the reroute"""
-        for socket in self.linkedSocketsWithReroutes[socket]:
-            if socket[0] in self.rerouteNodes:
-                if socket[0] in visitedReroutes:
-                    print("Reroute recursion detected in: {}".format(repr(socket[0][0])))
-                    return
-                visitedReroutes.add(socket[0])
-                yield from self.iterLinkedSockets(self.reroutePairs[socket], visitedReroutes)
-            else:
-                yield socket
+    @property
+    def nodes(self):
+        return list(chain.from_iterable(self.nodesByTree.values()))
+
+    def update(self, changedTreeNames = None):
+        '''
+        Analyse the given trees again and keep the data of all other trees.
+        Trees that have been added, removed or whose amount of nodes or
+        links changed are always analysed again.
+        All trees are analysed when changedTreeNames is None.
+        Returns the names of all trees that have been analysed or removed.
+        '''
+        treeByName = {tree.name : tree for tree in getAnimationNodeTrees()}
+
+        if changedTreeNames is None:
+            # the networks of removed trees have to be removed as well
+            changedTreeNames = set(treeByName) | self.treeDataByName.keys()
+            self._reset()
+        else:
+            changedTreeNames = set(changedTreeNames)
+            changedTreeNames.update(self.treeDataByName.keys() - treeByName.keys())
+            for treeName, tree in treeByName.items():
+                treeData = self.treeDataByName.get(treeName)
+                if treeData is None or treeData.state != getTreeState(tree):
+                    changedTreeNames.add(treeName)
+
+        oldTreeDataByName = {name : self.treeDataByName.get(name) for name in changedTreeNames}
+        for treeName in changedTreeNames:
+            self.removeNodeTree(treeName)
+        for treeName in changedTreeNames:
+            if treeName in treeByName:
+                self.insertNodeTree(treeByName[treeName])
+                self.changedNodeIDs.update(findChangedNodeIDs(
+                    oldTreeDataByName[treeName], self.treeDataByName[treeName]))
+
+        # analysed trees have been inserted at the end
+        self.nodesByTree = {treeName : self.nodesByTree[treeName] for treeName in treeByName}
+        return changedTreeNames
+
+    def insertNodeTree(self, tree):
+        treeData = TreeData(tree)
+        self.treeDataByName[treeData.treeName] = treeData
+        self.nodesByTree[treeData.treeName] = treeData.nodeIDs
+
+        for nodeID, idName in zip(treeData.nodeIDs, treeData.nodeTypes):
+            self.typeByNode[nodeID] = idName
+            self.nodesByType[idName].add(nodeID)
+
+        for nodeID, identifier in treeData.identifierByNode.items():
+            self.animationNodes.add(nodeID)
+            self.nodeByIdentifier[identifier] = nodeID
+
+    def removeNodeTree(self, treeName):
+        treeData = self.treeDataByName.pop(treeName, None)
+        if treeData is None: return
+        del self.nodesByTree[treeName]
+
+        for nodeID, idName in zip(treeData.nodeIDs, treeData.nodeTypes):
+            del self.typeByNode[nodeID]
+            self.nodesByType[idName].discard(nodeID)
+
+        for nodeID, identifier in treeData.identifierByNode.items():
+            self.animationNodes.discard(nodeID)
+            if self.nodeByIdentifier.get(identifier) == nodeID:
+                del self.nodeByIdentifier[identifier]
+
+
+    # Sockets
+    ##########################################
+
+    def getSocketIndex(self, socketID):
+        return self.findSocket(socketID[0], socketID[1], socketID[2])
+
+    def findSocket(self, nodeID, isOutput, identifier):
+        '''Returns the tree data and the index of the socket in it'''
+        treeData, node = self.getNodeIndex(nodeID)
+        if node is None: return None, None
+        return treeData, treeData.findSocket(node, isOutput, identifier)
+
+    def getNodeIndex(self, nodeID):
+        treeData = self.treeDataByName.get(nodeID[0])
+        if treeData is None: return None, None
+        return treeData, treeData.nodeIndexByID.get(nodeID)
+
+    def getSocketIDs(self, nodeID):
+        treeData, node = self.getNodeIndex(nodeID)
+        if node is None: return [], []
+        getSocketID = treeData.getSocketID
+        return ([getSocketID(socket) for socket in treeData.getInputRange(node)],
+                [getSocketID(socket) for socket in treeData.getOutputRange(node)])
+
+    def getSocketPosition(self, socketID):
+        '''Index of the socket in node.inputs or node.outputs'''
+        treeData, socket = self.getSocketIndex(socketID)
+        if socket is None: return None
+        return treeData.getSocketPosition(socket)
+
+    def getDataType(self, socketID):
+        treeData, socket = self.getSocketIndex(socketID)
+        return treeData.dataTypes[socket]
+
+    def iterSocketsThatNeedUpdate(self):
+        for treeData in self.treeDataByName.values():
+            for socket in treeData.socketsThatNeedUpdate:
+                yield treeData.getSocketID(socket)
+
+
+    # Links
+    ##########################################
+
+    def isSocketLinked(self, socketID):
+        return self.isNodeSocketLinked(socketID[0], socketID[1], socketID[2])
+
+    def isNodeSocketLinked(self, nodeID, isOutput, identifier):
+        treeData, socket = self.findSocket(nodeID, isOutput, identifier)
+        if socket is None: return False
+        return treeData.links.getAmount(socket) > 0
+
+    def getLinkedSocketIDs(self, socketID):
+        '''Linked sockets, reroute nodes are skipped'''
+        return self._getLinkedSocketIDs(socketID, "links")
+
+    def getDirectlyLinkedSocketIDs(self, socketID):
+        '''Linked sockets including sockets of reroute nodes'''
+        return self._getLinkedSocketIDs(socketID, "linksWithReroutes")
+
+    def _getLinkedSocketIDs(self, socketID, adjacencyName):
+        treeData, socket = self.getSocketIndex(socketID)
+        if socket is None: return ()
+        getSocketID = treeData.getSocketID
+        return tuple(getSocketID(linked) for linked in getattr(treeData, adjacencyName)[socket])
+
+    def getLinkedSockets(self, nodeID, isOutput, identifier, adjacencyName = "links"):
+        '''
+        Like getLinkedSocketIDs but without building socket ids.
+        Returns a list of (nodeID, identifier, position in the inputs or outputs).
+        '''
+        treeData, socket = self.findSocket(nodeID, isOutput, identifier)
+        if socket is None: return []
+        nodeIDs = treeData.nodeIDs
+        nodeBySocket = treeData.nodeBySocket
+        socketIdentifiers = treeData.socketIdentifiers
+        getSocketPosition = treeData.getSocketPosition
+        return [(nodeIDs[nodeBySocket[linked]], socketIdentifiers[linked], getSocketPosition(linked))
+                for linked in getattr(treeData, adjacencyName)[socket]]
+
+    def iterSocketLinkStates(self, nodeID, isOutput):
+        '''Yields (identifier, isLinked) for the inputs or outputs of the node'''
+        treeData, node = self.getNodeIndex(nodeID)
+        if node is None: return
+        sockets = treeData.getOutputRange(node) if isOutput else treeData.getInputRange(node)
+        getAmount = treeData.links.getAmount
+        socketIdentifiers = treeData.socketIdentifiers
+        for socket in sockets:
+            yield socketIdentifiers[socket], getAmount(socket) > 0
+
+    def iterDataLinkIDs(self):
+        for treeData in self.treeDataByName.values():
+            yield from treeData.iterDataLinkIDs()
+
+    def getUncheckedDataLinkIDs(self):
+        '''
+        Only trees that have been analysed again since the last call are
+        searched for links that have not been marked as checked.
+        '''
+        for treeName in self.checkedDataLinksByTree.keys() - self.treeDataByName.keys():
+            del self.checkedDataLinksByTree[treeName]
+
+        uncheckedLinkIDs = []
+        for treeName, treeData in self.treeDataByName.items():
+            if treeData.dataLinksChecked: continue
+            treeData.dataLinksChecked = True
+
+            linkIDs = set(treeData.iterDataLinkIDs())
+            checkedLinkIDs = self.checkedDataLinksByTree.get(treeName, set()) & linkIDs
+            self.checkedDataLinksByTree[treeName] = checkedLinkIDs
+            uncheckedLinkIDs.extend(linkIDs - checkedLinkIDs)
+        return uncheckedLinkIDs
+
+    def markDataLinksAsChecked(self, linkIDs):
+        for linkID in linkIDs:
+            treeName = linkID[0][0][0]
+            self.checkedDataLinksByTree.setdefault(treeName, set()).add(linkID)
+
+
+    # Nodes
+    ##########################################
+
+    def iterOriginNodeIDs(self, nodeID):
+        treeData, node = self.getNodeIndex(nodeID)
+        if node is None: return
+        yield from self._iterLinkedNodeIDs(treeData, treeData.getInputRange(node), treeData.links)
+
+    def iterTargetNodeIDs(self, nodeID):
+        treeData, node = self.getNodeIndex(nodeID)
+        if node is None: return
+        yield from self._iterLinkedNodeIDs(treeData, treeData.getOutputRange(node), treeData.links)
+
+    def _iterLinkedNodeIDs(self, treeData, sockets, adjacency):
+        nodeIDs = treeData.nodeIDs
+        nodeBySocket = treeData.nodeBySocket
+        for socket in sockets:
+            for linked in adjacency[socket]:
+                yield nodeIDs[nodeBySocket[linked]]
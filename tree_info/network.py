@@ -1,4 +1,5 @@
 import bpy
+from itertools import chain
 from .. import problems
 from .. utils.nodes import idToNode
 
@@ -158,15 +159,43 @@ class NodeNetwork:
         return nodeByID[nodeID]
 
 
-    def getSortedAnimationNodes(self, nodeByID = None):
+    def getStructureFingerprint(self, nodeByID = None):
+        '''
+        Changes whenever nodes, links or node/socket settings of this
+        network change in a way that can influence the execution code.
+        '''
+        getNodeIndex = self.forestData.getNodeIndex
+        animationNodes = self.forestData.animationNodes
+        typeByNode = self.forestData.typeByNode
+
+        parts = []
+        for nodeID in sorted(self.nodeIDs):
+            if nodeID not in animationNodes:
+                parts.append((nodeID, typeByNode[nodeID]))
+                continue
+
+            node = self.getNodeByID(nodeID, nodeByID)
+            parts.append((nodeID, node.bl_idname, node.identifier, tuple(iterNodeSettings(node))))
+            treeData, nodeIndex = getNodeIndex(nodeID)
+            socketsByIdentifier = treeData.socketsByNode[nodeIndex]
+            for socket in chain(node.inputs, node.outputs):
+                isOutput, identifier = socket.is_output, socket.identifier
+                socketIndex = socketsByIdentifier[isOutput].get(identifier)
+                linkedSockets = () if socketIndex is None else treeData.getLinkedSocketNames(socketIndex)
+                parts.append((isOutput, identifier, getSocketSettings(socket), linkedSockets))
+        return tuple(parts)
+
+    def getSortedAnimationNodes(self, nodeByID = None, extraDependencies = {}):
         '''
         Used Algorithm:
         https://en.wikipedia.org/wiki/Topological_sorting#Depth-first_search
+
+        extraDependencies can contain nodes that have to be executed
+        before a node even though they are not linked with it.
         '''
 
         # localize variables
-        socketsByNode = self.forestData.socketsByNode
-        linkedSockets = self.forestData.linkedSockets
+        iterOriginNodeIDs = self.forestData.iterOriginNodeIDs
         animationNodes = self.forestData.animationNodes
 
         markedNodeIDs = set()
@@ -198,9 +227,8 @@ class NodeNetwork:
                     sortedAnimationNodesIDs.append(nodeID)
 
         def iterDependentNodes(nodeID):
-            for socketID in socketsByNode[nodeID][0]:
-                for otherSocketID in linkedSockets[socketID]:
-                    yield otherSocketID[0]
+            yield from iterOriginNodeIDs(nodeID)
+            yield from extraDependencies.get(nodeID, ())
 
         def idsToNodes(nodeIDs):
             if nodeByID is None:
@@ -212,3 +240,43 @@ class NodeNetwork:
         sort()
 
         return idsToNodes(sortedAnimationNodesIDs)
+
+
+# properties that only change how a node is drawn
+ignoredNodeProperties = {"activeInputIndex", "activeOutputIndex", "useNetworkColor", "networkColor"}
+
+def iterNodeSettings(node):
+    baseProperties = bpy.types.Node.bl_rna.properties
+    for prop in node.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier in baseProperties or identifier in ignoredNodeProperties: continue
+        yield identifier, getPropertySettings(node, prop)
+
+def getPropertySettings(owner, prop):
+    value = getattr(owner, prop.identifier)
+    if prop.type == "POINTER":
+        return getPointerSettings(value)
+    if prop.type == "COLLECTION":
+        return tuple(getPointerSettings(item) for item in value)
+    return toHashable(value)
+
+def getPointerSettings(value):
+    if value is None:
+        return None
+    if isinstance(value, bpy.types.ID):
+        # the name stays the same after undo, the pointer does not
+        return (type(value).__name__, value.name)
+    if isinstance(value, bpy.types.PropertyGroup):
+        return tuple((prop.identifier, getPropertySettings(value, prop))
+                     for prop in value.bl_rna.properties if prop.identifier != "rna_type")
+    return value.as_pointer()
+
+def getSocketSettings(socket):
+    s = socket
+    return (s.bl_idname, s.isUsed, s.dataIsModified, s.text,
+            s.loop.useAsInput, s.loop.useAsOutput, s.loop.copyAlways)
+
+def toHashable(value):
+    if isinstance(value, (bool, int, float, str)): return value
+    if isinstance(value, set): return tuple(sorted(value))
+    return tuple(value)
@@ -1,25 +1,46 @@
-from itertools import chain
 from collections import defaultdict
 from . network import NodeNetwork
+from .. utils.nodes import getAnimationNodeTrees, createNodeByIdDict
 
 class NodeNetworks:
     def __init__(self):
         self._reset()
+        self.networksByTree = {}
 
     def _reset(self):
         self.networks = []
         self.networkByNode = {}
 
-    def update(self, forestData, nodeByID):
+    def update(self, forestData, changedTreeNames = None):
+        '''
+        The networks of a tree are only searched again when it changed.
+        Subprogram networks of all trees are joined again every time.
+        '''
         self._reset()
         self.forestData = forestData
+        if changedTreeNames is None:
+            self.networksByTree.clear()
+            changedTreeNames = set(forestData.nodesByTree)
+
+        treeByName = {tree.name : tree for tree in getAnimationNodeTrees()}
+        nodeByID = createNodeByIdDict([treeByName[name] for name in changedTreeNames if name in treeByName])
+
+        for treeName in changedTreeNames:
+            self.networksByTree.pop(treeName, None)
+            if treeName in forestData.treeDataByName:
+                treeData = forestData.treeDataByName[treeName]
+                self.networksByTree[treeName] = list(self.iterNetworks(treeData, nodeByID))
 
         networksByIdentifier = defaultdict(list)
-        for nodes in self.iterNodeGroups():
-            if not self.groupContainsAnimationNodes(nodes): continue
+        for networks in self.networksByTree.values():
+            for network in networks:
+                networksByIdentifier[network.identifier].append(network)
 
-            network = NodeNetwork(nodes, self.forestData, nodeByID)
-            networksByIdentifier[network.identifier].append(network)
+        # joined networks can contain nodes of unchanged trees
+        missingTreeNames = {network.treeName
+            for identifier, networks in networksByIdentifier.items() if identifier is not None
+            for network in networks} - changedTreeNames
+        nodeByID.update(createNodeByIdDict([treeByName[name] for name in missingTreeNames]))
 
         for identifier, networks in networksByIdentifier.items():
             if identifier is None:
@@ -33,32 +54,14 @@ class NodeNetworks:
             for nodeID in network.nodeIDs:
                 self.networkByNode[nodeID] = network
 
+        nodeByID.clear()
+
+    def iterNetworks(self, treeData, nodeByID):
+        for nodeGroup in treeData.getConnectedNodeGroups():
+            if self.groupContainsAnimationNodes(nodeGroup):
+                yield NodeNetwork(nodeGroup, self.forestData, nodeByID)
+
     def groupContainsAnimationNodes(self, nodes):
         typeByNode = self.forestData.typeByNode
         nonAnimationNodes = ("NodeFrame", "NodeReroute")
         return any(typeByNode[node] not in nonAnimationNodes for node in nodes)
-
-    def iterNodeGroups(self):
-        foundNodes = set()
-        for node in self.forestData.nodes:
-            if node not in foundNodes:
-                nodeGroup = self.getAllConnectedNodes(node)
-                foundNodes.update(nodeGroup)
-                yield nodeGroup
-
-    def getAllConnectedNodes(self, nodeInGroup):
-        connectedNodes = set()
-        uncheckedNodes = {nodeInGroup}
-        while uncheckedNodes:
-            node = uncheckedNodes.pop()
-
-            connectedNodes.add(node)
-            for linkedNode in self.iterDirectlyLinkedNodes(node):
-                if linkedNode not in uncheckedNodes and linkedNode not in connectedNodes:
-                    uncheckedNodes.add(linkedNode)
-
-        return connectedNodes
-
-    def iterDirectlyLinkedNodes(self, node):
-        for socket in chain.from_iterable(self.forestData.socketsByNode[node]):
-            yield from (socket[0] for socket in self.forestData.linkedSocketsWithReroutes[socket])
@@ -0,0 +1,246 @@
+from array import array
+from itertools import chain
+
+class TreeData:
+    '''
+    Contains the nodes, sockets and links of a single node tree.
+    Nodes and sockets are interned to dense integers in the order of the tree.
+    The sockets of node i are in range(socketStarts[i], socketStarts[i + 1]),
+    the outputs start at outputStarts[i]. Only the public methods of the
+    ForestData build the (nodeID, isOutput, identifier) tuples of sockets.
+    '''
+
+    def __init__(self, tree):
+        self.treeName = tree.name
+        self.state = getTreeState(tree)
+
+        self.nodeIDs = []
+        self.nodeIndexByID = {}
+        self.nodeTypes = []
+        self.identifierByNode = {}
+
+        # [({input identifier : socket}, {output identifier : socket}), ...] by node
+        self.socketsByNode = []
+        self.socketIdentifiers = []
+        self.dataTypes = []
+        self.nodeBySocket = array("i")
+        self.socketStarts = array("i")
+        self.outputStarts = array("i")
+        self.socketsThatNeedUpdate = array("i")
+
+        # the data links of new tree data have not been validated yet
+        self.dataLinksChecked = False
+
+        self.insertNodes(tree.nodes)
+        self.linksWithReroutes = self.createLinksWithReroutes(tree.links)
+        self.links = self.createLinksSkippingReroutes()
+
+    def insertNodes(self, nodes):
+        treeName = self.treeName
+        nodeIDs = self.nodeIDs
+        socketIdentifiers = self.socketIdentifiers
+        dataTypes = self.dataTypes
+        nodeBySocket = self.nodeBySocket
+        socketsThatNeedUpdate = self.socketsThatNeedUpdate
+
+        for nodeIndex, node in enumerate(nodes):
+            nodeID = (treeName, node.name)
+            idName = node.bl_idname
+
+            nodeIDs.append(nodeID)
+            self.nodeIndexByID[nodeID] = nodeIndex
+            self.nodeTypes.append(idName)
+            self.socketStarts.append(len(socketIdentifiers))
+            self.outputStarts.append(len(socketIdentifiers) + len(node.inputs))
+
+            hasDataTypes = idName not in ("NodeReroute", "NodeFrame")
+            if hasDataTypes and idName != "NodeUndefined":
+                self.identifierByNode[nodeID] = node.identifier
+
+            socketsByIdentifier = ({}, {})
+            self.socketsByNode.append(socketsByIdentifier)
+            for isOutput, sockets in ((False, node.inputs), (True, node.outputs)):
+                for socket in sockets:
+                    socketsByIdentifier[isOutput][socket.identifier] = len(socketIdentifiers)
+                    socketIdentifiers.append(socket.identifier)
+                    nodeBySocket.append(nodeIndex)
+                    if hasDataTypes:
+                        dataTypes.append(socket.dataType)
+                        if hasattr(socket, "updateProperty"):
+                            socketsThatNeedUpdate.append(len(socketIdentifiers) - 1)
+                    else:
+                        dataTypes.append(None)
+
+        self.socketStarts.append(len(socketIdentifiers))
+
+    def createLinksWithReroutes(self, links):
+        socketsByNode = self.socketsByNode
+        nodeIndexByName = {nodeID[1] : node for node, nodeID in enumerate(self.nodeIDs)}
+
+        linkedSockets = [[] for i in range(len(self.socketIdentifiers))]
+        for link in links:
+            originSocket = link.from_socket
+            targetSocket = link.to_socket
+            origin = socketsByNode[nodeIndexByName[link.from_node.name]][originSocket.is_output][originSocket.identifier]
+            target = socketsByNode[nodeIndexByName[link.to_node.name]][targetSocket.is_output][targetSocket.identifier]
+            linkedSockets[origin].append(target)
+            linkedSockets[target].append(origin)
+        return Adjacency(linkedSockets)
+
+    def createLinksSkippingReroutes(self):
+        nodeTypes = self.nodeTypes
+        nodeBySocket = self.nodeBySocket
+
+        linkedSockets = []
+        for socket in range(len(self.socketIdentifiers)):
+            if nodeTypes[nodeBySocket[socket]] == "NodeReroute":
+                linkedSockets.append(())
+            else:
+                linkedSockets.append(tuple(self.iterLinkedSockets(socket, set())))
+        return Adjacency(linkedSockets)
+
+    def iterLinkedSockets(self, socket, visitedReroutes):
+        """If the socket is linked to a reroute node the function
+        tries to find the next socket that is linked to the reroute"""
+        for socket in self.linksWithReroutes[socket]:
+            node = self.nodeBySocket[socket]
+            if self.nodeTypes[node] == "NodeReroute":
+                if node in visitedReroutes:
+                    print("Reroute recursion detected in: {}".format(repr(self.treeName)))
+                    return
+                visitedReroutes.add(node)
+                yield from self.iterLinkedSockets(self.getReroutePair(socket), visitedReroutes)
+            else:
+                yield socket
+
+    def getReroutePair(self, socket):
+        # reroute nodes have exactly one input and one output
+        start = self.socketStarts[self.nodeBySocket[socket]]
+        return start + 1 if socket == start else start
+
+    def getNodeSignatures(self):
+        '''Changes when the sockets or links of a node change'''
+        getSocketID = self.getSocketID
+        signatures = {}
+        for node, nodeID in enumerate(self.nodeIDs):
+            sockets = range(self.socketStarts[node], self.socketStarts[node + 1])
+            signatures[nodeID] = tuple(
+                (getSocketID(socket), self.dataTypes[socket],
+                 tuple(getSocketID(linked) for linked in self.linksWithReroutes[socket]),
+                 tuple(getSocketID(linked) for linked in self.links[socket]))
+                for socket in sockets)
+        return signatures
+
+    def iterDataLinkIDs(self):
+        '''Yields (originID, targetID, originType, targetType) for every link'''
+        getSocketID = self.getSocketID
+        dataTypes = self.dataTypes
+        for node in range(len(self.nodeIDs)):
+            for socket in self.getOutputRange(node):
+                for linked in self.links[socket]:
+                    yield (getSocketID(socket), getSocketID(linked), dataTypes[socket], dataTypes[linked])
+
+    def iterLinkedNodeIDs(self, nodeID):
+        node = self.nodeIndexByID.get(nodeID)
+        if node is None: return
+        for socket in range(self.socketStarts[node], self.socketStarts[node + 1]):
+            for linked in chain(self.links[socket], self.linksWithReroutes[socket]):
+                yield self.nodeIDs[self.nodeBySocket[linked]]
+
+    def getConnectedNodeGroups(self):
+        '''Sets of node ids that are linked with each other, reroutes included'''
+        nodeBySocket = self.nodeBySocket
+        socketStarts = self.socketStarts
+        linksWithReroutes = self.linksWithReroutes
+
+        groups = []
+        isFound = [False] * len(self.nodeIDs)
+        for startNode in range(len(self.nodeIDs)):
+            if isFound[startNode]: continue
+            isFound[startNode] = True
+            group = []
+            uncheckedNodes = [startNode]
+            while uncheckedNodes:
+                node = uncheckedNodes.pop()
+                group.append(node)
+                for socket in range(socketStarts[node], socketStarts[node + 1]):
+                    for linked in linksWithReroutes[socket]:
+                        linkedNode = nodeBySocket[linked]
+                        if not isFound[linkedNode]:
+                            isFound[linkedNode] = True
+                            uncheckedNodes.append(linkedNode)
+            groups.append(group)
+
+        nodeIDs = self.nodeIDs
+        return [{nodeIDs[node] for node in group} for group in groups]
+
+    def getLinkedSocketNames(self, socket):
+        '''Tuple of (nodeID, identifier) of the linked sockets, reroute nodes are skipped'''
+        nodeIDs = self.nodeIDs
+        nodeBySocket = self.nodeBySocket
+        socketIdentifiers = self.socketIdentifiers
+        return tuple([(nodeIDs[nodeBySocket[linked]], socketIdentifiers[linked]) for linked in self.links[socket]])
+
+    def findSocket(self, node, isOutput, identifier):
+        return self.socketsByNode[node][isOutput].get(identifier)
+
+    def getSocketID(self, socket):
+        node = self.nodeBySocket[socket]
+        return (self.nodeIDs[node], socket >= self.outputStarts[node], self.socketIdentifiers[socket])
+
+    def getSocketPosition(self, socket):
+        '''Index of the socket in node.inputs or node.outputs'''
+        node = self.nodeBySocket[socket]
+        outputStart = self.outputStarts[node]
+        if socket >= outputStart: return socket - outputStart
+        else: return socket - self.socketStarts[node]
+
+    def getInputRange(self, node):
+        return range(self.socketStarts[node], self.outputStarts[node])
+
+    def getOutputRange(self, node):
+        return range(self.outputStarts[node], self.socketStarts[node + 1])
+
+class Adjacency:
+    '''
+    Compressed sparse row representation of the linked sockets.
+    The sockets linked with socket i are targets[offsets[i]:offsets[i + 1]].
+    '''
+
+    def __init__(self, linkedSockets):
+        self.offsets = array("i", [0])
+        self.targets = array("i")
+        for sockets in linkedSockets:
+            self.targets.extend(sockets)
+            self.offsets.append(len(self.targets))
+
+    def __getitem__(self, socket):
+        return self.targets[self.offsets[socket]:self.offsets[socket + 1]]
+
+    def getAmount(self, socket):
+        return self.offsets[socket + 1] - self.offsets[socket]
+
+def findChangedNodeIDs(oldTreeData, newTreeData):
+    '''
+    Nodes whose sockets or links differ in both versions of the tree
+    and all nodes that are or have been linked with them.
+    '''
+    if oldTreeData is None:
+        return set(newTreeData.nodeIDs)
+
+    oldSignatures = oldTreeData.getNodeSignatures()
+    newSignatures = newTreeData.getNodeSignatures()
+    changedNodeIDs = {nodeID for nodeID, signature in newSignatures.items()
+                      if oldSignatures.get(nodeID) != signature}
+    removedNodeIDs = oldSignatures.keys() - newSignatures.keys()
+
+    neighbourIDs = set()
+    for nodeID in chain(changedNodeIDs, removedNodeIDs):
+        neighbourIDs.update(oldTreeData.iterLinkedNodeIDs(nodeID))
+        neighbourIDs.update(newTreeData.iterLinkedNodeIDs(nodeID))
+
+    return (changedNodeIDs | neighbourIDs) & newSignatures.keys()
+
+def getTreeState(tree):
+    # changes when nodes or links are added or removed without a tree update
+    return (tree.as_pointer(), len(tree.nodes), len(tree.links))
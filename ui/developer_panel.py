@@ -1,5 +1,7 @@
 import bpy
 from .. preferences import getPreferences
+from .. execution.trace import getEventAmount
+from .. execution.compile_scripts import getCacheStatistics
 from .. operators.output_execution_code import setupTextEditorCallback, executionCodeTextBlockName
 
 
@@ -42,8 +44,12 @@ class DeveloperPanel(bpy.types.Panel):
 
         row = col.row(align = True)
         row.prop(executionCode, "type", text = "")
-        if executionCode.type == "MEASURE":
+        if executionCode.type in ("MEASURE", "MEMORY", "SAMPLE"):
             row.operator("an.reset_measurements", text = "", icon = "RECOVER_LAST")
+        elif executionCode.type == "TRACE":
+            row.operator("an.clear_execution_trace", text = "", icon = "RECOVER_LAST")
+            subrow = col.row(align = True)
+            subrow.operator("an.export_execution_trace", text = "Export Trace ({:,d} Events)".format(getEventAmount()), icon = "EXPORT")
 
         row = col.row(align = True)
         row.operator("an.print_current_execution_code", text = "Print", icon = "CONSOLE")
@@ -52,6 +58,22 @@ class DeveloperPanel(bpy.types.Panel):
         subrow.active = executionCodeTextBlockName in bpy.data.texts
         subrow.operator("an.select_area", text = "", icon = "ZOOM_SELECTED").callback = setupTextEditorCallback
 
+        row = layout.row(align = True)
+        row.prop(executionCode, "eliminateDeadNodes")
+        row.prop(executionCode, "foldConstants")
+        row.prop(executionCode, "useBatchLoops")
+        row.prop(executionCode, "scheduleCopies")
+
+        col = layout.column(align = True)
+        row = col.row(align = True)
+        row.prop(executionCode, "useDiskCache", text = "Disk Cache")
+        subrow = row.row(align = True)
+        subrow.active = executionCode.useDiskCache
+        subrow.prop(executionCode, "diskCacheSize", text = "MB")
+        row = col.row(align = True)
+        row.label(str(getCacheStatistics()))
+        row.operator("an.clear_code_cache", text = "", icon = "X")
+
     def drawProfilingSettings(self, layout, preferences):
         profiling = preferences.developer.profiling
 
@@ -31,10 +31,13 @@ class NeededCopiesMode:
             node.use_custom_color = True
 
             neededCopies = sum(socket.execution.neededCopies for socket in node.outputs)
-            if neededCopies == 0:
-                color = (0.7, 0.9, 0.7)
-            else:
+            avoidedCopies = sum(socket.execution.avoidedCopies for socket in node.outputs)
+            if neededCopies > 0:
                 color = (1.0, 0.3, 0.3)
+            elif avoidedCopies > 0:
+                color = (0.5, 0.7, 1.0)
+            else:
+                color = (0.7, 0.9, 0.7)
             node.color = color
 
 
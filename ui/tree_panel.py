@@ -24,6 +24,8 @@ class TreePanel(bpy.types.Panel):
         col.scale_y = 1.5
         props = col.operator("an.execute_tree", icon = "PLAY")
         props.name = tree.name
+        props = layout.operator("an.execute_tree_frame_range", icon = "RENDER_ANIMATION")
+        props.name = tree.name
 
         if not canExecute():
             layout.label("Look in the 'Problems' panel", icon = "INFO")
@@ -33,6 +35,7 @@ class TreePanel(bpy.types.Panel):
         layout.separator()
         layout.prop_search(tree, "sceneName", bpy.data, "scenes", icon = "SCENE_DATA", text = "Scene")
         layout.prop(tree, "editNodeLabels")
+        layout.prop(tree, "parallelExecution")
 
 
     @classmethod
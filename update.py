@@ -5,7 +5,8 @@ from . ui.node_colors import colorNetworks
 from . nodes.system import subprogram_sockets
 from . execution.units import createExecutionUnits
 from . node_link_conversion import correctForbiddenNodeLinks
-from . utils.nodes import iterAnimationNodes, getAnimationNodeTrees, createNodeByIdDict
+from . utils.nodes import (iterAnimationNodes, getAnimationNodeTrees, createNodeByIdDict,
+                          tryToGetNode, getAnimationNodeClasses)
 
 @measureTime
 def updateEverything():
@@ -42,10 +43,33 @@ def enableUseFakeUser():
         tree.use_fake_user = True
 
 def callNodeEditFunctions():
+    '''
+    Only nodes that changed since the last call, their linked nodes
+    and nodes that depend on the network of changed trees are edited.
+    Every node is edited at most once.
+    '''
     tree_info.updateIfNecessary()
-    for node in iterAnimationNodes():
-        node.edit()
-        tree_info.updateIfNecessary()
+    editedNodeIDs = set()
+    while True:
+        nodeIDs = tree_info.popChangedNodeIDs()
+        if len(nodeIDs) == 0: break
+        nodeIDs.extend(iterNetworkDependentNodeIDs({nodeID[0] for nodeID in nodeIDs}))
+
+        for nodeID in nodeIDs:
+            if nodeID in editedNodeIDs: continue
+            editedNodeIDs.add(nodeID)
+
+            node = tryToGetNode(nodeID)
+            if getattr(node, "isAnimationNode", False):
+                node.edit()
+                tree_info.updateIfNecessary()
+
+def iterNetworkDependentNodeIDs(treeNames):
+    for nodeClass in getAnimationNodeClasses():
+        if nodeClass.editDependsOnNetwork:
+            for nodeID in tree_info.getNodeIDsByType(nodeClass.bl_idname):
+                if nodeID[0] in treeNames:
+                    yield nodeID
 
 def checkNetworks(nodeByID):
     invalidNetworkExists = False
@@ -99,27 +99,40 @@ cache = {}
 def clearCache():
     cache.clear()
 
+# The cache is kept between executions, so every entry
+# remembers the state of the action when it was created.
+
 def getFCurvesWithDataPath(object, dataPath, storeInCache = True):
     identifier = (object.type, object.name, dataPath)
-    if identifier in cache: return cache[identifier]
+    actionState = getActionState(object)
+    entry = cache.get(identifier)
+    if entry is not None and entry[0] == actionState: return entry[1]
 
     fCurves = []
     for fCurve in getAllFCurves(object):
         if fCurve.data_path == dataPath:
             fCurves.append(fCurve)
-    cache[identifier] = fCurves
+    cache[identifier] = (actionState, fCurves)
     return fCurves
 
 
 def getSingleFCurveWithDataPath(object, dataPath, storeInCache = True):
     identifier = (object.type, object.name, dataPath, "first")
-    if identifier in cache: return cache[identifier]
+    actionState = getActionState(object)
+    entry = cache.get(identifier)
+    if entry is not None and entry[0] == actionState: return entry[1]
 
     for fCurve in getAllFCurves(object):
         if fCurve.data_path == dataPath:
-            cache[identifier] = fCurve
+            cache[identifier] = (actionState, fCurve)
             return fCurve
 
+def getActionState(object):
+    try: action = object.animation_data.action
+    except: return None
+    if action is None: return None
+    return (action.as_pointer(), len(action.fcurves))
+
 
 
 # get fcurves
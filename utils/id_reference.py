@@ -1,9 +1,24 @@
 import bpy
+from . handlers import eventHandler
+
+'''
+Object sockets only store the name of the object. To find it again after
+it has been renamed, the hash of every referenced object is remembered.
+
+The hash -> name index avoids searching through all objects after every
+rename. It only stores names, the objects themselves are always taken
+from bpy.data, so that removed objects are never accessed.
+'''
 
 hashByObjectName = {}
+objectNameByHash = {}
+
+_indexIsUpToDate = False
 
 def updateObjectReference(object):
-    hashByObjectName[object.name] = hash(object)
+    objectHash = hash(object)
+    hashByObjectName[object.name] = objectHash
+    objectNameByHash[objectHash] = object.name
 
 def tryToFindObjectReference(name):
     object = bpy.data.objects.get(name)
@@ -14,9 +29,40 @@ def tryToFindObjectReference(name):
     savedHash = hashByObjectName.get(name, None)
     if savedHash is None: return None
 
-    for object in bpy.data.objects:
-        if hash(object) == savedHash:
-            updateObjectReference(object)
-            return object
+    object = getObjectFromIndex(savedHash)
+    if object is None:
+        if _indexIsUpToDate: return None
+        rebuildIndex()
+        object = getObjectFromIndex(savedHash)
+        if object is None:
+            # the object has been removed, don't search for it again
+            del hashByObjectName[name]
+            return None
+
+    updateObjectReference(object)
+    return object
 
+def getObjectFromIndex(objectHash):
+    object = bpy.data.objects.get(objectNameByHash.get(objectHash, ""))
+    if object is not None and hash(object) == objectHash:
+        return object
     return None
+
+def rebuildIndex():
+    global _indexIsUpToDate
+    objectNameByHash.clear()
+    for object in bpy.data.objects:
+        objectNameByHash[hash(object)] = object.name
+    _indexIsUpToDate = True
+
+@eventHandler("SCENE_UPDATE_POST")
+def invalidateIndex(scene):
+    # objects might have been renamed or removed
+    global _indexIsUpToDate
+    _indexIsUpToDate = False
+
+@eventHandler("FILE_LOAD_POST")
+def clearIndex():
+    global _indexIsUpToDate
+    objectNameByHash.clear()
+    _indexIsUpToDate = False
@@ -9,17 +9,35 @@ def invokeTranslation():
 
 def idToSocket(socketID):
     node = bpy.data.node_groups[socketID[0][0]].nodes[socketID[0][1]]
-    identifier = socketID[2]
-    sockets = node.outputs if socketID[1] else node.inputs
+    return findSocket(node, socketID)
+
+def findSocket(node, socketID):
+    from .. tree_info import getSocketIndex
+    return findSocketWithIndex(node, socketID[1], socketID[2], getSocketIndex(socketID))
+
+def findSocketWithIndex(node, isOutput, identifier, index):
+    sockets = node.outputs if isOutput else node.inputs
+
+    # the index from the tree info is only a hint when the node changed
+    if index is not None and index < len(sockets):
+        socket = sockets[index]
+        if socket.identifier == identifier: return socket
+
     for socket in sockets:
         if socket.identifier == identifier: return socket
 
 def idToNode(nodeID):
     return bpy.data.node_groups[nodeID[0]].nodes[nodeID[1]]
 
-def createNodeByIdDict():
+def tryToGetNode(nodeID):
+    nodeTree = bpy.data.node_groups.get(nodeID[0])
+    if nodeTree is None: return None
+    return nodeTree.nodes.get(nodeID[1])
+
+def createNodeByIdDict(nodeTrees = None):
+    if nodeTrees is None: nodeTrees = getAnimationNodeTrees()
     nodeByID = dict()
-    for tree in getAnimationNodeTrees():
+    for tree in nodeTrees:
         treeName = tree.name
         for node in tree.nodes:
             nodeByID[(treeName, node.name)] = node
@@ -27,9 +45,7 @@ def createNodeByIdDict():
 
 def getSocket(treeName, nodeName, isOutput, identifier):
     node = bpy.data.node_groups[treeName].nodes[nodeName]
-    sockets = node.outputs if isOutput else node.inputs
-    for socket in sockets:
-        if socket.identifier == identifier: return socket
+    return findSocket(node, ((treeName, nodeName), isOutput, identifier))
 
 def getNode(treeName, nodeName):
     return bpy.data.node_groups[treeName].nodes[nodeName]